@@ -0,0 +1,22 @@
+"""Index issue events for the global change feed.
+
+Revision ID: 002_issue_events_feed_index
+Revises: 001_initial_schema
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = "002_issue_events_feed_index"
+down_revision = "001_initial_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_issue_events_event_type_id", "issue_events", ["event_type", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issue_events_event_type_id", table_name="issue_events")
@@ -0,0 +1,27 @@
+"""External ids and import hashes on issues for CSV upserts.
+
+Revision ID: 004_issue_external_ids
+Revises: 003_idempotency_keys
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "004_issue_external_ids"
+down_revision = "003_idempotency_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("issues", sa.Column("external_id", sa.String(length=255), nullable=True))
+    op.add_column("issues", sa.Column("import_hash", sa.String(length=64), nullable=True))
+    op.create_unique_constraint("uq_issues_external_id", "issues", ["external_id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_issues_external_id", "issues", type_="unique")
+    op.drop_column("issues", "import_hash")
+    op.drop_column("issues", "external_id")
@@ -0,0 +1,78 @@
+"""Archive tables for long-closed issues and their comments, labels and events.
+
+Revision ID: 005_issue_archive
+Revises: 004_issue_external_ids
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "005_issue_archive"
+down_revision = "004_issue_external_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    issue_status = postgresql.ENUM(name="issue_status", create_type=False)
+    op.create_table(
+        "archived_issues",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", issue_status, nullable=False),
+        sa.Column("assignee_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("external_id", sa.String(length=255), nullable=True),
+        sa.Column("import_hash", sa.String(length=64), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_archived_issues_assignee_id", "archived_issues", ["assignee_id"])
+    op.create_index("ix_archived_issues_created_at", "archived_issues", ["created_at"])
+    op.create_index("ix_archived_issues_external_id", "archived_issues", ["external_id"])
+
+    op.create_table(
+        "archived_comments",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column(
+            "issue_id", sa.Integer(), sa.ForeignKey("archived_issues.id", ondelete="CASCADE"), nullable=False
+        ),
+        sa.Column("author_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_archived_comments_issue_id", "archived_comments", ["issue_id"])
+
+    op.create_table(
+        "archived_issue_labels",
+        sa.Column(
+            "issue_id", sa.Integer(), sa.ForeignKey("archived_issues.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("label_id", sa.Integer(), sa.ForeignKey("labels.id", ondelete="CASCADE"), primary_key=True),
+    )
+    op.create_index("ix_archived_issue_labels_label_id", "archived_issue_labels", ["label_id"])
+
+    op.create_table(
+        "archived_issue_events",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column(
+            "issue_id", sa.Integer(), sa.ForeignKey("archived_issues.id", ondelete="CASCADE"), nullable=False
+        ),
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_archived_issue_events_issue_id", "archived_issue_events", ["issue_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("archived_issue_events")
+    op.drop_table("archived_issue_labels")
+    op.drop_table("archived_comments")
+    op.drop_table("archived_issues")
@@ -0,0 +1,55 @@
+"""Denormalized label id and name arrays on issues, backfilled from issue_labels, with GIN indexes.
+
+Revision ID: 006_issue_label_arrays
+Revises: 005_issue_archive
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "006_issue_label_arrays"
+down_revision = "005_issue_archive"
+branch_labels = None
+depends_on = None
+
+
+_BACKFILL = """
+UPDATE {table} AS issue
+SET label_ids = agg.label_ids, label_names = agg.label_names
+FROM (
+    SELECT link.issue_id,
+           array_agg(labels.id ORDER BY labels.name) AS label_ids,
+           array_agg(labels.name ORDER BY labels.name) AS label_names
+    FROM {link} AS link
+    JOIN labels ON labels.id = link.label_id
+    GROUP BY link.issue_id
+) AS agg
+WHERE agg.issue_id = issue.id
+"""
+
+
+def upgrade() -> None:
+    for table, link in (("issues", "issue_labels"), ("archived_issues", "archived_issue_labels")):
+        # Constant defaults make these metadata-only changes; only the backfill rewrites rows.
+        op.add_column(
+            table,
+            sa.Column("label_ids", postgresql.ARRAY(sa.Integer()), server_default="{}", nullable=False),
+        )
+        op.add_column(
+            table,
+            sa.Column("label_names", postgresql.ARRAY(sa.Text()), server_default="{}", nullable=False),
+        )
+        op.execute(_BACKFILL.format(table=table, link=link))
+        # Fresh statistics, or the planner assumes the new arrays are empty and picks the GIN scan for every label.
+        op.execute(f"ANALYZE {table}")
+        op.create_index(f"ix_{table}_label_names", table, ["label_names"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    for table in ("archived_issues", "issues"):
+        op.drop_index(f"ix_{table}_label_names", table_name=table)
+        op.drop_column(table, "label_names")
+        op.drop_column(table, "label_ids")
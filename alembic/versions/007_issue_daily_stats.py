@@ -0,0 +1,33 @@
+"""Daily per-status rollups for the throughput and backlog reports.
+
+Revision ID: 007_issue_daily_stats
+Revises: 006_issue_label_arrays
+Create Date: 2026-10-19 17:00:00.000000
+
+Populate the new table with ``python -m app.services.rollups`` after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "007_issue_daily_stats"
+down_revision = "006_issue_label_arrays"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_daily_stats",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("status", postgresql.ENUM(name="issue_status", create_type=False), primary_key=True),
+        sa.Column("shard", sa.SmallInteger(), primary_key=True),
+        sa.Column("created", sa.Integer(), nullable=False),
+        sa.Column("resolved", sa.Integer(), nullable=False),
+        sa.Column("net_change", sa.Integer(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("issue_daily_stats")
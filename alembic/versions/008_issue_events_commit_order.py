@@ -0,0 +1,34 @@
+"""Record the writing transaction on issue events so the change feed can follow commit order.
+
+Revision ID: 008_issue_events_commit_order
+Revises: 007_issue_daily_stats
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "008_issue_events_commit_order"
+down_revision = "007_issue_daily_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ("issue_events", "archived_issue_events"):
+        # A constant default keeps the add metadata-only; existing rows are all committed, so 0 orders them first.
+        op.add_column(table, sa.Column("txid", sa.BigInteger(), server_default="0", nullable=False))
+    op.alter_column("issue_events", "txid", server_default=sa.text("pg_current_xact_id()::text::bigint"))
+    op.alter_column("archived_issue_events", "txid", server_default=None)
+    op.drop_index("ix_issue_events_event_type_id", table_name="issue_events")
+    op.create_index("ix_issue_events_txid_id", "issue_events", ["txid", "id"])
+    op.create_index("ix_issue_events_event_type_txid_id", "issue_events", ["event_type", "txid", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issue_events_event_type_txid_id", table_name="issue_events")
+    op.drop_index("ix_issue_events_txid_id", table_name="issue_events")
+    op.create_index("ix_issue_events_event_type_id", "issue_events", ["event_type", "id"])
+    for table in ("archived_issue_events", "issue_events"):
+        op.drop_column(table, "txid")
@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import get_settings
+from app.errors import error_response
+from app.observability.metrics import ADMISSION_ACTIVE, ADMISSION_REJECTED
+
+
+READS = "reads"
+WRITES = "writes"
+BULK = "bulk"
+REPORTS = "reports"
+
+# Long-lived or diagnostic endpoints that must stay reachable when the API is saturated.
+_EXEMPT_PREFIXES = (
+    "/metrics",
+    "/admin/slow-queries",
+    "/admin/profiles",
+    "/events/stream",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+)
+# Batch jobs share the bulk limit, including the admin ones.
+_BULK_PATHS = ("/issues/import", "/issues/export", "/issues/bulk-", "/admin/archive")
+_REPORT_PATHS = ("/reports/", "/issues/facets")
+# Read-only endpoints that take their arguments in a POST body.
+_READ_POSTS = ("/issues/batch-get",)
+
+
+def route_class(method: str, path: str) -> str | None:
+    """Admission class for a request, decided from the raw path since routing has not run yet."""
+    if path.startswith(_EXEMPT_PREFIXES):
+        return None
+    if path.startswith(_BULK_PATHS):
+        return BULK
+    if path.startswith(_REPORT_PATHS):
+        return REPORTS
+    if method in ("GET", "HEAD") or path in _READ_POSTS:
+        return READS
+    return WRITES
+
+
+class _Gate:
+    """Concurrency limit with a bounded queue of waiters in front of it."""
+
+    def __init__(self, limit: int, queue_size: int) -> None:
+        self.semaphore = asyncio.Semaphore(limit)
+        self.queue_size = queue_size
+        self.waiting = 0
+
+    async def acquire(self, timeout: float) -> bool:
+        if self.semaphore.locked():
+            if self.waiting >= self.queue_size:
+                return False
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self.semaphore.acquire(), timeout)
+            except TimeoutError:
+                return False
+            finally:
+                self.waiting -= 1
+            return True
+        await self.semaphore.acquire()
+        return True
+
+    def release(self) -> None:
+        self.semaphore.release()
+
+
+class AdmissionMiddleware:
+    """Per-class concurrency limits that shed load with a fast 503 instead of queueing on the DB pool.
+
+    Keep the sum of the class limits within the pool size plus overflow: then no class can take
+    the connections another class needs, and bulk work cannot starve ``GET /issues/{id}``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._gates: dict[str, _Gate] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _gate(self, name: str) -> _Gate:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # asyncio primitives belong to one loop; a new loop (e.g. a fresh test client) gets fresh gates.
+            self._loop = loop
+            self._gates = {}
+        gate = self._gates.get(name)
+        if gate is None:
+            settings = get_settings()
+            limit = getattr(settings, f"admission_{name}_limit")
+            queue_size = getattr(settings, f"admission_{name}_queue")
+            gate = self._gates[name] = _Gate(limit, queue_size)
+        return gate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        settings = get_settings()
+        name = route_class(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if name is None or not settings.admission_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        gate = self._gate(name)
+        if not await gate.acquire(settings.admission_queue_timeout_ms / 1000):
+            ADMISSION_REJECTED.labels(name).inc()
+            await self._reject(send, name, settings.admission_retry_after_seconds)
+            return
+        ADMISSION_ACTIVE.labels(name).inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            ADMISSION_ACTIVE.labels(name).dec()
+            gate.release()
+
+    @staticmethod
+    async def _reject(send: Send, name: str, retry_after: int) -> None:
+        body = json.dumps(
+            error_response("OVERLOADED", f"Too many concurrent {name} requests, retry later", {"route_class": name})
+        ).encode("utf-8")
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(retry_after).encode()),
+        ]
+        await send({"type": "http.response.start", "status": 503, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
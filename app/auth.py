@@ -0,0 +1,21 @@
+import secrets
+
+from fastapi import Header
+
+from app.config import get_settings
+from app.errors import forbidden
+
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def is_admin_token(token: str | None) -> bool:
+    expected = get_settings().admin_token
+    if not expected or token is None:
+        return False
+    return secrets.compare_digest(token.encode(), expected.encode())
+
+
+def require_admin(token: str | None = Header(None, alias=ADMIN_TOKEN_HEADER)) -> None:
+    if not is_admin_token(token):
+        raise forbidden("ADMIN_TOKEN_REQUIRED", f"A valid {ADMIN_TOKEN_HEADER} header is required")
@@ -5,6 +5,49 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     database_url: str
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 5
+    # Per-transaction budgets in ms, applied with SET LOCAL; 0 disables a timeout.
+    statement_timeout_ms: int = 5000
+    lock_timeout_ms: int = 2000
+    reports_statement_timeout_ms: int = 30_000
+    bulk_statement_timeout_ms: int = 120_000
+    bulk_lock_timeout_ms: int = 10_000
+    import_statement_timeout_ms: int = 600_000
+    idempotency_ttl_seconds: int = 86400
+    facets_cache_ttl_seconds: float = 0
+    query_count_warn_threshold: int = 50
+    slow_query_threshold_ms: float = 500
+    slow_query_explain_sample_rate: float = 0.1
+    slow_query_explain_timeout_ms: int = 10000
+    slow_query_log_size: int = 200
+    admin_token: str | None = None
+    profile_sample_rate: float = 0
+    profile_interval_ms: float = 5
+    profile_store_size: int = 50
+    # Keep the sum of the class limits within db_pool_size + db_max_overflow.
+    admission_enabled: bool = True
+    admission_reads_limit: int = 10
+    admission_reads_queue: int = 100
+    admission_writes_limit: int = 6
+    admission_writes_queue: int = 50
+    admission_bulk_limit: int = 2
+    admission_bulk_queue: int = 2
+    admission_reports_limit: int = 2
+    admission_reports_queue: int = 4
+    admission_queue_timeout_ms: float = 2000
+    admission_retry_after_seconds: int = 1
+    loop_lag_warn_ms: float = 200
+    loop_lag_interval_ms: float = 50
+    user_cache_ttl_seconds: float = 60
+    user_cache_size: int = 10_000
+    archive_after_days: int = 90
+    archive_batch_size: int = 500
+    csv_import_workers: int = 0
+    csv_import_parallel_min_size: int = 16 * 1024 * 1024
+    csv_import_chunk_size: int = 4 * 1024 * 1024
+    csv_import_batch_size: int = 1000
 
     model_config = SettingsConfigDict(env_file=".env", env_prefix="", extra="ignore")
 
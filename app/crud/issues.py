@@ -1,10 +1,10 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, delete, false, func, select, true, union_all
 from sqlalchemy.orm import Session, selectinload
 
 from app.enums import IssueStatus
-from app.models import Issue, Label, User, issue_labels
+from app.models import ArchivedIssue, Issue, User
 
 
 def _utcnow() -> datetime:
@@ -43,11 +43,49 @@ def get_issue(db: Session, issue_id: int) -> Issue | None:
     stmt = (
         select(Issue)
         .where(Issue.id == issue_id)
-        .options(selectinload(Issue.labels), selectinload(Issue.comments))
+        .options(selectinload(Issue.comments))
     )
     return db.scalar(stmt)
 
 
+def get_archived_issue(db: Session, issue_id: int) -> ArchivedIssue | None:
+    stmt = (
+        select(ArchivedIssue)
+        .where(ArchivedIssue.id == issue_id)
+        .options(selectinload(ArchivedIssue.comments))
+    )
+    return db.scalar(stmt)
+
+
+def apply_issue_filters(
+    stmt: Select,
+    status: IssueStatus | None,
+    assignee_id: int | None,
+    label: str | None,
+    *,
+    labels: list[str] | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    model: type[Issue] | type[ArchivedIssue] = Issue,
+) -> Select:
+    """Filter ``stmt`` over ``model``; pass ``ArchivedIssue`` to filter the archive."""
+    if status:
+        stmt = stmt.where(model.status == status)
+    if assignee_id is not None:
+        stmt = stmt.where(model.assignee_id == assignee_id)
+    # Array containment on label_names is answered by its GIN index, without joining issue_labels.
+    if label:
+        stmt = stmt.where(model.label_names.contains([label]))
+    if labels:
+        # Issues carrying every one of the requested labels.
+        stmt = stmt.where(model.label_names.contains(sorted(set(labels))))
+    if created_from is not None:
+        stmt = stmt.where(model.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(model.created_at < created_to)
+    return stmt
+
+
 def list_issues(
     db: Session,
     status: IssueStatus | None,
@@ -57,17 +95,12 @@ def list_issues(
     offset: int,
     sort: str,
     order: str,
-) -> tuple[list[Issue], int]:
-    stmt = select(Issue).options(selectinload(Issue.labels))
-    if status:
-        stmt = stmt.where(Issue.status == status)
-    if assignee_id is not None:
-        stmt = stmt.where(Issue.assignee_id == assignee_id)
-    if label:
-        stmt = stmt.join(issue_labels).join(Label).where(Label.name == label).distinct(Issue.id)
-
-    count_subq = stmt.with_only_columns(Issue.id).subquery()
-    total_stmt = select(func.count(func.distinct(count_subq.c.id)))
+    include_archived: bool = False,
+) -> tuple[list[Issue | ArchivedIssue], int]:
+    if include_archived and status in (None, IssueStatus.closed):
+        return _list_with_archive(db, status, assignee_id, label, limit, offset, order)
+    stmt = apply_issue_filters(select(Issue), status, assignee_id, label)
+    total_stmt = stmt.with_only_columns(func.count(), maintain_column_froms=True)
 
     sort_col = Issue.created_at if sort == "created_at" else Issue.created_at
     if order == "asc":
@@ -81,6 +114,40 @@ def list_issues(
     return items, total
 
 
+def _list_with_archive(
+    db: Session,
+    status: IssueStatus | None,
+    assignee_id: int | None,
+    label: str | None,
+    limit: int,
+    offset: int,
+    order: str,
+) -> tuple[list[Issue | ArchivedIssue], int]:
+    # Page over the ids of both tables first, then load the page's rows from wherever they live.
+    hot = apply_issue_filters(
+        select(Issue.id, Issue.created_at, false().label("archived")), status, assignee_id, label
+    )
+    cold = apply_issue_filters(
+        select(ArchivedIssue.id, ArchivedIssue.created_at, true().label("archived")),
+        status,
+        assignee_id,
+        label,
+        model=ArchivedIssue,
+    )
+    both = union_all(hot, cold).subquery()
+    sort_col = both.c.created_at.asc() if order == "asc" else both.c.created_at.desc()
+    page = db.execute(select(both.c.id, both.c.archived).order_by(sort_col).limit(limit).offset(offset)).all()
+    total = db.scalar(select(func.count()).select_from(both)) or 0
+
+    loaded: dict[tuple[int, bool], Issue | ArchivedIssue] = {}
+    for model, archived in ((Issue, False), (ArchivedIssue, True)):
+        ids = [row.id for row in page if row.archived is archived]
+        if ids:
+            rows = db.scalars(select(model).where(model.id.in_(ids)))
+            loaded.update(((row.id, archived), row) for row in rows)
+    return [loaded[(row.id, row.archived)] for row in page], total
+
+
 def update_issue(
     db: Session,
     issue: Issue,
@@ -110,3 +177,14 @@ def get_assignee(db: Session, assignee_id: int | None) -> User | None:
     if assignee_id is None:
         return None
     return db.get(User, assignee_id)
+
+
+def delete_issues(db: Session, issue_ids: list[int] | Select) -> list[tuple[int, IssueStatus]]:
+    """Delete issues by id and return ``(id, status)`` of each; comments, events and labels go by ON DELETE CASCADE."""
+    stmt = delete(Issue).where(Issue.id.in_(issue_ids)).returning(Issue.id, Issue.status)
+    return list(db.execute(stmt, execution_options={"synchronize_session": False}).tuples())
+
+
+def delete_archived_issue(db: Session, issue_id: int) -> list[tuple[int, IssueStatus]]:
+    stmt = delete(ArchivedIssue).where(ArchivedIssue.id == issue_id).returning(ArchivedIssue.id, ArchivedIssue.status)
+    return list(db.execute(stmt, execution_options={"synchronize_session": False}).tuples())
@@ -1,7 +1,8 @@
-from sqlalchemy import select
+from sqlalchemy import ScalarSelect, Select, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.orm import Session
 
-from app.models import Label
+from app.models import Issue, Label, issue_labels
 
 
 def get_labels_by_names(db: Session, names: list[str]) -> list[Label]:
@@ -11,17 +12,50 @@ def get_labels_by_names(db: Session, names: list[str]) -> list[Label]:
 
 
 def get_or_create_labels(db: Session, names: list[str]) -> list[Label]:
+    """Labels for ``names`` in the given order, creating the missing ones.
+
+    The insert skips names that already exist, including ones a concurrent request creates first,
+    so two requests introducing the same label both succeed. Names are inserted in sorted order to
+    keep concurrent inserts of overlapping sets from deadlocking.
+    """
     if not names:
         return []
-    existing = get_labels_by_names(db, names)
-    existing_by_name = {label.name: label for label in existing}
-    created: list[Label] = []
-    for name in names:
-        if name in existing_by_name:
-            continue
-        label = Label(name=name)
-        db.add(label)
-        created.append(label)
-        existing_by_name[name] = label
+    db.execute(
+        insert(Label)
+        .values([{"name": name} for name in sorted(set(names))])
+        .on_conflict_do_nothing(index_elements=[Label.name])
+    )
+    labels_by_name = {label.name: label for label in get_labels_by_names(db, names)}
+    return [labels_by_name[name] for name in names]
+
+
+def label_arrays(labels: list[Label]) -> tuple[list[int], list[str]]:
+    """``(label_ids, label_names)`` for an issue carrying ``labels``, in the canonical name order."""
+    ordered = sorted(labels, key=lambda label: label.name)
+    return [label.id for label in ordered], [label.name for label in ordered]
+
+
+def set_issue_labels(issue: Issue, labels: list[Label]) -> None:
+    issue.labels = labels
+    issue.label_ids, issue.label_names = label_arrays(labels)
+
+
+def _label_array(column) -> ScalarSelect:
+    return (
+        select(func.coalesce(func.array_agg(aggregate_order_by(column, Label.name)), literal_column("'{}'")))
+        .select_from(issue_labels)
+        .join(Label, Label.id == issue_labels.c.label_id)
+        .where(issue_labels.c.issue_id == Issue.id)
+        .scalar_subquery()
+    )
+
+
+def sync_label_arrays(db: Session, issue_ids: list[int] | Select) -> None:
+    """Recompute the label arrays of ``issue_ids`` from issue_labels after set-based label changes."""
     db.flush()
-    return [existing_by_name[name] for name in names]
+    db.execute(
+        update(Issue)
+        .where(Issue.id.in_(issue_ids))
+        .values(label_ids=_label_array(Label.id), label_names=_label_array(Label.name)),
+        execution_options={"synchronize_session": False},
+    )
@@ -1,9 +1,59 @@
+from dataclasses import dataclass
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.cache import TTLCache
+from app.config import get_settings
 from app.models import User
 
 
+@dataclass(frozen=True)
+class CachedUser:
+    """Detached snapshot of a user row, safe to share between sessions and threads."""
+
+    id: int
+    name: str
+    email: str
+
+
+# Only users that exist are cached, so a lookup miss always reaches the database.
+_settings = get_settings()
+_users_by_id = TTLCache(maxsize=_settings.user_cache_size, ttl=_settings.user_cache_ttl_seconds)
+_user_ids_by_email = TTLCache(maxsize=_settings.user_cache_size, ttl=_settings.user_cache_ttl_seconds)
+_LOOKUP_BATCH_SIZE = 10_000
+
+
+def _load(db: Session, column, values: list) -> list[User]:
+    # Batched so very large lookups (CSV imports) stay under the bind parameter limit.
+    users: list[User] = []
+    for start in range(0, len(values), _LOOKUP_BATCH_SIZE):
+        users.extend(db.scalars(select(User).where(column.in_(values[start : start + _LOOKUP_BATCH_SIZE]))))
+    return users
+
+
+def _remember(users: list[User]) -> dict[int, CachedUser]:
+    cached = {}
+    for user in users:
+        entry = CachedUser(user.id, user.name, user.email)
+        _users_by_id.set(user.id, entry)
+        _user_ids_by_email.set(user.email, user.id)
+        cached[user.id] = entry
+    return cached
+
+
+def invalidate_user(user_id: int | None = None, email: str | None = None) -> None:
+    if user_id is not None:
+        _users_by_id.pop(user_id)
+    if email is not None:
+        _user_ids_by_email.pop(email)
+
+
+def clear_user_cache() -> None:
+    _users_by_id.clear()
+    _user_ids_by_email.clear()
+
+
 def get_user(db: Session, user_id: int) -> User | None:
     return db.get(User, user_id)
 
@@ -12,8 +62,45 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     return db.scalar(select(User).where(User.email == email))
 
 
+def get_users_by_ids(db: Session, user_ids: list[int]) -> dict[int, CachedUser]:
+    """Existing users among ``user_ids``, from the cache or one query for the misses."""
+    found: dict[int, CachedUser] = {}
+    missing: list[int] = []
+    for user_id in dict.fromkeys(user_ids):
+        cached = _users_by_id.get(user_id)
+        if cached is None:
+            missing.append(user_id)
+        else:
+            found[user_id] = cached
+    if missing:
+        found.update(_remember(_load(db, User.id, missing)))
+    return found
+
+
+def get_users_by_emails(db: Session, emails: list[str]) -> dict[str, CachedUser]:
+    """Existing users among ``emails``, keyed by email, from the cache or one query for the misses."""
+    found: dict[str, CachedUser] = {}
+    missing: list[str] = []
+    for email in dict.fromkeys(emails):
+        user_id = _user_ids_by_email.get(email)
+        cached = _users_by_id.get(user_id) if user_id is not None else None
+        if cached is None or cached.email != email:
+            missing.append(email)
+        else:
+            found[email] = cached
+    if missing:
+        loaded = _remember(_load(db, User.email, missing))
+        found.update((user.email, user) for user in loaded.values())
+    return found
+
+
+def user_exists(db: Session, user_id: int) -> bool:
+    return user_id in get_users_by_ids(db, [user_id])
+
+
 def create_user(db: Session, name: str, email: str) -> User:
     user = User(name=name, email=email)
     db.add(user)
     db.flush()
+    invalidate_user(user.id, email)
     return user
@@ -1,23 +1,70 @@
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Request
+from sqlalchemy import Connection, create_engine, event, text
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
 
+from app.admission import BULK, REPORTS, route_class
 from app.config import get_settings
+from app.observability.sql_timing import measure_pool_wait
 
 
 def _make_engine():
     settings = get_settings()
-    return create_engine(settings.database_url, pool_pre_ping=True)
+    return create_engine(
+        settings.database_url,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+    )
 
 
 engine = _make_engine()
 SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
 
 
-def get_db() -> Generator[Session, None, None]:
+_SET_TIMEOUTS = text(
+    "SELECT set_config('statement_timeout', :statement, true), set_config('lock_timeout', :lock, true)"
+)
+
+
+def request_timeouts(request: Request) -> tuple[int, int]:
+    """``(statement_timeout, lock_timeout)`` in ms for a request; imports and bulk work get longer budgets."""
+    settings = get_settings()
+    name = route_class(request.method, request.url.path)
+    if request.url.path == "/issues/import":
+        return settings.import_statement_timeout_ms, settings.bulk_lock_timeout_ms
+    if name == BULK:
+        return settings.bulk_statement_timeout_ms, settings.bulk_lock_timeout_ms
+    if name == REPORTS:
+        return settings.reports_statement_timeout_ms, settings.lock_timeout_ms
+    return settings.statement_timeout_ms, settings.lock_timeout_ms
+
+
+def set_timeouts(db: Session, statement_timeout_ms: int, lock_timeout_ms: int) -> None:
+    """Apply timeouts to every transaction ``db`` begins from now on, including after a commit."""
+    db.info["timeouts"] = (statement_timeout_ms, lock_timeout_ms)
+    if db.in_transaction():
+        _apply_timeouts(db, db.get_transaction(), db.connection())
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_timeouts(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+    timeouts = session.info.get("timeouts")
+    if timeouts is not None:
+        # SET LOCAL semantics: the values end with the transaction and never leak to the next pool user.
+        statement, lock = timeouts
+        connection.execute(_SET_TIMEOUTS, {"statement": f"{statement}ms", "lock": f"{lock}ms"})
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
+        set_timeouts(db, *request_timeouts(request))
+        # Check out the connection up front so time spent waiting on the pool is measured.
+        with measure_pool_wait():
+            db.connection()
         yield db
     finally:
         db.close()
@@ -24,3 +24,7 @@ def conflict(code: str, message: str, details: dict[str, Any] | None = None) ->
 
 def bad_request(code: str, message: str, details: dict[str, Any] | None = None) -> HTTPException:
     return http_error(code, message, status.HTTP_400_BAD_REQUEST, details)
+
+
+def forbidden(code: str, message: str, details: dict[str, Any] | None = None) -> HTTPException:
+    return http_error(code, message, status.HTTP_403_FORBIDDEN, details)
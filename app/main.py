@@ -1,23 +1,56 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from psycopg import errors as pg_errors
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.admission import AdmissionMiddleware
+from app.config import get_settings
 from app.errors import error_response
+from app.observability.loop_lag import loop_lag_monitor
+from app.observability.metrics import MetricsMiddleware
+from app.observability.profiling import ProfilingMiddleware
+from app.observability.sql_timing import QueryStatsMiddleware
+from app.routes.admin import router as admin_router
+from app.routes.events import router as events_router
 from app.routes.issues import router as issues_router
+from app.routes.metrics import router as metrics_router
 from app.routes.reports import router as reports_router
+from app.services.event_stream import broadcaster
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    loop_lag_monitor.start()
+    yield
+    await loop_lag_monitor.stop()
+    broadcaster.stop()
 
 
-app = FastAPI(title="Issue Tracker API")
+app = FastAPI(title="Issue Tracker API", lifespan=lifespan)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(issues_router)
 app.include_router(reports_router)
+app.include_router(events_router)
+app.include_router(metrics_router)
+app.include_router(admin_router)
 
 
 @app.exception_handler(RequestValidationError)
 def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    details = {"errors": jsonable_encoder(exc.errors())}
     return JSONResponse(
         status_code=422,
-        content=error_response("VALIDATION_ERROR", "Request validation failed", {"errors": exc.errors()}),
+        content=error_response("VALIDATION_ERROR", "Request validation failed", details),
     )
 
 
@@ -28,3 +61,29 @@ def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSO
     else:
         content = error_response("HTTP_ERROR", str(exc.detail))
     return JSONResponse(status_code=exc.status_code, content=content)
+
+
+@app.exception_handler(PoolTimeoutError)
+def pool_timeout_handler(request: Request, exc: PoolTimeoutError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content=error_response("DB_POOL_EXHAUSTED", "No database connection available, retry later"),
+        headers={"Retry-After": str(get_settings().admission_retry_after_seconds)},
+    )
+
+
+@app.exception_handler(OperationalError)
+def query_cancelled_handler(request: Request, exc: OperationalError) -> JSONResponse:
+    retry_after = {"Retry-After": str(get_settings().admission_retry_after_seconds)}
+    if isinstance(exc.orig, pg_errors.LockNotAvailable):
+        return JSONResponse(
+            status_code=503,
+            content=error_response("LOCK_TIMEOUT", "Timed out waiting for a database lock, retry later"),
+            headers=retry_after,
+        )
+    if isinstance(exc.orig, pg_errors.QueryCanceled):
+        return JSONResponse(
+            status_code=504,
+            content=error_response("QUERY_TIMEOUT", "Query exceeded the time budget for this endpoint"),
+        )
+    raise exc
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 from sqlalchemy import (
+    BigInteger,
     CheckConstraint,
     Column,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Table,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from app.enums import IssueStatus
@@ -51,13 +56,18 @@ class User(Base):
     comments: Mapped[list[Comment]] = relationship(back_populates="author")
 
 
+issue_status_enum = Enum(
+    IssueStatus, name="issue_status", values_callable=lambda enum: [member.value for member in enum]
+)
+
+
 class Issue(Base):
     __tablename__ = "issues"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
-    status: Mapped[IssueStatus] = mapped_column(Enum(IssueStatus, name="issue_status"), nullable=False)
+    status: Mapped[IssueStatus] = mapped_column(issue_status_enum, nullable=False)
     assignee_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
@@ -65,24 +75,43 @@ class Issue(Base):
     )
     resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Key in the upstream system for CSV re-imports, and a hash of the last imported row content.
+    external_id: Mapped[str | None] = mapped_column(String(255))
+    import_hash: Mapped[str | None] = mapped_column(String(64))
+    # Denormalized copy of issue_labels, ordered by label name, so label filters (@>) and rendering
+    # need no join. issue_labels stays the source of truth; see crud.labels for the sync helpers.
+    label_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), default=list, server_default="{}", nullable=False)
+    label_names: Mapped[list[str]] = mapped_column(ARRAY(Text), default=list, server_default="{}", nullable=False)
 
     assignee: Mapped[User | None] = relationship(back_populates="issues")
-    comments: Mapped[list[Comment]] = relationship(back_populates="issue", cascade="all, delete-orphan")
+    # passive_deletes: the foreign keys cascade in the database, so deleting an issue through the ORM
+    # must not load its comments, events and label links just to delete them one by one.
+    comments: Mapped[list[Comment]] = relationship(
+        back_populates="issue", cascade="all, delete-orphan", passive_deletes=True
+    )
     labels: Mapped[list[Label]] = relationship(
         secondary=issue_labels,
         back_populates="issues",
+        passive_deletes=True,
     )
     events: Mapped[list[IssueEvent]] = relationship(
         back_populates="issue",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __table_args__ = (
         Index("ix_issues_status", "status"),
         Index("ix_issues_assignee_id", "assignee_id"),
         Index("ix_issues_created_at", "created_at"),
+        Index("ix_issues_label_names", "label_names", postgresql_using="gin"),
+        UniqueConstraint("external_id", name="uq_issues_external_id"),
     )
 
+    @property
+    def label_refs(self) -> list[dict]:
+        return [{"id": label_id, "name": name} for label_id, name in zip(self.label_ids, self.label_names)]
+
 
 class Comment(Base):
     __tablename__ = "comments"
@@ -127,5 +156,128 @@ class IssueEvent(Base):
     event_type: Mapped[str] = mapped_column(String(100), nullable=False)
     payload: Mapped[dict | None] = mapped_column(JSONB)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
+    # The writing transaction; ids are taken before commit, so they alone do not give commit order.
+    txid: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("pg_current_xact_id()::text::bigint"), nullable=False
+    )
 
     issue: Mapped[Issue] = relationship(back_populates="events")
+
+    __table_args__ = (
+        Index("ix_issue_events_txid_id", "txid", "id"),
+        Index("ix_issue_events_event_type_txid_id", "event_type", "txid", "id"),
+    )
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.txid}-{self.id}"
+
+
+# Cold storage for long-closed issues. The archive tables mirror the hot tables column for column
+# (rows keep their ids) so the archival job can copy them with INSERT ... SELECT.
+archived_issue_labels = Table(
+    "archived_issue_labels",
+    Base.metadata,
+    Column("issue_id", ForeignKey("archived_issues.id", ondelete="CASCADE"), primary_key=True),
+    Column("label_id", ForeignKey("labels.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_archived_issue_labels_label_id", "label_id"),
+)
+
+
+class ArchivedIssue(Base):
+    __tablename__ = "archived_issues"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    status: Mapped[IssueStatus] = mapped_column(issue_status_enum, nullable=False)
+    assignee_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    external_id: Mapped[str | None] = mapped_column(String(255))
+    import_hash: Mapped[str | None] = mapped_column(String(64))
+    label_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), server_default="{}", nullable=False)
+    label_names: Mapped[list[str]] = mapped_column(ARRAY(Text), server_default="{}", nullable=False)
+    # Filled in by the database, since the archival job copies rows with INSERT ... SELECT.
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    labels: Mapped[list[Label]] = relationship(secondary=archived_issue_labels, viewonly=True)
+    comments: Mapped[list[ArchivedComment]] = relationship(viewonly=True)
+    events: Mapped[list[ArchivedIssueEvent]] = relationship(viewonly=True)
+
+    __table_args__ = (
+        Index("ix_archived_issues_assignee_id", "assignee_id"),
+        Index("ix_archived_issues_created_at", "created_at"),
+        Index("ix_archived_issues_external_id", "external_id"),
+        Index("ix_archived_issues_label_names", "label_names", postgresql_using="gin"),
+    )
+
+    label_refs = Issue.label_refs
+
+
+class ArchivedComment(Base):
+    __tablename__ = "archived_comments"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    issue_id: Mapped[int] = mapped_column(ForeignKey("archived_issues.id", ondelete="CASCADE"), nullable=False)
+    author_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_archived_comments_issue_id", "issue_id"),
+    )
+
+
+class ArchivedIssueEvent(Base):
+    __tablename__ = "archived_issue_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    issue_id: Mapped[int] = mapped_column(ForeignKey("archived_issues.id", ondelete="CASCADE"), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict | None] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    txid: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    __table_args__ = (
+        Index("ix_archived_issue_events_issue_id", "issue_id"),
+    )
+
+    @property
+    def cursor(self) -> str:
+        return f"{self.txid}-{self.id}"
+
+
+class IssueDailyStats(Base):
+    """Per-day, per-status counters behind the throughput and backlog reports.
+
+    Writers add to one of several shards chosen at random, so concurrent transactions rarely wait
+    on the same row lock; readers sum the shards. ``net_change`` is issues entering the status
+    minus issues leaving it that day, so a running sum over days gives the backlog.
+    """
+
+    __tablename__ = "issue_daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[IssueStatus] = mapped_column(issue_status_enum, primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    resolved: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    net_change: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    response_body: Mapped[dict | list] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
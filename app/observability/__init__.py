@@ -0,0 +1 @@
+"""Request observability: SQL timing, metrics and profiling."""
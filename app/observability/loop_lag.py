@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+
+from app.config import get_settings
+from app.observability.metrics import LOOP_LAG, LOOP_STALLS
+
+
+logger = logging.getLogger("app.loop_lag")
+
+_STACK_DEPTH = 8
+
+
+def _frames(frame: FrameType | None) -> list[FrameType]:
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    return frames
+
+
+def _blocking_route(frames: list[FrameType]) -> str:
+    """Route of the innermost ASGI call on the stack; middleware frames hold the request scope."""
+    for frame in frames:
+        scope = frame.f_locals.get("scope")
+        if isinstance(scope, dict) and scope.get("type") == "http":
+            route = scope.get("route")
+            return getattr(route, "path", None) or scope.get("path", "unmatched")
+    return "unmatched"
+
+
+class LoopLagMonitor:
+    """Measures event loop lag and reports stalls longer than ``loop_lag_warn_ms``.
+
+    A heartbeat task on the loop records how late each wake-up is. A watchdog thread notices
+    when the heartbeat stops and captures the loop thread's stack while it is still blocked,
+    which is the only moment the offending route and code can be seen.
+    """
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread: int | None = None
+        self._beat = 0.0
+        self._reported_beat = 0.0
+        self._stall: dict | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        settings = get_settings()
+        if self.running or not settings.loop_lag_warn_ms:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        interval = settings.loop_lag_interval_ms / 1000
+        threshold = settings.loop_lag_warn_ms / 1000
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat(interval))
+        self._watchdog = threading.Thread(
+            target=self._watch, args=(interval, threshold), name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _heartbeat(self, interval: float) -> None:
+        while True:
+            expected = time.monotonic() + interval
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            LOOP_LAG.observe(lag)
+            self._beat = now
+            stall, self._stall = self._stall, None
+            if stall is not None:
+                blocked_ms = (now - stall["since"]) * 1000
+                logger.warning("event loop blocked for %.0fms by %s\n%s", blocked_ms, stall["route"], stall["stack"])
+
+    def _watch(self, interval: float, threshold: float) -> None:
+        while not self._stopped.wait(interval / 2):
+            beat = self._beat
+            if beat == self._reported_beat or time.monotonic() - beat < threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            frames = _frames(frame)
+            route = _blocking_route(frames)
+            stack = "".join(traceback.format_list(traceback.extract_stack(frame, limit=_STACK_DEPTH)))
+            LOOP_STALLS.labels(route).inc()
+            # Reported by the heartbeat once the loop runs again, together with the full stall time.
+            self._stall = {"route": route, "stack": stack, "since": beat}
+            self._reported_beat = beat
+
+
+loop_lag_monitor = LoopLagMonitor()
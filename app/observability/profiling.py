@@ -0,0 +1,163 @@
+import itertools
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import FrameType
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.auth import ADMIN_TOKEN_HEADER, is_admin_token
+from app.config import get_settings
+from app.observability.sql_timing import current_stats
+
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# A leaf frame in ``selectors`` means the event loop is idle, waiting for I/O.
+_IDLE_MODULE = "selectors"
+
+
+def _frame_label(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def _stack(frame: FrameType | None) -> list[FrameType]:
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+@dataclass
+class Profile:
+    id: int
+    method: str
+    route: str
+    started_at: datetime
+    status: int = 0
+    duration_ms: float = 0.0
+    db_ms: float = 0.0
+    queries: int = 0
+    samples: Counter = field(default_factory=Counter)
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def folded(self) -> str:
+        """Stacks in Brendan Gregg's folded format, accepted by flamegraph.pl and speedscope."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class _Sampler(threading.Thread):
+    """Samples the event loop thread and any worker thread currently inside the request's endpoint."""
+
+    def __init__(self, profile: Profile, scope: Scope, loop_thread: int, interval: float) -> None:
+        super().__init__(name=f"profiler-{profile.id}", daemon=True)
+        self.profile = profile
+        self.scope = scope
+        self.loop_thread = loop_thread
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            endpoint = getattr(self.scope.get("endpoint"), "__code__", None)
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.ident:
+                    continue
+                frames = _stack(frame)
+                if thread_id != self.loop_thread and not any(f.f_code is endpoint for f in frames):
+                    continue
+                if frames[-1].f_globals.get("__name__") == _IDLE_MODULE:
+                    continue
+                self.profile.samples[";".join(_frame_label(f) for f in frames)] += 1
+
+
+class ProfileStore:
+    def __init__(self, maxlen: int) -> None:
+        self._profiles: deque[Profile] = deque(maxlen=maxlen)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(self, method: str, route: str) -> Profile:
+        with self._lock:
+            profile_id = next(self._ids)
+        return Profile(id=profile_id, method=method, route=route, started_at=datetime.now(timezone.utc))
+
+    def add(self, profile: Profile) -> None:
+        """Store a finished profile; unfinished ones stay private to their sampler."""
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get(self, profile_id: int) -> Profile | None:
+        with self._lock:
+            return next((profile for profile in self._profiles if profile.id == profile_id), None)
+
+    def list(self) -> list[Profile]:
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+profile_store = ProfileStore(get_settings().profile_store_size)
+
+
+def _should_profile(scope: Scope) -> bool:
+    headers = Headers(scope=scope)
+    if headers.get(PROFILE_HEADER) == "1" and is_admin_token(headers.get(ADMIN_TOKEN_HEADER)):
+        return True
+    rate = get_settings().profile_sample_rate
+    return bool(rate) and random.random() < rate
+
+
+class ProfilingMiddleware:
+    """Wall-clock sampling profiler for requests sent with ``X-Profile: 1`` by an admin, or a sampled share.
+
+    Must sit inside ``QueryStatsMiddleware`` so the stored profile carries the request's DB time.
+    Samples from the event loop thread include other requests it interleaves with.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = profile_store.start(scope["method"], scope["path"])
+        interval = get_settings().profile_interval_ms / 1000
+        sampler = _Sampler(profile, scope, threading.get_ident(), interval)
+        started = time.perf_counter()
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                message.setdefault("headers", []).append((PROFILE_ID_HEADER.lower().encode(), str(profile.id).encode()))
+            await send(message)
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stopped.set()
+            sampler.join()
+            profile.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            profile.route = getattr(scope.get("route"), "path", None) or scope["path"]
+            stats = current_stats()
+            if stats is not None:
+                profile.db_ms = round(stats.db_seconds * 1000, 2)
+                profile.queries = stats.queries
+            profile_store.add(profile)
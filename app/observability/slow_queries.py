@@ -0,0 +1,141 @@
+import logging
+import random
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, URL
+from sqlalchemy.pool import NullPool
+
+from app.config import get_settings
+
+
+logger = logging.getLogger("app.slow_queries")
+
+# EXPLAIN ANALYZE executes the statement, so only plain reads are re-run. The probe also runs in a
+# read-only, rolled-back transaction; this filter just avoids queueing statements that would fail there.
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_UNSAFE = re.compile(r"\bFOR\s+(UPDATE|SHARE|NO\s+KEY\s+UPDATE|KEY\s+SHARE)\b|pg_advisory|pg_notify", re.IGNORECASE)
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return str(value)
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    parameters: Any
+    duration_ms: float
+    route: str | None
+    recorded_at: datetime
+    plan: str | None = None
+
+
+class SlowQueryLog:
+    """Bounded ring of statements slower than ``slow_query_threshold_ms``.
+
+    A sample of explainable entries is re-run with ``EXPLAIN (ANALYZE, BUFFERS)`` on a
+    dedicated connection by a single background worker, so capture never blocks the
+    request that issued the slow statement. At most one plan is pending at a time.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self._entries: deque[SlowQuery] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        self._pending: Future | None = None
+        self._engines: dict[str, Engine] = {}
+
+    def is_slow(self, elapsed: float) -> bool:
+        threshold = get_settings().slow_query_threshold_ms
+        return bool(threshold) and elapsed * 1000 >= threshold
+
+    def observe(self, url: URL, statement: str, parameters: Any, elapsed: float, route: str | None) -> None:
+        entry = SlowQuery(
+            statement=statement,
+            parameters=_jsonable(parameters),
+            duration_ms=round(elapsed * 1000, 2),
+            route=route,
+            recorded_at=datetime.now(timezone.utc),
+        )
+        with self._lock:
+            self._entries.append(entry)
+            explain = (
+                (self._pending is None or self._pending.done())
+                and random.random() < get_settings().slow_query_explain_sample_rate
+                and _EXPLAINABLE.match(statement) is not None
+                and _UNSAFE.search(statement) is None
+            )
+            if explain:
+                self._pending = self._executor.submit(self._explain, url, entry, parameters)
+        logger.warning("slow query %.1fms on %s: %s", entry.duration_ms, route, statement)
+
+    def _probe_engine(self, url: URL) -> Engine:
+        key = url.render_as_string(hide_password=False)
+        engine = self._engines.get(key)
+        if engine is None:
+            engine = self._engines[key] = create_engine(url, poolclass=NullPool)
+        return engine
+
+    def _explain(self, url: URL, entry: SlowQuery, parameters: Any) -> None:
+        timeout_ms = int(get_settings().slow_query_explain_timeout_ms)
+        try:
+            with self._probe_engine(url).connect() as conn:
+                conn.info["slow_query_probe"] = True
+                conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+                conn.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+                rows = conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {entry.statement}", parameters)
+                entry.plan = "\n".join(row[0] for row in rows)
+                conn.rollback()
+        except Exception as exc:
+            logger.info("could not explain slow query: %s", exc)
+
+    def wait_for_plans(self, timeout: float | None = None) -> None:
+        pending = self._pending
+        if pending is not None:
+            wait([pending], timeout=timeout)
+
+    def entries(self) -> list[SlowQuery]:
+        with self._lock:
+            return list(self._entries)
+
+    def top_offenders(self, limit: int) -> list[dict[str, Any]]:
+        grouped: dict[str, dict[str, Any]] = {}
+        for entry in self.entries():
+            group = grouped.setdefault(
+                entry.statement,
+                {"statement": entry.statement, "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "routes": [], "plan": None},
+            )
+            group["calls"] += 1
+            group["total_ms"] += entry.duration_ms
+            if entry.duration_ms >= group["max_ms"]:
+                group["max_ms"] = entry.duration_ms
+                group["slowest_parameters"] = entry.parameters
+            group["last_seen"] = entry.recorded_at
+            if entry.route and entry.route not in group["routes"]:
+                group["routes"].append(entry.route)
+            group["plan"] = entry.plan or group["plan"]
+        offenders = sorted(grouped.values(), key=lambda group: group["total_ms"], reverse=True)[:limit]
+        for group in offenders:
+            group["total_ms"] = round(group["total_ms"], 2)
+            group["mean_ms"] = round(group["total_ms"] / group["calls"], 2)
+        return offenders
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(get_settings().slow_query_log_size)
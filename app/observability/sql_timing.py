@@ -0,0 +1,122 @@
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.observability.metrics import POOL_WAIT
+from app.observability.slow_queries import slow_query_log
+
+
+logger = logging.getLogger("app.requests")
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    scope: Scope | None = field(default=None, repr=False)
+
+    @property
+    def route(self) -> str | None:
+        return _route_path(self.scope) if self.scope is not None else None
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _current_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info["query_started"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info.pop("query_started")
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+    if not executemany and slow_query_log.is_slow(elapsed) and not conn.info.get("slow_query_probe"):
+        slow_query_log.observe(conn.engine.url, statement, parameters, elapsed, stats.route if stats else None)
+
+
+@contextmanager
+def measure_pool_wait() -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        POOL_WAIT.observe(elapsed)
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.pool_wait_seconds += elapsed
+
+
+def _route_path(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope["path"]
+
+
+class QueryStatsMiddleware:
+    """Counts SQL statements and DB time per request; reports them via Server-Timing and logs."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope=scope)
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+                    f"pool;dur={stats.pool_wait_seconds * 1000:.1f}, app;dur={total_ms:.1f}"
+                )
+                message.setdefault("headers", []).append((b"server-timing", timing.encode("latin-1")))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            self._log(scope, status_code, stats, time.perf_counter() - started)
+
+    def _log(self, scope: Scope, status_code: int, stats: RequestStats, elapsed: float) -> None:
+        record = {
+            "method": scope["method"],
+            "route": _route_path(scope),
+            "status": status_code,
+            "duration_ms": round(elapsed * 1000, 2),
+            "queries": stats.queries,
+            "db_ms": round(stats.db_seconds * 1000, 2),
+            "pool_wait_ms": round(stats.pool_wait_seconds * 1000, 2),
+        }
+        threshold = get_settings().query_count_warn_threshold
+        if threshold and stats.queries > threshold:
+            logger.warning("query count over threshold %s", json.dumps({**record, "threshold": threshold}))
+        else:
+            logger.info("%s", json.dumps(record))
@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.auth import require_admin
+from app.config import get_settings
+from app.db import get_db
+from app.errors import not_found
+from app.observability.profiling import profile_store
+from app.observability.slow_queries import slow_query_log
+from app.schemas import ArchiveResult, ProfileSummary, SlowQueryReport
+from app.services.archival import archive_closed_issues
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/slow-queries", response_model=SlowQueryReport)
+def list_slow_queries(limit: int = Query(20, ge=1, le=200)) -> SlowQueryReport:
+    return SlowQueryReport(
+        threshold_ms=get_settings().slow_query_threshold_ms,
+        recorded=len(slow_query_log.entries()),
+        items=slow_query_log.top_offenders(limit),
+    )
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries() -> Response:
+    slow_query_log.clear()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/profiles", response_model=list[ProfileSummary])
+def list_profiles() -> list[ProfileSummary]:
+    return [ProfileSummary.model_validate(profile) for profile in profile_store.list()]
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(profile_id: int) -> PlainTextResponse:
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise not_found("Profile")
+    headers = {"Content-Disposition": f'inline; filename="profile-{profile.id}.folded"'}
+    return PlainTextResponse(profile.folded(), headers=headers)
+
+
+@router.post("/archive", response_model=ArchiveResult)
+def archive_issues(
+    older_than_days: int | None = Query(None, ge=0),
+    batch_size: int | None = Query(None, ge=1, le=10_000),
+    max_batches: int | None = Query(None, ge=1),
+    db: Session = Depends(get_db),
+) -> ArchiveResult:
+    settings = get_settings()
+    result = archive_closed_issues(
+        db,
+        settings.archive_after_days if older_than_days is None else older_than_days,
+        batch_size or settings.archive_batch_size,
+        max_batches,
+    )
+    return ArchiveResult(**result)
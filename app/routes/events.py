@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.db import get_db
+from app.errors import bad_request
+from app.schemas import EventFeedResponse
+from app.services.event_stream import sse_stream
+from app.services.timeline import FEED_START, Cursor, format_cursor, list_events_after, parse_cursor
+
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _cursor(value: str | None) -> Cursor:
+    if value is None:
+        return FEED_START
+    try:
+        return parse_cursor(value)
+    except ValueError:
+        raise bad_request("INVALID_CURSOR", "Cursor must be a cursor returned by the feed", {"value": value}) from None
+
+
+@router.get("", response_model=EventFeedResponse)
+def list_events(
+    after: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
+    event_type: str | None = None,
+    db: Session = Depends(get_db),
+) -> EventFeedResponse:
+    cursor = _cursor(after)
+    items = list_events_after(db, cursor, limit, event_type)
+    next_after = items[-1].cursor if items else format_cursor(cursor)
+    return EventFeedResponse(items=items, next_after=next_after)
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    after: str | None = None,
+    event_type: str | None = None,
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    cursor = _cursor(after) if after is not None else None
+    if last_event_id is not None:
+        try:
+            cursor = parse_cursor(last_event_id)
+        except ValueError:
+            raise bad_request(
+                "INVALID_LAST_EVENT_ID", "Last-Event-ID must be an event cursor", {"value": last_event_id}
+            ) from None
+    return StreamingResponse(
+        sse_stream(request.is_disconnected, cursor, event_type),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,6 +1,7 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, UploadFile, status
+from fastapi import APIRouter, Depends, File, Header, Query, UploadFile, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.crud import comments as comment_crud
@@ -9,35 +10,113 @@ from app.crud import labels as label_crud
 from app.crud import users as user_crud
 from app.db import get_db
 from app.enums import IssueStatus
-from app.errors import bad_request, conflict, not_found
+from app.errors import bad_request, conflict, http_error, not_found
+from app.observability.metrics import (
+    BULK_ROWS_UPDATED,
+    IMPORT_ROWS,
+    ISSUES_CREATED,
+    ISSUES_DELETED,
+    VERSION_CONFLICTS,
+)
 from app.schemas import (
+    BatchGetRequest,
+    BatchGetResponse,
+    BulkDeleteRequest,
+    BulkDeleteResult,
+    BulkLabelsRequest,
+    BulkLabelsResult,
     BulkStatusRequest,
     BulkStatusResult,
+    BulkUpdateRequest,
+    BulkUpdateResult,
     CommentCreate,
     CommentOut,
     CsvImportSummary,
     IssueEventOut,
     IssueCreate,
+    IssueFacetsResponse,
+    IssueFilter,
     IssueListResponse,
     IssueOut,
     IssueUpdate,
     LabelsUpdate,
 )
-from app.services.bulk_update import bulk_update_status
-from app.services.csv_import import import_issues_from_csv
-from app.services.timeline import get_timeline, log_event
+from app.services.batch_get import batch_get_issues
+from app.services.bulk_update import (
+    bulk_update_by_filter,
+    bulk_update_labels,
+    bulk_update_status,
+    select_target_ids,
+)
+from app.services.csv_import import DEFAULT_MAX_ERRORS, import_issues_from_csv
+from app.services.export import stream_issues_csv, stream_issues_ndjson
+from app.services.facets import issue_facets
+from app.services.idempotency import lock_and_get, request_fingerprint, store_response
+from app.services.purge import purge_issues
+from app.services.rollups import record_transitions
+from app.services.timeline import get_timeline, log_event, notify_events
 
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
+MAX_PAGE_SIZE = 100
+
+IdempotencyKeyHeader = Header(None, alias="Idempotency-Key", max_length=255)
+
+
+def _replay_idempotent(
+    db: Session, key: str | None, scope: str, body: bytes | dict[str, Any]
+) -> JSONResponse | None:
+    if key is None:
+        return None
+    record = lock_and_get(db, key)
+    if record is None:
+        return None
+    if record.request_hash != request_fingerprint(scope, body):
+        raise http_error(
+            "IDEMPOTENCY_KEY_REUSED",
+            "Idempotency key was already used for a different request",
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return JSONResponse(
+        status_code=record.status_code,
+        content=record.response_body,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def _remember_idempotent(
+    db: Session,
+    key: str | None,
+    scope: str,
+    body: bytes | dict[str, Any],
+    status_code: int,
+    response: dict | list,
+) -> None:
+    if key is not None:
+        store_response(db, key, request_fingerprint(scope, body), status_code, response)
+
 
 @router.post("", response_model=IssueOut, status_code=status.HTTP_201_CREATED)
-def create_issue(payload: IssueCreate, db: Session = Depends(get_db)) -> IssueOut:
-    if payload.assignee_id is not None and user_crud.get_user(db, payload.assignee_id) is None:
+def create_issue(
+    payload: IssueCreate,
+    idempotency_key: str | None = IdempotencyKeyHeader,
+    db: Session = Depends(get_db),
+) -> IssueOut:
+    request_body = payload.model_dump(mode="json")
+    replay = _replay_idempotent(db, idempotency_key, "POST /issues", request_body)
+    if replay is not None:
+        return replay
+    if payload.assignee_id is not None and not user_crud.user_exists(db, payload.assignee_id):
         raise not_found("User", {"assignee_id": payload.assignee_id})
     issue = issue_crud.create_issue(db, payload.title, payload.description, payload.status, payload.assignee_id)
     log_event(db, issue.id, "issue.created", {"status": issue.status, "assignee_id": issue.assignee_id})
+    record_transitions(db, [(None, issue.status)])
+    if idempotency_key is not None:
+        response = IssueOut.model_validate(issue).model_dump(mode="json")
+        _remember_idempotent(db, idempotency_key, "POST /issues", request_body, status.HTTP_201_CREATED, response)
     db.commit()
+    ISSUES_CREATED.inc()
     db.refresh(issue)
     return issue
 
@@ -47,30 +126,82 @@ def list_issues(
     status: IssueStatus | None = None,
     assignee_id: int | None = None,
     label: str | None = None,
-    limit: int = 20,
-    offset: int = 0,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
     sort: str = "created_at",
     order: str = "desc",
+    include_archived: bool = False,
     db: Session = Depends(get_db),
 ) -> IssueListResponse:
-    items, total = issue_crud.list_issues(db, status, assignee_id, label, limit, offset, sort, order)
+    items, total = issue_crud.list_issues(
+        db, status, assignee_id, label, limit, offset, sort, order, include_archived=include_archived
+    )
     return IssueListResponse(items=items, total=total, limit=limit, offset=offset)
 
 
+@router.post("/batch-get", response_model=BatchGetResponse)
+def batch_get(payload: BatchGetRequest, db: Session = Depends(get_db)) -> BatchGetResponse:
+    items = batch_get_issues(db, payload.ids, set(payload.include), payload.comments_limit)
+    return BatchGetResponse(items=items)
+
+
+@router.get("/facets", response_model=IssueFacetsResponse)
+def facets(
+    status: IssueStatus | None = None,
+    assignee_id: int | None = None,
+    label: str | None = None,
+    db: Session = Depends(get_db),
+) -> IssueFacetsResponse:
+    issue_filter = IssueFilter(status=status, assignee_id=assignee_id, label=label)
+    return IssueFacetsResponse(**issue_facets(db, issue_filter))
+
+
+@router.get("/export")
+def export_issues(
+    format: str = "csv",
+    status: IssueStatus | None = None,
+    assignee_id: int | None = None,
+    label: str | None = None,
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    if format == "csv":
+        rows = stream_issues_csv(db, status, assignee_id, label)
+        media_type = "text/csv"
+    elif format == "ndjson":
+        rows = stream_issues_ndjson(db, status, assignee_id, label)
+        media_type = "application/x-ndjson"
+    else:
+        raise bad_request("INVALID_EXPORT_FORMAT", "Export format must be csv or ndjson", {"format": format})
+    headers = {"Content-Disposition": f'attachment; filename="issues.{format}"'}
+    return StreamingResponse(rows, media_type=media_type, headers=headers)
+
+
 @router.get("/{issue_id}", response_model=IssueOut)
 def get_issue(issue_id: int, db: Session = Depends(get_db)) -> IssueOut:
-    issue = issue_crud.get_issue(db, issue_id)
+    issue = issue_crud.get_issue(db, issue_id) or issue_crud.get_archived_issue(db, issue_id)
     if issue is None:
         raise not_found("Issue", {"issue_id": issue_id})
     return issue
 
 
+@router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_issue(issue_id: int, db: Session = Depends(get_db)) -> Response:
+    deleted = issue_crud.delete_issues(db, [issue_id]) or issue_crud.delete_archived_issue(db, issue_id)
+    if not deleted:
+        raise not_found("Issue", {"issue_id": issue_id})
+    record_transitions(db, [(deleted_status, None) for _, deleted_status in deleted])
+    db.commit()
+    ISSUES_DELETED.inc()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.patch("/{issue_id}", response_model=IssueOut)
 def update_issue(issue_id: int, payload: IssueUpdate, db: Session = Depends(get_db)) -> IssueOut:
     issue = issue_crud.get_issue(db, issue_id)
     if issue is None:
         raise not_found("Issue", {"issue_id": issue_id})
     if payload.version != issue.version:
+        VERSION_CONFLICTS.inc()
         raise conflict("VERSION_CONFLICT", "Issue version mismatch", {"current_version": issue.version})
 
     updates: dict[str, Any] = {}
@@ -79,9 +210,10 @@ def update_issue(issue_id: int, payload: IssueUpdate, db: Session = Depends(get_
             updates[field] = getattr(payload, field)
 
     if "assignee_id" in updates and updates["assignee_id"] is not None:
-        if user_crud.get_user(db, updates["assignee_id"]) is None:
+        if not user_crud.user_exists(db, updates["assignee_id"]):
             raise not_found("User", {"assignee_id": updates["assignee_id"]})
 
+    previous_status = issue.status
     issue_crud.update_issue(
         db,
         issue,
@@ -92,21 +224,34 @@ def update_issue(issue_id: int, payload: IssueUpdate, db: Session = Depends(get_
         "assignee_id" in updates,
     )
     log_event(db, issue.id, "issue.updated", updates)
+    record_transitions(db, [(previous_status, issue.status)])
     db.commit()
     db.refresh(issue)
     return issue
 
 
 @router.post("/{issue_id}/comments", response_model=CommentOut, status_code=status.HTTP_201_CREATED)
-def add_comment(issue_id: int, payload: CommentCreate, db: Session = Depends(get_db)) -> CommentOut:
+def add_comment(
+    issue_id: int,
+    payload: CommentCreate,
+    idempotency_key: str | None = IdempotencyKeyHeader,
+    db: Session = Depends(get_db),
+) -> CommentOut:
+    scope = f"POST /issues/{issue_id}/comments"
+    request_body = payload.model_dump(mode="json")
+    replay = _replay_idempotent(db, idempotency_key, scope, request_body)
+    if replay is not None:
+        return replay
     issue = issue_crud.get_issue(db, issue_id)
     if issue is None:
         raise not_found("Issue", {"issue_id": issue_id})
-    author = user_crud.get_user(db, payload.author_id)
-    if author is None:
+    if not user_crud.user_exists(db, payload.author_id):
         raise not_found("User", {"author_id": payload.author_id})
     comment = comment_crud.create_comment(db, issue_id, payload.author_id, payload.body)
     log_event(db, issue.id, "comment.created", {"comment_id": comment.id})
+    if idempotency_key is not None:
+        response = CommentOut.model_validate(comment).model_dump(mode="json")
+        _remember_idempotent(db, idempotency_key, scope, request_body, status.HTTP_201_CREATED, response)
     db.commit()
     db.refresh(comment)
     return comment
@@ -118,7 +263,7 @@ def replace_labels(issue_id: int, payload: LabelsUpdate, db: Session = Depends(g
     if issue is None:
         raise not_found("Issue", {"issue_id": issue_id})
     labels = label_crud.get_or_create_labels(db, payload.labels)
-    issue.labels = labels
+    label_crud.set_issue_labels(issue, labels)
     log_event(db, issue.id, "labels.replaced", {"labels": payload.labels})
     db.commit()
     db.refresh(issue)
@@ -131,20 +276,83 @@ def bulk_status(payload: BulkStatusRequest, db: Session = Depends(get_db)) -> Bu
     if errors:
         db.rollback()
         raise bad_request("BULK_STATUS_FAILED", "Bulk status update failed", {"errors": errors})
-    for issue_id in updated_ids:
-        log_event(db, issue_id, "bulk.status", {"status": payload.new_status})
+    event_ids = [
+        log_event(db, issue_id, "bulk.status", {"status": payload.new_status}, notify=False).id
+        for issue_id in updated_ids
+    ]
+    notify_events(db, event_ids)
     db.commit()
+    BULK_ROWS_UPDATED.inc(len(updated_ids))
     return BulkStatusResult(updated=len(updated_ids))
 
 
+@router.post("/bulk-update", response_model=BulkUpdateResult)
+def bulk_update(payload: BulkUpdateRequest, db: Session = Depends(get_db)) -> BulkUpdateResult:
+    assignee_provided = "assignee_id" in payload.model_fields_set
+    if assignee_provided and payload.assignee_id is not None:
+        if not user_crud.user_exists(db, payload.assignee_id):
+            raise not_found("User", {"assignee_id": payload.assignee_id})
+    result, errors = bulk_update_by_filter(
+        db, payload.filter, payload.status, payload.assignee_id, assignee_provided, payload.dry_run
+    )
+    if payload.dry_run:
+        db.rollback()
+        return BulkUpdateResult(**result, dry_run=True, errors=errors)
+    if errors:
+        db.rollback()
+        raise bad_request("BULK_UPDATE_FAILED", "Bulk update failed", {"errors": errors})
+    db.commit()
+    BULK_ROWS_UPDATED.inc(result["updated"])
+    return BulkUpdateResult(**result, dry_run=False, errors=[])
+
+
+@router.post("/bulk-labels", response_model=BulkLabelsResult)
+def bulk_labels(payload: BulkLabelsRequest, db: Session = Depends(get_db)) -> BulkLabelsResult:
+    target_ids, errors = select_target_ids(db, payload.issue_ids, payload.filter)
+    if errors:
+        raise bad_request("BULK_LABELS_FAILED", "Bulk label update failed", {"errors": errors})
+    result = bulk_update_labels(db, target_ids, payload.add, payload.remove)
+    db.commit()
+    return BulkLabelsResult(**result)
+
+
+@router.post("/bulk-delete", response_model=BulkDeleteResult)
+def bulk_delete(payload: BulkDeleteRequest, db: Session = Depends(get_db)) -> BulkDeleteResult:
+    result = purge_issues(db, payload.filter, payload.batch_size, payload.max_batches, payload.dry_run)
+    return BulkDeleteResult(**result, dry_run=payload.dry_run)
+
+
 @router.post("/import", response_model=CsvImportSummary)
-async def import_issues(file: UploadFile = File(...), db: Session = Depends(get_db)) -> CsvImportSummary:
-    content = (await file.read()).decode("utf-8")
-    summary = import_issues_from_csv(db, content)
+def import_issues(
+    file: UploadFile = File(...),
+    max_errors: int = Query(DEFAULT_MAX_ERRORS, ge=1, le=10_000),
+    validate_only: bool = False,
+    upsert: bool = False,
+    idempotency_key: str | None = IdempotencyKeyHeader,
+    db: Session = Depends(get_db),
+) -> CsvImportSummary:
+    # A plain def: parsing, validation and inserts run in the threadpool, never on the event loop.
+    raw = file.file.read()
+    if validate_only:
+        # A dry run writes nothing, so there is nothing to make idempotent.
+        summary = import_issues_from_csv(db, raw.decode("utf-8"), max_errors, validate_only=True, upsert=upsert)
+        db.rollback()
+        return summary
+    scope = "POST /issues/import?upsert" if upsert else "POST /issues/import"
+    replay = _replay_idempotent(db, idempotency_key, scope, raw)
+    if replay is not None:
+        return replay
+    content = raw.decode("utf-8")
+    summary = import_issues_from_csv(db, content, max_errors, upsert=upsert)
     if summary["errors"]:
         db.rollback()
+        IMPORT_ROWS.labels("rejected").inc(summary["total_rows"])
         return summary
+    _remember_idempotent(db, idempotency_key, scope, raw, status.HTTP_200_OK, summary)
     db.commit()
+    for outcome in ("created", "updated", "unchanged", "archived"):
+        IMPORT_ROWS.labels(outcome).inc(summary[outcome])
+    ISSUES_CREATED.inc(summary["created"])
     return summary
 
 
@@ -152,6 +360,9 @@ async def import_issues(file: UploadFile = File(...), db: Session = Depends(get_
 def timeline(issue_id: int, db: Session = Depends(get_db)) -> list[IssueEventOut]:
     issue = issue_crud.get_issue(db, issue_id)
     if issue is None:
-        raise not_found("Issue", {"issue_id": issue_id})
+        issue = issue_crud.get_archived_issue(db, issue_id)
+        if issue is None:
+            raise not_found("Issue", {"issue_id": issue_id})
+        return get_timeline(db, issue_id, archived=True)
     events = get_timeline(db, issue_id)
     return events
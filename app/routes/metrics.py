@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from app.db import engine
+from app.observability.metrics import PoolCollector, registry
+
+
+router = APIRouter(tags=["metrics"])
+
+registry.register(PoolCollector(engine))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
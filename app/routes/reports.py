@@ -1,16 +1,34 @@
-from fastapi import APIRouter, Depends
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.db import get_db
-from app.schemas import LatencyResponse, TopAssigneesResponse
-from app.services.reports import average_latency, top_assignees
+from app.errors import bad_request
+from app.schemas import BacklogResponse, LatencyResponse, ThroughputResponse, TopAssigneesResponse
+from app.services.reports import average_latency, backlog, throughput, top_assignees
 
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+MAX_REPORT_DAYS = 366
+DEFAULT_REPORT_DAYS = 30
+
+
+def _date_range(date_from: date | None, date_to: date | None) -> tuple[date, date]:
+    date_to = date_to or datetime.now(timezone.utc).date()
+    date_from = date_from or date_to - timedelta(days=DEFAULT_REPORT_DAYS - 1)
+    if date_from > date_to:
+        raise bad_request("INVALID_DATE_RANGE", "date_from must not be after date_to")
+    if (date_to - date_from).days >= MAX_REPORT_DAYS:
+        raise bad_request(
+            "DATE_RANGE_TOO_LONG", f"Reports cover at most {MAX_REPORT_DAYS} days", {"max_days": MAX_REPORT_DAYS}
+        )
+    return date_from, date_to
+
 
 @router.get("/top-assignees", response_model=TopAssigneesResponse)
-def report_top_assignees(limit: int = 10, db: Session = Depends(get_db)) -> TopAssigneesResponse:
+def report_top_assignees(limit: int = Query(10, ge=1, le=100), db: Session = Depends(get_db)) -> TopAssigneesResponse:
     items = top_assignees(db, limit)
     return TopAssigneesResponse(items=items)
 
@@ -18,3 +36,17 @@ def report_top_assignees(limit: int = 10, db: Session = Depends(get_db)) -> TopA
 @router.get("/latency", response_model=LatencyResponse)
 def report_latency(db: Session = Depends(get_db)) -> LatencyResponse:
     return LatencyResponse(**average_latency(db))
+
+
+@router.get("/throughput", response_model=ThroughputResponse)
+def report_throughput(
+    date_from: date | None = None, date_to: date | None = None, db: Session = Depends(get_db)
+) -> ThroughputResponse:
+    return ThroughputResponse(items=throughput(db, *_date_range(date_from, date_to)))
+
+
+@router.get("/backlog", response_model=BacklogResponse)
+def report_backlog(
+    date_from: date | None = None, date_to: date | None = None, db: Session = Depends(get_db)
+) -> BacklogResponse:
+    return BacklogResponse(items=backlog(db, *_date_range(date_from, date_to)))
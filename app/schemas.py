@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.enums import IssueStatus
 
@@ -44,16 +45,25 @@ class LabelOut(BaseModel):
     name: str
 
 
+# ORM issues render their labels from the denormalized arrays (``label_refs``) rather than a join;
+# plain dicts, such as re-validated responses, still carry ``labels``.
+_LABELS_SOURCE = AliasChoices("label_refs", "labels")
+
+
+def _clean_labels(value: list[str]) -> list[str]:
+    cleaned = [label.strip() for label in value if label.strip()]
+    if len(cleaned) != len(set(cleaned)):
+        raise ValueError("Duplicate labels are not allowed")
+    return cleaned
+
+
 class LabelsUpdate(BaseModel):
     labels: list[str] = Field(default_factory=list)
 
     @field_validator("labels")
     @classmethod
     def validate_labels(cls, value: list[str]) -> list[str]:
-        cleaned = [label.strip() for label in value if label.strip()]
-        if len(cleaned) != len(set(cleaned)):
-            raise ValueError("Duplicate labels are not allowed")
-        return cleaned
+        return _clean_labels(value)
 
 
 class IssueBase(BaseModel):
@@ -102,7 +112,9 @@ class IssueOut(BaseModel):
     updated_at: datetime
     resolved_at: datetime | None
     version: int
-    labels: list[LabelOut]
+    external_id: str | None = None
+    archived_at: datetime | None = None
+    labels: list[LabelOut] = Field(validation_alias=_LABELS_SOURCE)
     comments: list[CommentOut]
 
 
@@ -118,7 +130,9 @@ class IssueListItem(BaseModel):
     updated_at: datetime
     resolved_at: datetime | None
     version: int
-    labels: list[LabelOut]
+    external_id: str | None = None
+    archived_at: datetime | None = None
+    labels: list[LabelOut] = Field(validation_alias=_LABELS_SOURCE)
 
 
 class IssueListResponse(BaseModel):
@@ -128,6 +142,45 @@ class IssueListResponse(BaseModel):
     offset: int
 
 
+MAX_BATCH_GET_IDS = 200
+
+
+class BatchGetRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_GET_IDS)
+    include: list[Literal["labels", "assignee", "latest_comments", "comment_count"]] = Field(default_factory=list)
+    comments_limit: int = Field(3, ge=1, le=20)
+
+
+class BatchIssueOut(BaseModel):
+    """An issue in a batch-get response; relations are present only when requested in ``include``."""
+
+    id: int
+    title: str
+    description: str | None
+    status: IssueStatus
+    assignee_id: int | None
+    created_at: datetime
+    updated_at: datetime
+    resolved_at: datetime | None
+    version: int
+    external_id: str | None = None
+    archived_at: datetime | None = None
+    labels: list[LabelOut] | None = None
+    assignee: UserOut | None = None
+    latest_comments: list[CommentOut] | None = None
+    comment_count: int | None = None
+
+
+class BatchGetItem(BaseModel):
+    id: int
+    found: bool
+    issue: BatchIssueOut | None = None
+
+
+class BatchGetResponse(BaseModel):
+    items: list[BatchGetItem]
+
+
 class BulkStatusRequest(BaseModel):
     issue_ids: list[int]
     new_status: IssueStatus
@@ -137,11 +190,113 @@ class BulkStatusResult(BaseModel):
     updated: int
 
 
+class IssueFilter(BaseModel):
+    status: IssueStatus | None = None
+    assignee_id: int | None = None
+    label: str | None = None
+    labels: list[str] = Field(default_factory=list)
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+class BulkLabelsRequest(BaseModel):
+    issue_ids: list[int] | None = None
+    filter: IssueFilter | None = None
+    add: list[str] = Field(default_factory=list)
+    remove: list[str] = Field(default_factory=list)
+
+    @field_validator("add", "remove")
+    @classmethod
+    def validate_labels(cls, value: list[str]) -> list[str]:
+        return _clean_labels(value)
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "BulkLabelsRequest":
+        if (self.issue_ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of issue_ids or filter")
+        if not self.add and not self.remove:
+            raise ValueError("Provide labels to add or remove")
+        if set(self.add) & set(self.remove):
+            raise ValueError("A label cannot be both added and removed")
+        return self
+
+
+class BulkLabelsResult(BaseModel):
+    added: int
+    removed: int
+    issues_changed: int
+
+
+class BulkUpdateRequest(BaseModel):
+    filter: IssueFilter
+    status: IssueStatus | None = None
+    assignee_id: int | None = None
+    dry_run: bool = False
+
+    @model_validator(mode="after")
+    def validate_changes(self) -> "BulkUpdateRequest":
+        if self.status is None and "assignee_id" not in self.model_fields_set:
+            raise ValueError("Provide status and/or assignee_id to change")
+        return self
+
+
+class BulkUpdateResult(BaseModel):
+    matched: int
+    updated: int
+    dry_run: bool
+    errors: list[dict]
+
+
+class BulkDeleteRequest(BaseModel):
+    filter: IssueFilter
+    batch_size: int = Field(1000, ge=1, le=10_000)
+    max_batches: int | None = Field(None, ge=1)
+    dry_run: bool = False
+
+    @model_validator(mode="after")
+    def validate_filter(self) -> "BulkDeleteRequest":
+        # Null and empty values add no condition, so only effective values count as a filter.
+        if not any(value not in (None, "", []) for value in self.filter.model_dump().values()):
+            raise ValueError("Provide at least one filter value; an empty filter would delete every issue")
+        return self
+
+
+class BulkDeleteResult(BaseModel):
+    matched: int
+    deleted: int
+    batches: int
+    dry_run: bool
+
+
+class FacetCount(BaseModel):
+    value: str | int | None
+    count: int
+
+
+class IssueFacetsResponse(BaseModel):
+    total: int
+    status: list[FacetCount]
+    assignee_id: list[FacetCount]
+    label: list[FacetCount]
+
+
+class CsvImportErrorGroup(BaseModel):
+    reason: str
+    count: int
+    sample_rows: list[int]
+
+
 class CsvImportSummary(BaseModel):
     total_rows: int
     created: int
+    updated: int = 0
+    unchanged: int = 0
+    archived: int = 0
     failed: int
     errors: list[dict]
+    error_summary: list[CsvImportErrorGroup] = []
+    truncated: bool = False
+    validate_only: bool = False
 
 
 class TopAssigneeRow(BaseModel):
@@ -153,6 +308,25 @@ class TopAssigneesResponse(BaseModel):
     items: list[TopAssigneeRow]
 
 
+class ThroughputDay(BaseModel):
+    day: date
+    created: int
+    resolved: int
+
+
+class ThroughputResponse(BaseModel):
+    items: list[ThroughputDay]
+
+
+class BacklogDay(BaseModel):
+    day: date
+    counts: dict[IssueStatus, int]
+
+
+class BacklogResponse(BaseModel):
+    items: list[BacklogDay]
+
+
 class LatencyResponse(BaseModel):
     average_seconds: float | None
     resolved_count: int
@@ -166,3 +340,47 @@ class IssueEventOut(BaseModel):
     event_type: str
     payload: dict | None
     created_at: datetime
+    cursor: str
+
+
+class EventFeedResponse(BaseModel):
+    items: list[IssueEventOut]
+    next_after: str
+
+
+class SlowQueryOffender(BaseModel):
+    statement: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    slowest_parameters: Any = None
+    routes: list[str]
+    last_seen: datetime
+    plan: str | None
+
+
+class SlowQueryReport(BaseModel):
+    threshold_ms: float
+    recorded: int
+    items: list[SlowQueryOffender]
+
+
+class ProfileSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    method: str
+    route: str
+    status: int
+    started_at: datetime
+    duration_ms: float
+    db_ms: float
+    queries: int
+    sample_count: int
+
+
+class ArchiveResult(BaseModel):
+    archived: int
+    batches: int
+    cutoff: datetime
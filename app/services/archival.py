@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Table, delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.enums import IssueStatus
+from app.models import (
+    ArchivedComment,
+    ArchivedIssue,
+    ArchivedIssueEvent,
+    Comment,
+    Issue,
+    IssueEvent,
+    archived_issue_labels,
+    issue_labels,
+)
+
+
+# Hot table -> archive table, parents first so the archive's foreign keys are satisfied.
+_ARCHIVE_TABLES: list[tuple[Table, Table]] = [
+    (Issue.__table__, ArchivedIssue.__table__),
+    (Comment.__table__, ArchivedComment.__table__),
+    (issue_labels, archived_issue_labels),
+    (IssueEvent.__table__, ArchivedIssueEvent.__table__),
+]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _copy_rows(db: Session, source: Table, target: Table, issue_ids: list[int]) -> None:
+    key = source.c.id if source is Issue.__table__ else source.c.issue_id
+    # Explicit column lists, so the copy does not depend on column order in either table.
+    columns = [column.name for column in source.columns]
+    db.execute(
+        insert(target).from_select(columns, select(*(source.c[name] for name in columns)).where(key.in_(issue_ids)))
+    )
+
+
+def archive_closed_issues(db: Session, older_than_days: int, batch_size: int, max_batches: int | None = None) -> dict:
+    """Move issues CLOSED for more than ``older_than_days`` to the archive tables, committing per batch.
+
+    Each batch copies the issues with their comments, labels and events, then deletes the hot rows
+    (children go with them through ON DELETE CASCADE). Rows locked by a concurrent request are
+    skipped and picked up by the next run.
+    """
+    cutoff = _utcnow() - timedelta(days=older_than_days)
+    # resolved_at is when the issue was first resolved, not when it was closed; every status
+    # change bumps updated_at, so an issue untouched since the cutoff has been CLOSED at least that long.
+    candidates = (
+        select(Issue.id)
+        .where(Issue.status == IssueStatus.closed, Issue.updated_at < cutoff)
+        .order_by(Issue.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    archived = batches = 0
+    while max_batches is None or batches < max_batches:
+        issue_ids = list(db.scalars(candidates))
+        if not issue_ids:
+            break
+        for source, target in _ARCHIVE_TABLES:
+            _copy_rows(db, source, target, issue_ids)
+        db.execute(delete(Issue).where(Issue.id.in_(issue_ids)), execution_options={"synchronize_session": False})
+        db.commit()
+        archived += len(issue_ids)
+        batches += 1
+        if len(issue_ids) < batch_size:
+            break
+    return {"archived": archived, "batches": batches, "cutoff": cutoff}
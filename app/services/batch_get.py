@@ -0,0 +1,98 @@
+from collections import defaultdict
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
+
+from app.crud.users import get_users_by_ids
+from app.models import ArchivedComment, ArchivedIssue, Comment, Issue
+
+
+_ISSUE_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "assignee_id",
+    "created_at",
+    "updated_at",
+    "resolved_at",
+    "version",
+    "external_id",
+)
+
+
+def _latest_comments(
+    db: Session, model: type[Comment] | type[ArchivedComment], issue_ids: list[int], limit: int
+) -> dict[int, list]:
+    ranked = (
+        select(
+            model,
+            func.row_number()
+            .over(partition_by=model.issue_id, order_by=(model.created_at.desc(), model.id.desc()))
+            .label("rank"),
+        )
+        .where(model.issue_id.in_(issue_ids))
+        .subquery()
+    )
+    comment = aliased(model, ranked)
+    stmt = select(comment).where(ranked.c.rank <= limit).order_by(ranked.c.issue_id, ranked.c.rank)
+    by_issue: dict[int, list] = defaultdict(list)
+    for row in db.scalars(stmt):
+        by_issue[row.issue_id].append(row)
+    return by_issue
+
+
+def _comment_counts(db: Session, model: type[Comment] | type[ArchivedComment], issue_ids: list[int]) -> dict[int, int]:
+    stmt = select(model.issue_id, func.count()).where(model.issue_id.in_(issue_ids)).group_by(model.issue_id)
+    return dict(db.execute(stmt).tuples().all())
+
+
+def batch_get_issues(db: Session, ids: list[int], include: set[str], comments_limit: int) -> list[dict]:
+    """Issues for ``ids`` in input order, with each requested relation loaded in one query for the whole set.
+
+    Ids that are neither hot nor archived come back as ``{"id": ..., "found": False}``.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    issues: dict[int, Issue | ArchivedIssue] = {}
+    for issue in db.scalars(select(Issue).where(Issue.id.in_(unique_ids))):
+        issues[issue.id] = issue
+    hot_ids = list(issues)
+    missing = [issue_id for issue_id in unique_ids if issue_id not in issues]
+    archived_ids: list[int] = []
+    if missing:
+        for issue in db.scalars(select(ArchivedIssue).where(ArchivedIssue.id.in_(missing))):
+            issues[issue.id] = issue
+            archived_ids.append(issue.id)
+
+    comments: dict[int, list] = {}
+    counts: dict[int, int] = {}
+    for model, model_ids in ((Comment, hot_ids), (ArchivedComment, archived_ids)):
+        if not model_ids:
+            continue
+        if "latest_comments" in include:
+            comments.update(_latest_comments(db, model, model_ids, comments_limit))
+        if "comment_count" in include:
+            counts.update(_comment_counts(db, model, model_ids))
+    assignees = {}
+    if "assignee" in include:
+        assignee_ids = [issue.assignee_id for issue in issues.values() if issue.assignee_id is not None]
+        assignees = get_users_by_ids(db, assignee_ids)
+
+    items = []
+    for issue_id in ids:
+        issue = issues.get(issue_id)
+        if issue is None:
+            items.append({"id": issue_id, "found": False})
+            continue
+        body = {field: getattr(issue, field) for field in _ISSUE_FIELDS}
+        body["archived_at"] = getattr(issue, "archived_at", None)
+        if "labels" in include:
+            body["labels"] = issue.label_refs
+        if "assignee" in include:
+            body["assignee"] = assignees.get(issue.assignee_id)
+        if "latest_comments" in include:
+            body["latest_comments"] = comments.get(issue_id, [])
+        if "comment_count" in include:
+            body["comment_count"] = counts.get(issue_id, 0)
+        items.append({"id": issue_id, "found": True, "issue": body})
+    return items
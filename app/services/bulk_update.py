@@ -1,10 +1,16 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Integer, Select, delete, func, select, true, type_coerce, update
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, insert
 from sqlalchemy.orm import Session
 
+from app.crud.labels import get_or_create_labels, sync_label_arrays
 from app.enums import IssueStatus
-from app.models import Issue
+from app.models import Issue, Label, issue_labels
+from app.schemas import IssueFilter
+from app.services.filters import apply_issue_filter
+from app.services.rollups import record_transitions
+from app.services.timeline import log_events
 
 
 def _utcnow() -> datetime:
@@ -36,6 +42,7 @@ def bulk_update_status(
     if errors:
         return [], errors
 
+    record_transitions(db, [(issue.status, new_status) for issue in issues])
     now = _utcnow()
     for issue in issues:
         issue.status = new_status
@@ -48,3 +55,151 @@ def bulk_update_status(
         issue.version += 1
         db.add(issue)
     return [issue.id for issue in issues], errors
+
+
+def select_target_ids(
+    db: Session, issue_ids: list[int] | None, issue_filter: IssueFilter | None
+) -> tuple[Select | None, list[dict]]:
+    """Build a subquery of targeted issue ids; an explicit id list must match existing issues."""
+    if issue_ids is not None:
+        found = set(db.scalars(select(Issue.id).where(Issue.id.in_(issue_ids))))
+        missing = [issue_id for issue_id in issue_ids if issue_id not in found]
+        if missing:
+            return None, [{"issue_ids": missing, "reason": "Issue not found"}]
+        return select(Issue.id).where(Issue.id.in_(issue_ids)), []
+    return apply_issue_filter(select(Issue.id), issue_filter or IssueFilter()), []
+
+
+def bulk_update_labels(db: Session, target_ids: Select, add: list[str], remove: list[str]) -> dict:
+    changed: set[int] = set()
+    added = 0
+    removed = 0
+
+    if add:
+        label_ids = [label.id for label in get_or_create_labels(db, add)]
+        targets = target_ids.subquery()
+        stmt = (
+            insert(issue_labels)
+            .from_select(
+                ["issue_id", "label_id"],
+                select(targets.c.id, Label.id)
+                .select_from(targets.join(Label, true()))
+                .where(Label.id.in_(label_ids)),
+            )
+            .on_conflict_do_nothing()
+            .returning(issue_labels.c.issue_id)
+        )
+        rows = db.scalars(stmt).all()
+        added = len(rows)
+        changed.update(rows)
+
+    if remove:
+        stmt = (
+            delete(issue_labels)
+            .where(
+                issue_labels.c.issue_id.in_(target_ids),
+                issue_labels.c.label_id == Label.id,
+                Label.name.in_(remove),
+            )
+            .returning(issue_labels.c.issue_id)
+        )
+        rows = db.scalars(stmt).all()
+        removed = len(rows)
+        changed.update(rows)
+
+    if changed:
+        sync_label_arrays(db, sorted(changed))
+    log_events(db, sorted(changed), "labels.bulk_updated", {"added": add, "removed": remove})
+    return {"added": added, "removed": removed, "issues_changed": len(changed)}
+
+
+_VIOLATION_SAMPLE_SIZE = 20
+
+
+def _rule_predicates(
+    status_col: ColumnElement,
+    assignee_col: ColumnElement,
+    new_status: IssueStatus | None,
+    assignee_id: int | None,
+    assignee_provided: bool,
+) -> list[tuple[str, ColumnElement[bool]]]:
+    """Rules A and B expressed over the pre-update row columns."""
+    rules: list[tuple[str, ColumnElement[bool]]] = []
+    if new_status in (IssueStatus.resolved, IssueStatus.closed):
+        if not assignee_provided:
+            rules.append(("Assignee required for resolved/closed", assignee_col.is_(None)))
+        elif assignee_id is None:
+            rules.append(("Assignee required for resolved/closed", true()))
+    if new_status == IssueStatus.closed:
+        rules.append(("Cannot close directly from open", status_col == IssueStatus.open))
+    return rules
+
+
+def bulk_update_by_filter(
+    db: Session,
+    issue_filter: IssueFilter,
+    new_status: IssueStatus | None,
+    assignee_id: int | None,
+    assignee_provided: bool,
+    dry_run: bool,
+) -> tuple[dict, list[dict]]:
+    if dry_run:
+        targets = apply_issue_filter(select(Issue.id, Issue.status, Issue.assignee_id), issue_filter).subquery()
+        rules = _rule_predicates(targets.c.status, targets.c.assignee_id, new_status, assignee_id, assignee_provided)
+        columns = [func.count()]
+        for _, predicate in rules:
+            sample = func.array_agg(aggregate_order_by(targets.c.id, targets.c.id)).filter(predicate)
+            columns.append(func.count().filter(predicate))
+            columns.append(type_coerce(sample, ARRAY(Integer))[1:_VIOLATION_SAMPLE_SIZE])
+        row = db.execute(select(*columns).select_from(targets)).one()
+        errors = []
+        for idx, (reason, _) in enumerate(rules):
+            count, sample_ids = row[1 + 2 * idx], row[2 + 2 * idx]
+            if count:
+                errors.append({"reason": reason, "count": count, "issue_ids": sample_ids})
+        return {"matched": row[0], "updated": 0}, errors
+
+    # Lock the matching rows and update them in one statement; the rule flags are
+    # evaluated against the locked pre-update values and returned alongside each id.
+    old = (
+        apply_issue_filter(select(Issue.id, Issue.status, Issue.assignee_id), issue_filter)
+        .with_for_update()
+        .subquery("old")
+    )
+    rules = _rule_predicates(old.c.status, old.c.assignee_id, new_status, assignee_id, assignee_provided)
+    now = _utcnow()
+    values: dict = {"updated_at": now, "version": Issue.version + 1}
+    if new_status is not None:
+        values["status"] = new_status
+        if new_status in (IssueStatus.resolved, IssueStatus.closed):
+            values["resolved_at"] = func.coalesce(Issue.resolved_at, now)
+        else:
+            values["resolved_at"] = None
+    if assignee_provided:
+        values["assignee_id"] = assignee_id
+    stmt = (
+        update(Issue)
+        .where(Issue.id == old.c.id)
+        .values(**values)
+        .returning(Issue.id, old.c.status, *[predicate for _, predicate in rules])
+        .execution_options(synchronize_session=False)
+    )
+    rows = db.execute(stmt).all()
+
+    errors: list[dict] = []
+    for idx, (reason, _) in enumerate(rules, start=2):
+        violating = sorted(row[0] for row in rows if row[idx])
+        if violating:
+            errors.append({"reason": reason, "count": len(violating), "issue_ids": violating[:_VIOLATION_SAMPLE_SIZE]})
+    if errors:
+        return {"matched": len(rows), "updated": 0}, errors
+
+    updated_ids = sorted(row[0] for row in rows)
+    payload: dict = {}
+    if new_status is not None:
+        payload["status"] = new_status
+        record_transitions(db, [(row.status, new_status) for row in rows])
+    if assignee_provided:
+        payload["assignee_id"] = assignee_id
+    log_events(db, updated_ids, "bulk.update", payload)
+    return {"matched": len(rows), "updated": len(updated_ids)}, errors
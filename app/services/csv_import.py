@@ -1,17 +1,48 @@
 import csv
+import hashlib
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from io import StringIO
+from multiprocessing import get_context
+from typing import NamedTuple
 
+from sqlalchemy import String, any_, bindparam, case, delete, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.orm import Session
 
-from app.crud.issues import apply_resolved_at
-from app.crud.labels import get_or_create_labels
-from app.crud.users import get_user_by_email
+from app.config import get_settings
+from app.crud.labels import get_or_create_labels, label_arrays
+from app.crud.users import get_users_by_emails
 from app.enums import IssueStatus
-from app.models import Issue
-from app.services.timeline import log_event
+from app.models import ArchivedIssue, Issue, issue_labels, utcnow
+from app.services.rollups import record_transitions
+from app.services.timeline import insert_events
 
 
 REQUIRED_COLUMNS = {"title", "description", "status", "assignee_email", "labels"}
+DEFAULT_MAX_ERRORS = 100
+ERROR_SAMPLE_ROWS = 5
+EXTERNAL_ID_MAX_LENGTH = 255
+_LOOKUP_BATCH_SIZE = 50_000
+
+
+class ParsedRow(NamedTuple):
+    row_number: int
+    title: str
+    description: str | None
+    status: IssueStatus
+    assignee_email: str
+    labels: list[str]
+    external_id: str | None
+    content_hash: str
+
+
+def _content_hash(title: str, description: str | None, status: IssueStatus, email: str, labels: list[str]) -> str:
+    """Hash of the normalized row, so re-importing an unchanged row can be detected without a write."""
+    fields = [title, description or "", status.value, email.lower(), ";".join(sorted(labels))]
+    return hashlib.sha256("\x1f".join(fields).encode("utf-8")).hexdigest()
 
 
 def _parse_labels(raw: str | None) -> list[str]:
@@ -37,79 +68,401 @@ def _parse_status(raw: str | None) -> IssueStatus | None:
     return IssueStatus(value)
 
 
-def import_issues_from_csv(db: Session, content: str) -> dict:
-    reader = csv.DictReader(StringIO(content))
-    if reader.fieldnames is None or not REQUIRED_COLUMNS.issubset(set(reader.fieldnames)):
-        return {
-            "total_rows": 0,
-            "created": 0,
-            "failed": 0,
-            "errors": [{"row_number": 1, "reason": "Missing required columns"}],
-        }
+def _split_chunks(body: str, chunk_size: int) -> list[str]:
+    """Cut ``body`` into pieces of roughly ``chunk_size`` characters at record boundaries.
+
+    A newline ends a record only when the quotes before it are balanced, since quoted
+    fields may span lines and embedded quotes are always doubled.
+    """
+    chunks: list[str] = []
+    start = 0
+    while start < len(body):
+        cut = body.find("\n", start + chunk_size)
+        while cut != -1 and body.count('"', start, cut) % 2:
+            cut = body.find("\n", cut + 1)
+        if cut == -1:
+            chunks.append(body[start:])
+            break
+        chunks.append(body[start : cut + 1])
+        start = cut + 1
+    return chunks
 
-    rows = list(reader)
-    errors: list[dict] = []
-    parsed_rows: list[dict] = []
 
-    for idx, row in enumerate(rows, start=2):
+def _validate_chunk(
+    fieldnames: list[str], chunk: str, max_errors: int
+) -> tuple[int, list[ParsedRow], list[tuple[int, str]], bool]:
+    """Row checks that need no database; row numbers are 0-based within the chunk.
+
+    Stops after ``max_errors`` failures, so the returned count covers only the rows examined;
+    the last element says whether rows were left unread.
+    """
+    parsed: list[ParsedRow] = []
+    errors: list[tuple[int, str]] = []
+    count = 0
+    rows_left = False
+    for row in csv.DictReader(StringIO(chunk), fieldnames=fieldnames):
+        if len(errors) >= max_errors:
+            rows_left = True
+            break
+        index = count
+        count += 1
         title = (row.get("title") or "").strip()
         if not title:
-            errors.append({"row_number": idx, "reason": "Title is required"})
+            errors.append((index, "Title is required"))
             continue
 
         try:
             status = _parse_status(row.get("status"))
         except ValueError:
-            errors.append({"row_number": idx, "reason": "Invalid status"})
+            errors.append((index, "Invalid status"))
             continue
 
-        assignee_email = (row.get("assignee_email") or "").strip()
-        assignee = None
-        if assignee_email:
-            assignee = get_user_by_email(db, assignee_email)
-            if assignee is None:
-                errors.append({"row_number": idx, "reason": "Assignee email not found"})
-                continue
+        external_id = (row.get("external_id") or "").strip() or None
+        if external_id is not None and len(external_id) > EXTERNAL_ID_MAX_LENGTH:
+            errors.append((index, "External id is too long"))
+            continue
 
+        description = (row.get("description") or "").strip() or None
+        status = status or IssueStatus.open
+        assignee_email = (row.get("assignee_email") or "").strip()
         labels = _parse_labels(row.get("labels"))
-        parsed_rows.append(
+        content_hash = _content_hash(title, description, status, assignee_email, labels)
+        parsed.append(
+            ParsedRow(index, title, description, status, assignee_email, labels, external_id, content_hash)
+        )
+    return count, parsed, errors, rows_left
+
+
+def _chunk_results(
+    fieldnames: list[str], body: str, max_errors: int
+) -> Iterator[tuple[int, list[ParsedRow], list[tuple[int, str]], bool]]:
+    """``_validate_chunk`` results in file order; rows are left unread after any chunk but the last."""
+    settings = get_settings()
+    workers = settings.csv_import_workers or os.cpu_count() or 1
+    if workers <= 1 or len(body) < settings.csv_import_parallel_min_size:
+        yield _validate_chunk(fieldnames, body, max_errors)
+        return
+
+    chunks = _split_chunks(body, settings.csv_import_chunk_size)
+    # spawn, not fork: the server process has live threads and pooled connections.
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=get_context("spawn")) as pool:
+        futures = [pool.submit(_validate_chunk, fieldnames, chunk, max_errors) for chunk in chunks]
+        try:
+            for index, future in enumerate(futures):
+                count, parsed, errors, rows_left = future.result()
+                yield count, parsed, errors, rows_left or index < len(futures) - 1
+        finally:
+            # Once the caller has seen enough errors, chunks not yet started are dropped.
+            for future in futures:
+                future.cancel()
+
+
+def _validate_rows(
+    fieldnames: list[str], body: str, max_errors: int
+) -> tuple[int, list[ParsedRow], list[dict], bool]:
+    """Rows examined, parsed rows, the first ``max_errors`` errors, and whether the check stopped early.
+
+    Stopping early means rows were left unread or errors beyond ``max_errors`` were dropped.
+    """
+    total = 0
+    parsed: list[ParsedRow] = []
+    errors: list[dict] = []
+    truncated = False
+    with closing(_chunk_results(fieldnames, body, max_errors)) as results:
+        for count, chunk_rows, chunk_errors, rows_left in results:
+            # Data rows start on line 2, after the header.
+            offset = total + 2
+            parsed.extend(row._replace(row_number=offset + row.row_number) for row in chunk_rows)
+            errors.extend({"row_number": offset + index, "reason": reason} for index, reason in chunk_errors)
+            total += count
+            if len(errors) >= max_errors:
+                truncated = rows_left or len(errors) > max_errors
+                break
+    return total, parsed, errors[:max_errors], truncated
+
+
+def _error_summary(errors: list[dict]) -> list[dict]:
+    groups: dict[str, dict] = {}
+    for error in errors:
+        group = groups.setdefault(error["reason"], {"reason": error["reason"], "count": 0, "sample_rows": []})
+        group["count"] += 1
+        if len(group["sample_rows"]) < ERROR_SAMPLE_ROWS:
+            group["sample_rows"].append(error["row_number"])
+    return sorted(groups.values(), key=lambda group: group["count"], reverse=True)
+
+
+def _summary(
+    total_rows: int,
+    created: int,
+    errors: list[dict],
+    truncated: bool,
+    validate_only: bool,
+    updated: int = 0,
+    unchanged: int = 0,
+    archived: int = 0,
+) -> dict:
+    return {
+        "total_rows": total_rows,
+        "created": created,
+        "updated": updated,
+        "unchanged": unchanged,
+        "archived": archived,
+        "failed": len(errors),
+        "errors": errors,
+        "error_summary": _error_summary(errors),
+        "truncated": truncated,
+        "validate_only": validate_only,
+    }
+
+
+def _existing_issues(db: Session, external_ids: list[str]) -> dict[str, tuple[str | None, IssueStatus]]:
+    """Current ``(import_hash, status)`` per known external id, fetched with one array parameter per batch."""
+    existing: dict[str, tuple[str | None, IssueStatus]] = {}
+    for start in range(0, len(external_ids), _LOOKUP_BATCH_SIZE):
+        batch = external_ids[start : start + _LOOKUP_BATCH_SIZE]
+        ids = bindparam("external_ids", batch, type_=ARRAY(String))
+        stmt = select(Issue.external_id, Issue.import_hash, Issue.status).where(Issue.external_id == any_(ids))
+        existing.update((external_id, (import_hash, status)) for external_id, import_hash, status in db.execute(stmt))
+    return existing
+
+
+def _archived_external_ids(db: Session, external_ids: list[str]) -> set[str]:
+    """The subset of ``external_ids`` whose issue has been moved to the archive."""
+    archived: set[str] = set()
+    for start in range(0, len(external_ids), _LOOKUP_BATCH_SIZE):
+        batch = external_ids[start : start + _LOOKUP_BATCH_SIZE]
+        ids = bindparam("external_ids", batch, type_=ARRAY(String))
+        archived.update(db.scalars(select(ArchivedIssue.external_id).where(ArchivedIssue.external_id == any_(ids))))
+    return archived
+
+
+def _external_id_errors(parsed_rows: list[ParsedRow], known: set[str], upsert: bool) -> list[dict]:
+    errors: list[dict] = []
+    seen: set[str] = set()
+    for row in parsed_rows:
+        if row.external_id is None:
+            if upsert:
+                errors.append({"row_number": row.row_number, "reason": "External id is required for upsert"})
+        elif row.external_id in seen:
+            errors.append({"row_number": row.row_number, "reason": "Duplicate external id"})
+        elif not upsert and row.external_id in known:
+            errors.append({"row_number": row.row_number, "reason": "External id already exists"})
+        else:
+            seen.add(row.external_id)
+    return errors
+
+
+def _insert_rows(db: Session, rows: list[ParsedRow], user_ids: dict[str, int], labels_by_name: dict) -> int:
+    """Insert ``rows`` with one statement each for issues, label links and events."""
+    if not rows:
+        return 0
+    now = utcnow()
+    done = (IssueStatus.resolved, IssueStatus.closed)
+    values = []
+    for row in rows:
+        label_ids, label_names = label_arrays([labels_by_name[name] for name in row.labels])
+        values.append(
             {
-                "title": title,
-                "description": (row.get("description") or "").strip() or None,
-                "status": status or IssueStatus.open,
-                "assignee_id": assignee.id if assignee else None,
-                "labels": labels,
+                "title": row.title,
+                "description": row.description,
+                "status": row.status,
+                "assignee_id": user_ids.get(row.assignee_email),
+                "external_id": row.external_id,
+                "import_hash": row.content_hash if row.external_id else None,
+                "label_ids": label_ids,
+                "label_names": label_names,
+                "resolved_at": now if row.status in done else None,
+                "created_at": now,
+                "updated_at": now,
             }
         )
+    # executemany with RETURNING; sort_by_parameter_order pairs each id with its row.
+    issue_ids = list(db.scalars(insert(Issue).returning(Issue.id, sort_by_parameter_order=True), values))
 
-    if errors:
-        return {
-            "total_rows": len(rows),
-            "created": 0,
-            "failed": len(errors),
-            "errors": errors,
+    label_rows = [
+        {"issue_id": issue_id, "label_id": labels_by_name[name].id}
+        for issue_id, row in zip(issue_ids, rows)
+        for name in row.labels
+    ]
+    if label_rows:
+        db.execute(insert(issue_labels), label_rows)
+    events = [
+        {
+            "issue_id": issue_id,
+            "event_type": "issue.created",
+            "payload": {"status": value["status"], "assignee_id": value["assignee_id"]},
         }
+        for issue_id, value in zip(issue_ids, values)
+    ]
+    insert_events(db, events)
+    record_transitions(db, [(None, row.status) for row in rows])
+    return len(rows)
 
-    created_count = 0
-    for payload in parsed_rows:
-        issue = Issue(
-            title=payload["title"],
-            description=payload["description"],
-            status=payload["status"],
-            assignee_id=payload["assignee_id"],
-        )
-        apply_resolved_at(issue, payload["status"])
-        db.add(issue)
-        db.flush()
-        if payload["labels"]:
-            labels = get_or_create_labels(db, payload["labels"])
-            issue.labels = labels
-        log_event(db, issue.id, "issue.created", {"status": issue.status, "assignee_id": issue.assignee_id})
-        created_count += 1
 
-    return {
-        "total_rows": len(rows),
-        "created": created_count,
-        "failed": 0,
-        "errors": [],
-    }
+def _upsert_rows(
+    db: Session,
+    rows: list[ParsedRow],
+    user_ids: dict[str, int],
+    labels_by_name: dict,
+    previous_status: dict[str, IssueStatus],
+) -> tuple[int, int]:
+    """Apply changed and new rows with INSERT ... ON CONFLICT (external_id) DO UPDATE.
+
+    The conflict clause only fires when the stored hash differs, so a row that another import
+    already applied is left alone and reported as unchanged by the caller.
+    """
+    if not rows:
+        return 0, 0
+    now = utcnow()
+    done = (IssueStatus.resolved, IssueStatus.closed)
+    stmt = insert(Issue)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Issue.external_id],
+        set_={
+            "title": stmt.excluded.title,
+            "description": stmt.excluded.description,
+            "status": stmt.excluded.status,
+            "assignee_id": stmt.excluded.assignee_id,
+            "import_hash": stmt.excluded.import_hash,
+            "label_ids": stmt.excluded.label_ids,
+            "label_names": stmt.excluded.label_names,
+            # Resolved rows keep an existing resolved_at; rows that reopen the issue clear it.
+            # Plain comparisons rather than IN, whose expanding parameter executemany cannot bind.
+            "resolved_at": case(
+                (
+                    or_(*(stmt.excluded.status == status for status in done)),
+                    func.coalesce(Issue.resolved_at, stmt.excluded.resolved_at),
+                ),
+                else_=None,
+            ),
+            "updated_at": stmt.excluded.updated_at,
+            "version": Issue.version + 1,
+        },
+        where=Issue.import_hash.is_distinct_from(stmt.excluded.import_hash),
+    ).returning(Issue.id, Issue.external_id, literal_column("xmax = 0").label("inserted"))
+    arrays = {row.external_id: label_arrays([labels_by_name[name] for name in row.labels]) for row in rows}
+    values = [
+        {
+            "title": row.title,
+            "description": row.description,
+            "status": row.status,
+            "assignee_id": user_ids.get(row.assignee_email),
+            "external_id": row.external_id,
+            "import_hash": row.content_hash,
+            "label_ids": arrays[row.external_id][0],
+            "label_names": arrays[row.external_id][1],
+            "resolved_at": now if row.status in done else None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for row in rows
+    ]
+
+    by_external_id = {row.external_id: row for row in rows}
+    created = updated = 0
+    updated_ids: list[int] = []
+    label_rows: list[dict] = []
+    events: list[dict] = []
+    transitions: list[tuple[IssueStatus | None, IssueStatus]] = []
+    # executemany: SQLAlchemy batches the rows into multi-row VALUES pages with a cached statement.
+    for issue_id, external_id, inserted in db.execute(stmt, values):
+        row = by_external_id[external_id]
+        label_rows.extend({"issue_id": issue_id, "label_id": labels_by_name[name].id} for name in row.labels)
+        payload = {"status": row.status, "assignee_id": user_ids.get(row.assignee_email)}
+        transitions.append((None if inserted else previous_status.get(external_id), row.status))
+        if inserted:
+            created += 1
+            events.append({"issue_id": issue_id, "event_type": "issue.created", "payload": payload})
+        else:
+            updated += 1
+            updated_ids.append(issue_id)
+            payload["external_id"] = external_id
+            events.append({"issue_id": issue_id, "event_type": "issue.updated", "payload": payload})
+
+    if updated_ids:
+        db.execute(delete(issue_labels).where(issue_labels.c.issue_id.in_(updated_ids)))
+    if label_rows:
+        db.execute(insert(issue_labels), label_rows)
+    insert_events(db, events)
+    record_transitions(db, transitions)
+    return created, updated
+
+
+def import_issues_from_csv(
+    db: Session,
+    content: str,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    validate_only: bool = False,
+    upsert: bool = False,
+) -> dict:
+    """Validate every row, then write them in batches of ``CSV_IMPORT_BATCH_SIZE``, committing each.
+
+    Nothing is written unless every row passes validation. A database failure part-way through
+    leaves the batches already committed in place.
+
+    Validation stops once ``max_errors`` rows have failed; ``total_rows`` then counts only the
+    rows examined. ``truncated`` is set when rows were left unchecked or errors were dropped.
+    With ``validate_only`` nothing is written. With ``upsert`` every row needs an ``external_id``:
+    rows whose content hash matches the stored one, or whose issue is archived, are skipped, the
+    rest are inserted or updated in place.
+    """
+    header, _, body = content.partition("\n")
+    fieldnames = next(csv.reader([header]), None)
+    if fieldnames is None or not REQUIRED_COLUMNS.issubset(set(fieldnames)):
+        errors = [{"row_number": 1, "reason": "Missing required columns"}]
+        return {**_summary(0, 0, errors, False, validate_only), "failed": 0}
+
+    total_rows, parsed_rows, errors, truncated = _validate_rows(fieldnames, body, max_errors)
+
+    user_ids: dict[str, int] = {}
+    existing: dict[str, tuple[str | None, IssueStatus]] = {}
+    archived: set[str] = set()
+    if not truncated:
+        external_ids = list({row.external_id for row in parsed_rows if row.external_id})
+        existing = _existing_issues(db, external_ids)
+        archived = _archived_external_ids(db, [key for key in external_ids if key not in existing])
+        errors.extend(_external_id_errors(parsed_rows, existing.keys() | archived, upsert))
+
+        # Resolve assignees once for the whole file instead of once per row.
+        emails = sorted({row.assignee_email for row in parsed_rows if row.assignee_email})
+        user_ids = {email: user.id for email, user in get_users_by_emails(db, emails).items()}
+        for row in parsed_rows:
+            if row.assignee_email and row.assignee_email not in user_ids:
+                errors.append({"row_number": row.row_number, "reason": "Assignee email not found"})
+
+    if errors or validate_only:
+        errors.sort(key=lambda error: error["row_number"])
+        truncated = truncated or len(errors) > max_errors
+        return _summary(total_rows, 0, errors[:max_errors], truncated, validate_only)
+
+    if upsert:
+        # Archived issues are read-only: their rows are skipped rather than re-created as hot duplicates.
+        pending = [
+            row
+            for row in parsed_rows
+            if row.external_id not in archived
+            and (row.external_id not in existing or existing[row.external_id][0] != row.content_hash)
+        ]
+    else:
+        pending = parsed_rows
+    label_names = list(dict.fromkeys(name for row in pending for name in row.labels))
+    labels_by_name = {label.name: label for label in get_or_create_labels(db, label_names)}
+
+    previous_status = {external_id: status for external_id, (_, status) in existing.items()}
+    batch_size = get_settings().csv_import_batch_size
+    created = updated = 0
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        if upsert:
+            batch_created, batch_updated = _upsert_rows(db, batch, user_ids, labels_by_name, previous_status)
+            updated += batch_updated
+        else:
+            batch_created = _insert_rows(db, batch, user_ids, labels_by_name)
+        created += batch_created
+        # One transaction per batch, so locks and the event backlog stay bounded whatever the file size.
+        db.commit()
+    if not upsert:
+        return _summary(total_rows, created, [], False, validate_only)
+    skipped = sum(row.external_id in archived for row in parsed_rows)
+    unchanged = len(parsed_rows) - created - updated - skipped
+    return _summary(total_rows, created, [], False, validate_only, updated, unchanged, skipped)
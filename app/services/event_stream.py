@@ -0,0 +1,198 @@
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import psycopg
+from starlette.concurrency import run_in_threadpool
+
+from app.db import SessionLocal, engine
+from app.models import IssueEvent
+from app.schemas import IssueEventOut
+from app.services.timeline import (
+    EVENTS_CHANNEL,
+    Cursor,
+    latest_cursor,
+    list_events_after,
+    parse_cursor,
+    settled_horizon,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 1000
+REPLAY_PAGE_SIZE = 500
+KEEPALIVE_SECONDS = 15.0
+_RECONNECT_DELAY_SECONDS = 2.0
+
+
+def _serialize(event: IssueEvent) -> dict:
+    return IssueEventOut.model_validate(event).model_dump(mode="json")
+
+
+def load_events_after(after: Cursor, event_type: str | None = None) -> list[dict]:
+    with SessionLocal() as db:
+        return [_serialize(event) for event in list_events_after(db, after, REPLAY_PAGE_SIZE, event_type)]
+
+
+def load_latest_cursor() -> Cursor:
+    with SessionLocal() as db:
+        return latest_cursor(db)
+
+
+def load_settled(after: Cursor) -> tuple[int, list[dict]]:
+    """``(horizon, events)``: every settled event past ``after``, all of them below ``horizon``."""
+    events: list[dict] = []
+    with SessionLocal() as db:
+        # Read the horizon first: each later statement sees at least as much as it promises.
+        horizon = settled_horizon(db)
+        while page := list_events_after(db, after, REPLAY_PAGE_SIZE):
+            events.extend(_serialize(event) for event in page)
+            after = (page[-1].txid, page[-1].id)
+    return horizon, events
+
+
+class Subscription:
+    """A subscriber's queue of serialized events, fed from the listener thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        # Set when the queue overflowed and events were dropped; the consumer
+        # then catches up from the change feed instead.
+        self.overflowed = False
+
+    def push(self, events: list[dict]) -> None:
+        self.loop.call_soon_threadsafe(self._put, events)
+
+    def _put(self, events: list[dict]) -> None:
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.overflowed = True
+                return
+
+
+class EventBroadcaster:
+    """Fans out committed issue events to SSE subscribers from one LISTEN connection per process.
+
+    Notifications only name the writing transaction; events are read back from the feed and
+    published in cursor order, so a subscriber's last event id is always a safe resume point.
+    """
+
+    def __init__(self) -> None:
+        self._cursor: Cursor | None = None
+        self._subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscription)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="event-listener", daemon=True)
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, events: list[dict]) -> None:
+        if not events:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.push(events)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {EVENTS_CHANNEL}")
+                    # Kept across reconnects, so events committed while disconnected are still published.
+                    if self._cursor is None:
+                        self._cursor = load_latest_cursor()
+                    # Highest notified transaction whose events may still be held back by an older one.
+                    waiting_for: int | None = None
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=1.0, stop_after=1):
+                            waiting_for = max(waiting_for or 0, int(notify.payload))
+                        if waiting_for is None:
+                            continue
+                        horizon, events = load_settled(self._cursor)
+                        if events:
+                            self._cursor = parse_cursor(events[-1]["cursor"])
+                            self.publish(events)
+                        if horizon > waiting_for:
+                            waiting_for = None
+            except Exception:
+                logger.exception("Event listener failed; reconnecting")
+                self._stop.wait(_RECONNECT_DELAY_SECONDS)
+
+
+broadcaster = EventBroadcaster()
+
+
+def format_sse(event: dict) -> str:
+    return f"id: {event['cursor']}\nevent: {event['event_type']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def sse_stream(
+    is_disconnected: Callable[[], Awaitable[bool]],
+    after: Cursor | None,
+    event_type: str | None,
+) -> AsyncIterator[str]:
+    """Replay events after ``after`` from the change feed, then push live events as they settle.
+
+    Replayed and live events share one cursor order, so anything at or before the cursor is a repeat.
+    """
+    subscription = broadcaster.subscribe()
+    try:
+        cursor = after if after is not None else await run_in_threadpool(load_latest_cursor)
+        needs_replay = after is not None
+        while True:
+            if needs_replay or subscription.overflowed:
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    while not subscription.queue.empty():
+                        subscription.queue.get_nowait()
+                while True:
+                    page = await run_in_threadpool(load_events_after, cursor, event_type)
+                    for event in page:
+                        cursor = parse_cursor(event["cursor"])
+                        yield format_sse(event)
+                    if len(page) < REPLAY_PAGE_SIZE:
+                        break
+                needs_replay = False
+
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                if await is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            position = parse_cursor(event["cursor"])
+            if position <= cursor:
+                continue
+            cursor = position
+            if event_type and event["event_type"] != event_type:
+                continue
+            yield format_sse(event)
+    finally:
+        broadcaster.unsubscribe(subscription)
@@ -0,0 +1,78 @@
+import csv
+import json
+from collections.abc import Iterator
+from io import StringIO
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.issues import apply_issue_filters
+from app.enums import IssueStatus
+from app.models import Issue, User
+from app.schemas import IssueListItem
+
+
+EXPORT_COLUMNS = ["title", "description", "status", "assignee_email", "labels"]
+EXPORT_BATCH_SIZE = 1000
+
+
+def _iter_issues(
+    db: Session,
+    status: IssueStatus | None,
+    assignee_id: int | None,
+    label: str | None,
+) -> Iterator[tuple[Issue, str | None]]:
+    stmt = (
+        select(Issue, User.email)
+        .outerjoin(User, Issue.assignee_id == User.id)
+        .order_by(Issue.id.asc())
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    stmt = apply_issue_filters(stmt, status, assignee_id, label)
+    for issue, email in db.execute(stmt):
+        yield issue, email
+
+
+def _csv_line(values: list[str]) -> str:
+    buffer = StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def stream_issues_csv(
+    db: Session,
+    status: IssueStatus | None,
+    assignee_id: int | None,
+    label: str | None,
+) -> Iterator[str]:
+    # The request-scoped session is already closed by the time the response body
+    # is sent, so the stream owns the connection it checks out and releases it here.
+    try:
+        yield _csv_line(EXPORT_COLUMNS)
+        for issue, email in _iter_issues(db, status, assignee_id, label):
+            yield _csv_line(
+                [
+                    issue.title,
+                    issue.description or "",
+                    issue.status.value,
+                    email or "",
+                    ";".join(issue.label_names),
+                ]
+            )
+    finally:
+        db.close()
+
+
+def stream_issues_ndjson(
+    db: Session,
+    status: IssueStatus | None,
+    assignee_id: int | None,
+    label: str | None,
+) -> Iterator[str]:
+    try:
+        for issue, email in _iter_issues(db, status, assignee_id, label):
+            row = IssueListItem.model_validate(issue).model_dump(mode="json")
+            row["assignee_email"] = email
+            yield json.dumps(row) + "\n"
+    finally:
+        db.close()
@@ -0,0 +1,57 @@
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.cache import TTLCache
+from app.config import get_settings
+from app.models import Issue, Label, issue_labels
+from app.schemas import IssueFilter
+from app.services.filters import apply_issue_filter
+
+
+_facet_cache = TTLCache(maxsize=1024, ttl=get_settings().facets_cache_ttl_seconds)
+
+# GROUPING(status, assignee_id, label) bitmask for each grouping set.
+_BY_STATUS = 0b011
+_BY_ASSIGNEE = 0b101
+_BY_LABEL = 0b110
+_TOTAL = 0b111
+
+
+def issue_facets(db: Session, issue_filter: IssueFilter) -> dict:
+    cache_key = issue_filter.model_dump_json()
+    cached = _facet_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    stmt = (
+        select(
+            Issue.status,
+            Issue.assignee_id,
+            Label.name,
+            func.grouping(Issue.status, Issue.assignee_id, Label.name).label("grouping"),
+            func.count(func.distinct(Issue.id)).label("count"),
+        )
+        .select_from(Issue)
+        .outerjoin(issue_labels, issue_labels.c.issue_id == Issue.id)
+        .outerjoin(Label, Label.id == issue_labels.c.label_id)
+        .group_by(
+            func.grouping_sets(tuple_(Issue.status), tuple_(Issue.assignee_id), tuple_(Label.name), tuple_())
+        )
+    )
+    stmt = apply_issue_filter(stmt, issue_filter)
+
+    facets: dict = {"total": 0, "status": [], "assignee_id": [], "label": []}
+    for row in db.execute(stmt):
+        if row.grouping == _TOTAL:
+            facets["total"] = row.count
+        elif row.grouping == _BY_STATUS:
+            facets["status"].append({"value": row.status.value, "count": row.count})
+        elif row.grouping == _BY_ASSIGNEE:
+            facets["assignee_id"].append({"value": row.assignee_id, "count": row.count})
+        elif row.grouping == _BY_LABEL:
+            facets["label"].append({"value": row.name, "count": row.count})
+    for key in ("status", "assignee_id", "label"):
+        facets[key].sort(key=lambda item: (-item["count"], str(item["value"])))
+
+    _facet_cache.set(cache_key, facets)
+    return facets
@@ -0,0 +1,17 @@
+from sqlalchemy import Select
+
+from app.crud.issues import apply_issue_filters
+from app.schemas import IssueFilter
+
+
+def apply_issue_filter(stmt: Select, issue_filter: IssueFilter) -> Select:
+    """Unpack a request's ``IssueFilter`` into ``apply_issue_filters``."""
+    return apply_issue_filters(
+        stmt,
+        issue_filter.status,
+        issue_filter.assignee_id,
+        issue_filter.label,
+        labels=issue_filter.labels,
+        created_from=issue_filter.created_from,
+        created_to=issue_filter.created_to,
+    )
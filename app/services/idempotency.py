@@ -0,0 +1,62 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import IdempotencyKey
+
+
+_PURGE_BATCH_SIZE = 100
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def request_fingerprint(scope: str, body: bytes | dict[str, Any]) -> str:
+    if not isinstance(body, bytes):
+        body = json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    digest = hashlib.sha256(scope.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def lock_and_get(db: Session, key: str) -> IdempotencyKey | None:
+    """Serialize requests sharing ``key`` until commit and return the live stored response, if any."""
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtextextended(key, 0))))
+    record = db.get(IdempotencyKey, key)
+    if record is not None and record.expires_at <= _utcnow():
+        db.delete(record)
+        db.flush()
+        return None
+    return record
+
+
+def store_response(db: Session, key: str, request_hash: str, status_code: int, body: dict | list) -> None:
+    now = _utcnow()
+    ttl = timedelta(seconds=get_settings().idempotency_ttl_seconds)
+    db.add(
+        IdempotencyKey(
+            key=key,
+            request_hash=request_hash,
+            status_code=status_code,
+            response_body=body,
+            created_at=now,
+            expires_at=now + ttl,
+        )
+    )
+    expired = (
+        select(IdempotencyKey.key)
+        .where(IdempotencyKey.expires_at <= now)
+        .limit(_PURGE_BATCH_SIZE)
+        .scalar_subquery()
+    )
+    db.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.key.in_(expired)).execution_options(synchronize_session=False)
+    )
+    db.flush()
@@ -0,0 +1,46 @@
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.crud.issues import delete_issues
+from app.models import Issue
+from app.observability.metrics import ISSUES_DELETED
+from app.schemas import IssueFilter
+from app.services.filters import apply_issue_filter
+from app.services.rollups import record_transitions
+
+
+logger = logging.getLogger("app.purge")
+
+
+def purge_issues(
+    db: Session, issue_filter: IssueFilter, batch_size: int, max_batches: int | None = None, dry_run: bool = False
+) -> dict:
+    """Hard-delete issues matching ``issue_filter`` in batches of ``batch_size``, committing after each.
+
+    The database cascades each batch to comments, events and label links, so a batch is one
+    DELETE statement whose lock time and WAL volume are bounded by ``batch_size``. Issues locked
+    by a concurrent request are skipped and left for the next run.
+    """
+    matching = apply_issue_filter(select(Issue.id), issue_filter)
+    matched = db.scalar(select(func.count()).select_from(matching.subquery())) or 0
+    if dry_run:
+        return {"matched": matched, "deleted": 0, "batches": 0}
+
+    candidates = matching.order_by(Issue.id).limit(batch_size).with_for_update(skip_locked=True)
+    deleted = batches = 0
+    while max_batches is None or batches < max_batches:
+        issue_ids = list(db.scalars(candidates))
+        if not issue_ids:
+            break
+        removed = delete_issues(db, issue_ids)
+        record_transitions(db, [(status, None) for _, status in removed])
+        deleted += len(removed)
+        db.commit()
+        batches += 1
+        ISSUES_DELETED.inc(len(removed))
+        logger.info("purge batch %d: deleted %d of %d matched issues", batches, deleted, matched)
+        if len(issue_ids) < batch_size:
+            break
+    return {"matched": matched, "deleted": deleted, "batches": batches}
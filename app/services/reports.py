@@ -1,7 +1,10 @@
+from datetime import date, timedelta
+
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.models import Issue
+from app.enums import IssueStatus
+from app.models import Issue, IssueDailyStats
 
 
 def top_assignees(db: Session, limit: int) -> list[dict]:
@@ -21,3 +24,47 @@ def average_latency(db: Session) -> dict:
     stmt = select(func.avg(diff_expr), func.count(Issue.id)).where(Issue.resolved_at.is_not(None))
     avg_value, count = db.execute(stmt).one()
     return {"average_seconds": float(avg_value) if avg_value is not None else None, "resolved_count": count}
+
+
+def _days(date_from: date, date_to: date) -> list[date]:
+    return [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
+
+
+def throughput(db: Session, date_from: date, date_to: date) -> list[dict]:
+    """Issues created and resolved per day, read from the daily rollups only."""
+    stmt = (
+        select(IssueDailyStats.day, func.sum(IssueDailyStats.created), func.sum(IssueDailyStats.resolved))
+        .where(IssueDailyStats.day.between(date_from, date_to))
+        .group_by(IssueDailyStats.day)
+    )
+    by_day = {day: (created, resolved) for day, created, resolved in db.execute(stmt)}
+    items = []
+    for day in _days(date_from, date_to):
+        created, resolved = by_day.get(day, (0, 0))
+        items.append({"day": day, "created": created, "resolved": resolved})
+    return items
+
+
+def backlog(db: Session, date_from: date, date_to: date) -> list[dict]:
+    """Issues per status at the end of each day: the running sum of the rollups' net changes."""
+    net = func.sum(IssueDailyStats.net_change)
+    opening = (
+        select(IssueDailyStats.status, net).where(IssueDailyStats.day < date_from).group_by(IssueDailyStats.status)
+    )
+    counts = {status: 0 for status in IssueStatus}
+    counts.update(db.execute(opening).tuples().all())
+    changes = (
+        select(IssueDailyStats.day, IssueDailyStats.status, net)
+        .where(IssueDailyStats.day.between(date_from, date_to))
+        .group_by(IssueDailyStats.day, IssueDailyStats.status)
+    )
+    by_day: dict[date, list[tuple[IssueStatus, int]]] = {}
+    for day, status, change in db.execute(changes):
+        by_day.setdefault(day, []).append((status, change))
+
+    items = []
+    for day in _days(date_from, date_to):
+        for status, change in by_day.get(day, []):
+            counts[status] += change
+        items.append({"day": day, "counts": {status.value: count for status, count in counts.items()}})
+    return items
@@ -0,0 +1,128 @@
+"""Daily rollups of issue creation, resolution and status changes.
+
+Run ``python -m app.services.rollups`` to rebuild the rollups from the issue event history.
+"""
+
+import argparse
+import random
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.enums import IssueStatus
+from app.models import IssueDailyStats
+
+
+ROLLUP_SHARDS = 8
+_DONE = (IssueStatus.resolved, IssueStatus.closed)
+
+# (status before, status after); None before means the issue was created, None after that it was deleted.
+Transition = tuple[IssueStatus | None, IssueStatus | None]
+
+
+def record_transitions(db: Session, transitions: Iterable[Transition]) -> None:
+    """Add status transitions that happen in this transaction to today's rollup rows."""
+    counts: dict[IssueStatus, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for before, after in transitions:
+        if before == after:
+            continue
+        if after is not None:
+            counts[after][0] += int(before is None)
+            counts[after][1] += int(after in _DONE and before not in _DONE)
+            counts[after][2] += 1
+        if before is not None:
+            counts[before][2] -= 1
+    day = datetime.now(timezone.utc).date()
+    shard = random.randrange(ROLLUP_SHARDS)
+    # A fixed row order keeps two transactions from locking the same rows in opposite orders.
+    rows = [
+        {"day": day, "status": status, "shard": shard, "created": c, "resolved": r, "net_change": n}
+        for status, (c, r, n) in sorted(counts.items(), key=lambda item: item[0].value)
+        if c or r or n
+    ]
+    if not rows:
+        return
+    stmt = insert(IssueDailyStats).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[IssueDailyStats.day, IssueDailyStats.status, IssueDailyStats.shard],
+        set_={
+            "created": IssueDailyStats.created + stmt.excluded.created,
+            "resolved": IssueDailyStats.resolved + stmt.excluded.resolved,
+            "net_change": IssueDailyStats.net_change + stmt.excluded.net_change,
+        },
+    )
+    db.execute(stmt)
+
+
+# Replays every status-carrying event, hot and archived, in id order per issue: the first one
+# creates the issue in its status, each later one that changes the status moves it.
+_REBUILD = text(
+    """
+    WITH events AS (
+        SELECT id, issue_id, created_at, payload->>'status' AS status
+        FROM issue_events
+        WHERE event_type IN ('issue.created', 'issue.updated', 'bulk.status', 'bulk.update')
+          AND payload->>'status' IS NOT NULL
+        UNION ALL
+        SELECT id, issue_id, created_at, payload->>'status'
+        FROM archived_issue_events
+        WHERE event_type IN ('issue.created', 'issue.updated', 'bulk.status', 'bulk.update')
+          AND payload->>'status' IS NOT NULL
+    ),
+    steps AS (
+        SELECT (created_at AT TIME ZONE 'UTC')::date AS day,
+               status,
+               lag(status) OVER (PARTITION BY issue_id ORDER BY id) AS previous
+        FROM events
+    ),
+    moves AS (
+        SELECT day,
+               status,
+               (previous IS NULL)::int AS created,
+               (status IN ('RESOLVED', 'CLOSED')
+                AND (previous IS NULL OR previous NOT IN ('RESOLVED', 'CLOSED')))::int AS resolved,
+               1 AS net_change
+        FROM steps
+        WHERE previous IS DISTINCT FROM status
+        UNION ALL
+        SELECT day, previous, 0, 0, -1
+        FROM steps
+        WHERE previous IS NOT NULL AND previous <> status
+    )
+    INSERT INTO issue_daily_stats (day, status, shard, created, resolved, net_change)
+    SELECT day, status::issue_status, 0, sum(created), sum(resolved), sum(net_change)
+    FROM moves
+    GROUP BY day, status
+    """
+)
+
+
+def rebuild_rollups(db: Session) -> int:
+    """Recompute every rollup row from the event history; returns the number of rows written.
+
+    Writers are held off with a table lock until commit: transitions committed before the lock
+    are in the replayed events, and those committed after it are added on top of the rebuild.
+    Issues that were deleted take their events with them and drop out of the history.
+    """
+    db.execute(text("LOCK TABLE issue_daily_stats IN EXCLUSIVE MODE"))
+    db.execute(delete(IssueDailyStats))
+    return db.execute(_REBUILD).rowcount
+
+
+def main() -> None:
+    from app.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+    with SessionLocal() as db:
+        rows = rebuild_rollups(db)
+        db.commit()
+    print(f"rebuilt {rows} rollup rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,104 @@
-from sqlalchemy import select
+from sqlalchemy import BigInteger, Text, cast, func, insert, or_, select, tuple_
 from sqlalchemy.orm import Session
 
-from app.models import IssueEvent
+from app.models import ArchivedIssueEvent, IssueEvent
 
 
-def log_event(db: Session, issue_id: int, event_type: str, payload: dict | None = None) -> IssueEvent:
+EVENTS_CHANNEL = "issue_events"
+
+# A change feed position: (writing transaction id, event id).
+Cursor = tuple[int, int]
+FEED_START: Cursor = (0, 0)
+
+
+def format_cursor(cursor: Cursor) -> str:
+    return f"{cursor[0]}-{cursor[1]}"
+
+
+def parse_cursor(value: str) -> Cursor:
+    """Parse the ``"<txid>-<id>"`` form of ``IssueEvent.cursor``; raises ``ValueError`` otherwise."""
+    txid, separator, event_id = value.partition("-")
+    if not separator or not txid.isdigit() or not event_id.isdigit():
+        raise ValueError(f"Invalid event cursor: {value!r}")
+    return int(txid), int(event_id)
+
+
+def notify_events(db: Session, event_ids: list[int]) -> None:
+    """Queue a NOTIFY carrying the writing transaction id; PostgreSQL delivers it on commit.
+
+    Listeners read the events back from the feed in commit-safe order, so the payload only
+    tells them which transaction to wait for. Repeats within a transaction are folded into one.
+    """
+    if event_ids:
+        db.execute(select(func.pg_notify(EVENTS_CHANNEL, cast(func.pg_current_xact_id(), Text))))
+
+
+def log_event(
+    db: Session, issue_id: int, event_type: str, payload: dict | None = None, notify: bool = True
+) -> IssueEvent:
     event = IssueEvent(issue_id=issue_id, event_type=event_type, payload=payload)
     db.add(event)
     db.flush()
+    if notify:
+        notify_events(db, [event.id])
     return event
 
 
-def get_timeline(db: Session, issue_id: int) -> list[IssueEvent]:
-    stmt = select(IssueEvent).where(IssueEvent.issue_id == issue_id).order_by(IssueEvent.created_at.asc())
+def insert_events(db: Session, rows: list[dict]) -> list[int]:
+    """Insert ``{issue_id, event_type, payload}`` rows in one multi-row statement and notify listeners."""
+    if not rows:
+        return []
+    event_ids = list(db.scalars(insert(IssueEvent).returning(IssueEvent.id), rows))
+    notify_events(db, event_ids)
+    return event_ids
+
+
+def log_events(db: Session, issue_ids: list[int], event_type: str, payload: dict | None = None) -> list[int]:
+    """Insert one event per issue, all sharing ``payload``."""
+    return insert_events(
+        db, [{"issue_id": issue_id, "event_type": event_type, "payload": payload} for issue_id in issue_ids]
+    )
+
+
+def get_timeline(db: Session, issue_id: int, archived: bool = False) -> list[IssueEvent | ArchivedIssueEvent]:
+    model = ArchivedIssueEvent if archived else IssueEvent
+    stmt = select(model).where(model.issue_id == issue_id).order_by(model.created_at.asc())
+    return list(db.scalars(stmt))
+
+
+def _as_bigint(xid8):
+    return cast(cast(xid8, Text), BigInteger)
+
+
+def _horizon():
+    return _as_bigint(func.pg_snapshot_xmin(func.pg_current_snapshot()))
+
+
+def _settled():
+    """Events written by transactions older than every one still running, plus the caller's own.
+
+    No event can later commit behind such an event in (txid, id) order. Ids alone are not
+    enough: a transaction can take a lower id and commit after one holding a higher id.
+    """
+    own = _as_bigint(func.pg_current_xact_id_if_assigned())
+    return or_(IssueEvent.txid < _horizon(), IssueEvent.txid == own)
+
+
+def settled_horizon(db: Session) -> int:
+    """Every transaction below this id has finished, so its events are all in the feed."""
+    return db.scalar(select(_horizon()))
+
+
+def latest_cursor(db: Session) -> Cursor:
+    stmt = select(IssueEvent.txid, IssueEvent.id).where(_settled())
+    row = db.execute(stmt.order_by(IssueEvent.txid.desc(), IssueEvent.id.desc()).limit(1)).first()
+    return (row.txid, row.id) if row else FEED_START
+
+
+def list_events_after(db: Session, after: Cursor, limit: int, event_type: str | None = None) -> list[IssueEvent]:
+    """Events past ``after`` in commit order: by writing transaction, then id, settled ones only."""
+    stmt = select(IssueEvent).where(tuple_(IssueEvent.txid, IssueEvent.id) > tuple_(*after), _settled())
+    if event_type:
+        stmt = stmt.where(IssueEvent.event_type == event_type)
+    stmt = stmt.order_by(IssueEvent.txid.asc(), IssueEvent.id.asc()).limit(limit)
     return list(db.scalars(stmt))
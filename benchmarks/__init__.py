@@ -0,0 +1 @@
+"""Benchmarks: dataset seeder and scenario runner."""
@@ -0,0 +1,254 @@
+"""Concurrent HTTP load test against a locally started server.
+
+    python -m benchmarks.load --concurrency 1 --concurrency 16 --concurrency 64 --duration 30 --json load.json
+    python -m benchmarks.load --url http://127.0.0.1:8000 --concurrency 32 --compare load.json
+
+Starts ``app.main:app`` under uvicorn (unless ``--url`` is given) against the
+database in ``DATABASE_URL`` and drives a weighted mix of reads and writes from
+an asyncio client at each concurrency level. Writes are committed, so point it
+at a dedicated database seeded with ``python -m benchmarks.seed``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+
+import httpx
+
+from benchmarks.run import Fixture, percentile
+
+
+Operation = Callable[[httpx.AsyncClient, Fixture], Awaitable[int]]
+
+
+async def _list_issues(client: httpx.AsyncClient, fixture: Fixture) -> int:
+    params = fixture.rng.choice(
+        [{}, {"status": "OPEN"}, {"assignee_id": fixture.hot_assignee_id}, {"label": fixture.hot_label}]
+    )
+    return (await client.get("/issues", params=params)).status_code
+
+
+async def _get_issue(client: httpx.AsyncClient, fixture: Fixture) -> int:
+    return (await client.get(f"/issues/{fixture.issue_id()}")).status_code
+
+
+async def _patch_issue(client: httpx.AsyncClient, fixture: Fixture) -> int:
+    # Concentrate on a small id range so concurrent workers race on versions.
+    issue_id = fixture.rng.choice(fixture.issue_ids[:200])
+    current = await client.get(f"/issues/{issue_id}")
+    if current.status_code != 200:
+        return current.status_code
+    payload = {"title": f"Load {fixture.rng.random():.6f}", "version": current.json()["version"]}
+    return (await client.patch(f"/issues/{issue_id}", json=payload)).status_code
+
+
+async def _add_comment(client: httpx.AsyncClient, fixture: Fixture) -> int:
+    payload = {"body": "Load test comment", "author_id": fixture.user_id()}
+    return (await client.post(f"/issues/{fixture.issue_id()}/comments", json=payload)).status_code
+
+
+async def _bulk_status(client: httpx.AsyncClient, fixture: Fixture) -> int:
+    # OPEN <-> IN_PROGRESS never violates the bulk rules, so the mix stays repeatable.
+    payload = {"issue_ids": fixture.open_sample(50), "new_status": fixture.rng.choice(["OPEN", "IN_PROGRESS"])}
+    return (await client.post("/issues/bulk-status", json=payload)).status_code
+
+
+async def _import_csv(client: httpx.AsyncClient, fixture: Fixture) -> int:
+    files = {"file": ("load.csv", fixture.import_csv(100), "text/csv")}
+    return (await client.post("/issues/import", files=files)).status_code
+
+
+OPERATIONS: dict[str, tuple[Operation, float]] = {
+    "list_issues": (_list_issues, 0.35),
+    "get_issue": (_get_issue, 0.30),
+    "patch_issue": (_patch_issue, 0.15),
+    "add_comment": (_add_comment, 0.12),
+    "bulk_status": (_bulk_status, 0.05),
+    "import_csv": (_import_csv, 0.03),
+}
+
+
+@dataclass
+class OperationStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    ok: int = 0
+    conflicts: int = 0
+    shed: int = 0
+    client_errors: int = 0
+    server_errors: int = 0
+
+    def record(self, elapsed_ms: float, status_code: int | None) -> None:
+        self.latencies_ms.append(elapsed_ms)
+        if status_code == 503:
+            self.shed += 1
+        elif status_code is None or status_code >= 500:
+            self.server_errors += 1
+        elif status_code == 409:
+            self.conflicts += 1
+        elif status_code >= 400:
+            self.client_errors += 1
+        else:
+            self.ok += 1
+
+
+@dataclass
+class LevelResult:
+    concurrency: int
+    duration_s: float
+    requests: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    conflicts: int
+    shed: int
+    client_errors: int
+    server_errors: int
+    operations: dict[str, dict]
+
+
+async def _worker(client: httpx.AsyncClient, fixture: Fixture, deadline: float, stats: dict[str, OperationStats]):
+    names = list(OPERATIONS)
+    weights = [weight for _, weight in OPERATIONS.values()]
+    while time.perf_counter() < deadline:
+        name = fixture.rng.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            status_code: int | None = await OPERATIONS[name][0](client, fixture)
+        except httpx.HTTPError:
+            status_code = None
+        stats[name].record((time.perf_counter() - started) * 1000, status_code)
+
+
+async def run_level(base_url: str, fixture: Fixture, concurrency: int, duration: float) -> LevelResult:
+    stats = {name: OperationStats() for name in OPERATIONS}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(_worker(client, fixture, deadline, stats) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies = [value for op in stats.values() for value in op.latencies_ms]
+    operations = {
+        name: {
+            "requests": len(op.latencies_ms),
+            "p50_ms": round(statistics.median(op.latencies_ms), 2) if op.latencies_ms else None,
+            "p99_ms": round(percentile(op.latencies_ms, 99), 2) if op.latencies_ms else None,
+            "conflicts": op.conflicts,
+            "shed": op.shed,
+            "client_errors": op.client_errors,
+            "server_errors": op.server_errors,
+        }
+        for name, op in stats.items()
+    }
+    return LevelResult(
+        concurrency=concurrency,
+        duration_s=round(elapsed, 2),
+        requests=len(latencies),
+        throughput_rps=round(len(latencies) / elapsed, 1),
+        p50_ms=round(statistics.median(latencies), 2) if latencies else 0.0,
+        p95_ms=round(percentile(latencies, 95), 2) if latencies else 0.0,
+        p99_ms=round(percentile(latencies, 99), 2) if latencies else 0.0,
+        conflicts=sum(op.conflicts for op in stats.values()),
+        shed=sum(op.shed for op in stats.values()),
+        client_errors=sum(op.client_errors for op in stats.values()),
+        server_errors=sum(op.server_errors for op in stats.values()),
+        operations=operations,
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+    ]
+    process = subprocess.Popen(command, env=os.environ.copy())
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit("uvicorn exited during startup")
+        try:
+            if httpx.get(f"{base_url}/issues", params={"limit": 1}, timeout=1).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    sys.exit("uvicorn did not become ready within 30s")
+
+
+def _print_report(results: list[LevelResult], baseline: dict[int, dict] | None) -> None:
+    header = f"{'conc':>5}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    header += f"{'409s':>7}{'503s':>7}{'4xx':>6}{'5xx':>6}"
+    if baseline:
+        header += f"{'req/s delta':>13}{'p99 delta':>11}"
+    print(header)
+    for result in results:
+        line = (
+            f"{result.concurrency:>5}{result.throughput_rps:>10.1f}{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}"
+            f"{result.p99_ms:>10.2f}{result.conflicts:>7}{result.shed:>7}"
+            f"{result.client_errors:>6}{result.server_errors:>6}"
+        )
+        previous = (baseline or {}).get(result.concurrency)
+        if previous:
+            rps_change = (result.throughput_rps / previous["throughput_rps"] - 1) * 100
+            p99_change = (result.p99_ms / previous["p99_ms"] - 1) * 100 if previous["p99_ms"] else 0.0
+            line += f"{rps_change:>+12.1f}%{p99_change:>+10.1f}%"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, action="append", help="concurrency level (repeatable)")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per concurrency level")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--url", help="target an already running server instead of starting one")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON file from a previous run")
+    args = parser.parse_args()
+
+    fixture = Fixture(random.Random(args.seed))
+    process = None
+    base_url = args.url
+    if base_url is None:
+        process, base_url = start_server(args.workers)
+    try:
+        results = [
+            asyncio.run(run_level(base_url, fixture, concurrency, args.duration))
+            for concurrency in args.concurrency or [1, 8, 32]
+        ]
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = {row["concurrency"]: row for row in json.load(handle)["results"]}
+    _print_report(results, baseline)
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump({"workers": args.workers, "results": [asdict(result) for result in results]}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Run request-level benchmark scenarios against a seeded database.
+
+    python -m benchmarks.run --iterations 200 --json bench.json
+    python -m benchmarks.run --scenario list_issues_label --compare bench.json
+
+Each request goes through the full FastAPI stack in-process. Every request runs
+inside an outer transaction that is rolled back afterwards, so write scenarios
+do not drift the dataset between runs and results stay comparable.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db import engine, get_db
+from app.enums import IssueStatus
+from app.main import app
+from app.models import Issue, Label, User, issue_labels
+
+
+Request = tuple[str, str, dict]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    queries_per_request: float
+    errors: int
+
+
+class QueryCounter:
+    """Counts statements issued by the app, ignoring the harness's savepoint bookkeeping."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            self.count += 1
+
+
+class Fixture:
+    """Parameters picked from the seeded data so scenarios hit realistic rows."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+        with Session(engine) as db:
+            self.issue_count = db.scalar(select(func.count(Issue.id))) or 0
+            # Sample real ids: rolled-back imports leave gaps in the id sequence.
+            self.issue_ids = list(db.scalars(select(Issue.id).order_by(func.random()).limit(10_000)))
+            self.hot_assignee_id = db.scalar(
+                select(Issue.assignee_id)
+                .where(Issue.assignee_id.is_not(None))
+                .group_by(Issue.assignee_id)
+                .order_by(func.count().desc())
+                .limit(1)
+            )
+            self.hot_label = db.scalar(
+                select(Label.name).join(issue_labels).group_by(Label.name).order_by(func.count().desc()).limit(1)
+            )
+            self.emails = list(db.scalars(select(User.email).limit(50)))
+            self.max_user_id = db.scalar(select(func.max(User.id))) or 0
+            self.open_ids = list(db.scalars(select(Issue.id).where(Issue.status == IssueStatus.open).limit(5000)))
+        if not self.issue_count:
+            sys.exit("Database has no issues; run `python -m benchmarks.seed` first.")
+
+    def issue_id(self) -> int:
+        return self.rng.choice(self.issue_ids)
+
+    def user_id(self) -> int:
+        return self.rng.randint(1, self.max_user_id)
+
+    def open_sample(self, size: int) -> list[int]:
+        return self.rng.sample(self.open_ids, min(size, len(self.open_ids)))
+
+    def import_csv(self, rows: int) -> str:
+        lines = ["title,description,status,assignee_email,labels"]
+        for idx in range(rows):
+            email = self.rng.choice(self.emails) if self.emails else ""
+            lines.append(f"Imported {idx},Bench import,OPEN,{email},{self.hot_label or ''};bench-import")
+        return "\n".join(lines) + "\n"
+
+
+def _patch_request(client: TestClient, fixture: Fixture) -> Request:
+    issue_id = fixture.issue_id()
+    version = client.get(f"/issues/{issue_id}").json().get("version", 1)
+    return "PATCH", f"/issues/{issue_id}", {"json": {"title": "Benchmarked", "version": version}}
+
+
+def scenarios(fixture: Fixture) -> dict[str, Callable[[TestClient], Request]]:
+    return {
+        "list_issues": lambda client: ("GET", "/issues", {}),
+        "list_issues_filtered": lambda client: (
+            "GET",
+            "/issues",
+            {"params": {"status": "OPEN", "assignee_id": fixture.hot_assignee_id}},
+        ),
+        "list_issues_deep_offset": lambda client: (
+            "GET",
+            "/issues",
+            {"params": {"offset": fixture.issue_count // 2, "limit": 50}},
+        ),
+        "list_issues_label": lambda client: ("GET", "/issues", {"params": {"label": fixture.hot_label}}),
+        "get_issue": lambda client: ("GET", f"/issues/{fixture.issue_id()}", {}),
+        "patch_issue": lambda client: _patch_request(client, fixture),
+        "bulk_update_status": lambda client: (
+            "POST",
+            "/issues/bulk-status",
+            {"json": {"issue_ids": fixture.open_sample(100), "new_status": "IN_PROGRESS"}},
+        ),
+        "import_csv": lambda client: (
+            "POST",
+            "/issues/import",
+            {"files": {"file": ("bench.csv", fixture.import_csv(500), "text/csv")}},
+        ),
+        "report_top_assignees": lambda client: ("GET", "/reports/top-assignees", {}),
+        "report_latency": lambda client: ("GET", "/reports/latency", {}),
+    }
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_scenario(
+    client: TestClient, name: str, build: Callable[[TestClient], Request], iterations: int, warmup: int
+) -> ScenarioResult:
+    counter = QueryCounter()
+    timings: list[float] = []
+    queries: list[int] = []
+    errors = 0
+
+    for iteration in range(warmup + iterations):
+        connection = engine.connect()
+        transaction = connection.begin()
+        session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")()
+
+        def _override_get_db():
+            yield session
+
+        app.dependency_overrides[get_db] = _override_get_db
+        try:
+            method, url, kwargs = build(client)
+            event.listen(engine, "before_cursor_execute", counter)
+            counter.count = 0
+            started = time.perf_counter()
+            response = client.request(method, url, **kwargs)
+            elapsed = time.perf_counter() - started
+            event.remove(engine, "before_cursor_execute", counter)
+        finally:
+            app.dependency_overrides.clear()
+            session.close()
+            transaction.rollback()
+            connection.close()
+
+        if iteration < warmup:
+            continue
+        timings.append(elapsed * 1000)
+        queries.append(counter.count)
+        if response.status_code >= 400:
+            errors += 1
+
+    return ScenarioResult(
+        name=name,
+        iterations=iterations,
+        p50_ms=round(statistics.median(timings), 2),
+        p95_ms=round(percentile(timings, 95), 2),
+        p99_ms=round(percentile(timings, 99), 2),
+        max_ms=round(max(timings), 2),
+        queries_per_request=round(statistics.mean(queries), 2),
+        errors=errors,
+    )
+
+
+def _print_report(results: list[ScenarioResult], baseline: dict[str, dict] | None) -> None:
+    header = f"{'scenario':<26}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'queries':>9}{'errors':>8}"
+    if baseline:
+        header += f"{'p95 delta':>11}"
+    print(header)
+    for result in results:
+        line = (
+            f"{result.name:<26}{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{result.p99_ms:>10.2f}"
+            f"{result.max_ms:>10.2f}{result.queries_per_request:>9.1f}{result.errors:>8}"
+        )
+        if baseline and result.name in baseline:
+            previous = baseline[result.name]["p95_ms"]
+            change = (result.p95_ms - previous) / previous * 100 if previous else 0.0
+            line += f"{change:>+10.1f}%"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--scenario", action="append", help="run only these scenarios (repeatable)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON file from a previous run")
+    args = parser.parse_args()
+
+    fixture = Fixture(random.Random(args.seed))
+    available = scenarios(fixture)
+    selected = args.scenario or list(available)
+    unknown = [name for name in selected if name not in available]
+    if unknown:
+        sys.exit(f"Unknown scenario(s): {', '.join(unknown)}. Available: {', '.join(available)}")
+
+    with TestClient(app) as client:
+        results = [run_scenario(client, name, available[name], args.iterations, args.warmup) for name in selected]
+    baseline = None
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = {row["name"]: row for row in json.load(handle)["results"]}
+    _print_report(results, baseline)
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump({"results": [asdict(result) for result in results]}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Seed a large, skewed dataset for benchmarking.
+
+    python -m benchmarks.seed --users 2000 --issues 200000 --labels 300 --comments 600000 --truncate
+
+Rows are generated deterministically from ``--seed`` and loaded with ``COPY``; the daily
+rollups behind the throughput and backlog reports are then rebuilt from the seeded events.
+Assignees and labels follow a Zipf-like distribution so a few users and labels
+dominate, like a real tracker; creation dates are biased towards recent months.
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.db import engine
+from app.models import Base
+from app.services.rollups import rebuild_rollups
+
+
+STATUSES = ["OPEN", "IN_PROGRESS", "RESOLVED", "CLOSED"]
+STATUS_WEIGHTS = [0.25, 0.15, 0.15, 0.45]
+WINDOW_DAYS = 730
+ISSUE_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "status",
+    "assignee_id",
+    "created_at",
+    "updated_at",
+    "resolved_at",
+    "version",
+    "label_ids",
+    "label_names",
+]
+
+
+def _zipf_weights(n: int, exponent: float) -> list[float]:
+    return [1.0 / (rank**exponent) for rank in range(1, n + 1)]
+
+
+def _created_at(rng: random.Random, now: datetime) -> datetime:
+    # Squaring a uniform sample skews ages towards zero, i.e. recent issues.
+    age_days = (rng.random() ** 2) * WINDOW_DAYS
+    return now - timedelta(days=age_days)
+
+
+def _copy(cursor, table: str, columns: list[str], rows) -> int:
+    count = 0
+    with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
+
+
+def seed(
+    users: int,
+    issues: int,
+    labels: int,
+    comments: int,
+    seed_value: int,
+    truncate: bool,
+    unassigned_ratio: float = 0.1,
+) -> dict[str, int]:
+    rng = random.Random(seed_value)
+    now = datetime.now(timezone.utc)
+    user_ids = list(range(1, users + 1))
+    label_ids = list(range(1, labels + 1))
+    assignee_weights = _zipf_weights(users, 1.1)
+    label_weights = _zipf_weights(labels, 1.2)
+    counts: dict[str, int] = {}
+
+    Base.metadata.create_all(bind=engine)
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if truncate:
+            cursor.execute(
+                "TRUNCATE issue_events, comments, issue_labels, issues, labels, users RESTART IDENTITY CASCADE"
+            )
+
+        counts["users"] = _copy(
+            cursor,
+            "users",
+            ["id", "name", "email"],
+            ((user_id, f"User {user_id}", f"user{user_id}@bench.example.com") for user_id in user_ids),
+        )
+        counts["labels"] = _copy(
+            cursor, "labels", ["id", "name"], ((label_id, f"label-{label_id}") for label_id in label_ids)
+        )
+
+        issue_rows = []
+        label_rows = []
+        event_rows = []
+        for issue_id in range(1, issues + 1):
+            created_at = _created_at(rng, now)
+            status = rng.choices(STATUSES, STATUS_WEIGHTS)[0]
+            assignee_id = None
+            if rng.random() >= unassigned_ratio or status in ("RESOLVED", "CLOSED"):
+                assignee_id = rng.choices(user_ids, assignee_weights)[0]
+            resolved_at = None
+            if status in ("RESOLVED", "CLOSED"):
+                resolved_at = min(now, created_at + timedelta(hours=rng.expovariate(1 / 72)))
+            updated_at = resolved_at or created_at
+            # The denormalized arrays follow the label names in order, as the app writes them.
+            issue_labels = sorted(
+                set(rng.choices(label_ids, label_weights, k=rng.choice([0, 1, 1, 2, 2, 3, 4]))),
+                key=lambda label_id: f"label-{label_id}",
+            )
+            label_rows.extend((issue_id, label_id) for label_id in issue_labels)
+            issue_rows.append(
+                (
+                    issue_id,
+                    f"Issue {issue_id}",
+                    f"Benchmark issue {issue_id}",
+                    status,
+                    assignee_id,
+                    created_at,
+                    updated_at,
+                    resolved_at,
+                    1,
+                    issue_labels,
+                    [f"label-{label_id}" for label_id in issue_labels],
+                )
+            )
+            event_rows.append(
+                (issue_id, "issue.created", json.dumps({"status": "OPEN", "assignee_id": assignee_id}), created_at)
+            )
+            if status != "OPEN":
+                event_rows.append((issue_id, "issue.updated", json.dumps({"status": status}), updated_at))
+
+        counts["issues"] = _copy(cursor, "issues", ISSUE_COLUMNS, issue_rows)
+        counts["issue_labels"] = _copy(cursor, "issue_labels", ["issue_id", "label_id"], label_rows)
+
+        # Comment volume per issue is heavy-tailed: most issues get a few, some get many.
+        issue_weights = [rng.paretovariate(1.5) for _ in range(issues)]
+        commented = rng.choices(range(1, issues + 1), issue_weights, k=comments) if issues else []
+        created_by_issue = {row[0]: row[5] for row in issue_rows}
+        counts["comments"] = _copy(
+            cursor,
+            "comments",
+            ["issue_id", "author_id", "body", "created_at"],
+            (
+                (
+                    issue_id,
+                    rng.choices(user_ids, assignee_weights)[0],
+                    f"Comment on {issue_id}",
+                    created_by_issue[issue_id] + timedelta(hours=rng.expovariate(1 / 24)),
+                )
+                for issue_id in commented
+            ),
+        )
+        counts["issue_events"] = _copy(
+            cursor, "issue_events", ["issue_id", "event_type", "payload", "created_at"], event_rows
+        )
+
+        for table in ("users", "labels", "issues"):
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), coalesce(max(id), 0) + 1, false) FROM {table}"
+            )
+        cursor.execute("ANALYZE")
+        raw.commit()
+    finally:
+        raw.close()
+
+    with Session(engine) as db:
+        counts["issue_daily_stats"] = rebuild_rollups(db)
+        db.commit()
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--issues", type=int, default=100_000)
+    parser.add_argument("--labels", type=int, default=200)
+    parser.add_argument("--comments", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--truncate", action="store_true", help="empty all tables before seeding")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = seed(args.users, args.issues, args.labels, args.comments, args.seed, args.truncate)
+    elapsed = time.perf_counter() - started
+    for table, count in counts.items():
+        print(f"{table:>17}: {count}")
+    print(f"seeded in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
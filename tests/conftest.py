@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.crud.users import clear_user_cache
 from app.db import get_db
 from app.main import app
 from app.models import Base
@@ -24,11 +25,20 @@ def setup_database():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Each test rolls its data back, so users cached by one test must not leak into the next.
+    clear_user_cache()
+    yield
+    clear_user_cache()
+
+
 @pytest.fixture()
 def db_session():
     connection = engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    # Route-level rollbacks only undo a savepoint, leaving the outer test transaction intact.
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+from app.admission import AdmissionMiddleware, route_class
+from app.config import get_settings
+
+
+def test_route_classes():
+    assert route_class("GET", "/issues/12") == "reads"
+    assert route_class("PATCH", "/issues/12") == "writes"
+    assert route_class("POST", "/issues/import") == "bulk"
+    assert route_class("POST", "/issues/bulk-status") == "bulk"
+    assert route_class("POST", "/admin/archive") == "bulk"
+    assert route_class("GET", "/reports/latency") == "reports"
+    assert route_class("GET", "/admin/slow-queries") is None
+    assert route_class("GET", "/metrics") is None
+    assert route_class("GET", "/events/stream") is None
+
+
+async def _call(app, method: str, path: str) -> tuple[int, dict, dict]:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app({"type": "http", "method": method, "path": path, "headers": []}, receive, send)
+    headers = {key.decode(): value.decode() for key, value in messages[0].get("headers", [])}
+    body = json.loads(messages[1]["body"]) if messages[1].get("body") else {}
+    return messages[0]["status"], headers, body
+
+
+def test_saturated_bulk_class_sheds_without_blocking_reads(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "admission_bulk_limit", 1)
+    monkeypatch.setattr(settings, "admission_bulk_queue", 1)
+    monkeypatch.setattr(settings, "admission_queue_timeout_ms", 50)
+    release = asyncio.Event()
+
+    async def downstream(scope, receive, send):
+        if scope["path"] == "/issues/import":
+            await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    app = AdmissionMiddleware(downstream)
+
+    async def scenario():
+        running = asyncio.create_task(_call(app, "POST", "/issues/import"))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(_call(app, "POST", "/issues/import"))
+        await asyncio.sleep(0.01)
+        # Slot busy and queue full: shed immediately.
+        shed = await _call(app, "POST", "/issues/bulk-status")
+        read = await _call(app, "GET", "/issues/1")
+        # The queued request gives up after the queue timeout.
+        timed_out = await queued
+        release.set()
+        return await running, timed_out, shed, read
+
+    running, timed_out, shed, read = asyncio.run(scenario())
+    assert running[0] == 200
+    assert read[0] == 200
+    for status_code, headers, body in (shed, timed_out):
+        assert status_code == 503
+        assert headers["retry-after"] == "1"
+        assert body["error"]["code"] == "OVERLOADED"
+        assert body["error"]["details"] == {"route_class": "bulk"}
+
+
+def test_requests_pass_through_when_capacity_frees_up(client):
+    for _ in range(5):
+        assert client.post("/issues", json={"title": "Admitted"}).status_code == 201
+    assert client.get("/issues").status_code == 200
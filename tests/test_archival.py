@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.config import get_settings
+from app.crud.users import create_user
+from app.models import Issue
+
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def admin_token(monkeypatch):
+    monkeypatch.setattr(get_settings(), "admin_token", "secret")
+
+
+def _issue(client, title: str, status: str, labels: list[str]) -> int:
+    issue_id = client.post("/issues", json={"title": title, "status": status}).json()["id"]
+    client.put(f"/issues/{issue_id}/labels", json={"labels": labels})
+    return issue_id
+
+
+def test_archive_moves_old_closed_issues(client, db_session):
+    author = create_user(db_session, "Archivist", "archivist@example.com")
+    db_session.commit()
+    old = _issue(client, "Old and closed", "CLOSED", ["bug"])
+    client.post(f"/issues/{old}/comments", json={"body": "Done long ago", "author_id": author.id})
+    recent = _issue(client, "Recently closed", "CLOSED", ["bug"])
+    still_open = _issue(client, "Still open", "OPEN", ["bug"])
+    long_ago = datetime.now(timezone.utc) - timedelta(days=400)
+    db_session.execute(update(Issue).where(Issue.id == old).values(resolved_at=long_ago, updated_at=long_ago))
+    db_session.commit()
+
+    response = client.post("/admin/archive", params={"older_than_days": 90, "batch_size": 1}, headers=ADMIN)
+    assert response.status_code == 200
+    assert response.json()["archived"] == 1
+    assert db_session.get(Issue, old) is None
+
+    # The hot list no longer sees it; include_archived brings it back.
+    hot = client.get("/issues", params={"label": "bug"}).json()
+    assert {item["id"] for item in hot["items"]} == {recent, still_open}
+    both = client.get("/issues", params={"label": "bug", "include_archived": True}).json()
+    assert both["total"] == 3
+    archived_item = next(item for item in both["items"] if item["id"] == old)
+    assert archived_item["archived_at"] is not None
+    assert archived_item["labels"][0]["name"] == "bug"
+
+    detail = client.get(f"/issues/{old}")
+    assert detail.status_code == 200
+    assert detail.json()["comments"][0]["body"] == "Done long ago"
+    timeline = client.get(f"/issues/{old}/timeline").json()
+    assert [event["event_type"] for event in timeline][0] == "issue.created"
+    assert client.get(f"/issues/{recent}").json()["archived_at"] is None
+
+
+def test_archive_keeps_long_resolved_issue_that_was_just_closed(client, db_session):
+    issue_id = _issue(client, "Resolved long ago", "RESOLVED", [])
+    long_ago = datetime.now(timezone.utc) - timedelta(days=400)
+    db_session.execute(update(Issue).where(Issue.id == issue_id).values(resolved_at=long_ago, updated_at=long_ago))
+    db_session.commit()
+    version = client.get(f"/issues/{issue_id}").json()["version"]
+    client.patch(f"/issues/{issue_id}", json={"status": "CLOSED", "version": version})
+
+    response = client.post("/admin/archive", params={"older_than_days": 90}, headers=ADMIN)
+
+    assert response.json()["archived"] == 0
+    assert db_session.get(Issue, issue_id) is not None
+
+
+def test_archive_requires_admin(client):
+    assert client.post("/admin/archive").status_code == 403
@@ -0,0 +1,47 @@
+from app.crud.users import create_user
+
+
+def test_batch_get_preserves_order_and_marks_missing(client, db_session):
+    dev = create_user(db_session, "Batcher", "batcher@example.com")
+    db_session.commit()
+    first = client.post("/issues", json={"title": "First", "assignee_id": dev.id}).json()["id"]
+    second = client.post("/issues", json={"title": "Second"}).json()["id"]
+    client.put(f"/issues/{first}/labels", json={"labels": ["bug"]})
+    for body in ("one", "two", "three"):
+        client.post(f"/issues/{first}/comments", json={"body": body, "author_id": dev.id})
+
+    response = client.post(
+        "/issues/batch-get",
+        json={
+            "ids": [second, 999_999, first],
+            "include": ["labels", "assignee", "latest_comments", "comment_count"],
+            "comments_limit": 2,
+        },
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(item["id"], item["found"]) for item in items] == [(second, True), (999_999, False), (first, True)]
+    assert items[1]["issue"] is None
+    issue = items[2]["issue"]
+    assert [label["name"] for label in issue["labels"]] == ["bug"]
+    assert issue["assignee"]["email"] == "batcher@example.com"
+    assert [comment["body"] for comment in issue["latest_comments"]] == ["three", "two"]
+    assert issue["comment_count"] == 3
+    assert items[0]["issue"]["comment_count"] == 0
+    assert items[0]["issue"]["assignee"] is None
+    # Issues, comments, counts and assignees: one query each, however many ids are asked for.
+    assert 'desc="4 queries"' in response.headers["server-timing"]
+
+
+def test_batch_get_only_loads_requested_relations(client):
+    issue_id = client.post("/issues", json={"title": "Bare"}).json()["id"]
+
+    response = client.post("/issues/batch-get", json={"ids": [issue_id]})
+
+    issue = response.json()["items"][0]["issue"]
+    assert issue["title"] == "Bare"
+    assert issue["labels"] is None and issue["latest_comments"] is None
+    assert 'desc="1 queries"' in response.headers["server-timing"]
+    assert client.post("/issues/batch-get", json={"ids": list(range(1, 202))}).status_code == 422
+    assert client.post("/issues/batch-get", json={"ids": [1], "include": ["watchers"]}).status_code == 422
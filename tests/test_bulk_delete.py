@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.crud.issues import delete_issues
+from app.crud.users import create_user
+from app.models import Comment, IssueEvent, issue_labels
+from app.observability.metrics import ISSUES_DELETED
+from app.services import purge
+
+
+def _count(db_session, stmt) -> int:
+    return db_session.scalar(select(func.count()).select_from(stmt.subquery()))
+
+
+def test_delete_issue_cascades_in_database(client, db_session):
+    author = create_user(db_session, "Deleter", "deleter@example.com")
+    db_session.commit()
+    issue_id = client.post("/issues", json={"title": "Doomed"}).json()["id"]
+    client.put(f"/issues/{issue_id}/labels", json={"labels": ["bug"]})
+    client.post(f"/issues/{issue_id}/comments", json={"body": "Bye", "author_id": author.id})
+
+    response = client.delete(f"/issues/{issue_id}")
+
+    assert response.status_code == 204
+    assert client.get(f"/issues/{issue_id}").status_code == 404
+    for stmt in (
+        select(Comment.id).where(Comment.issue_id == issue_id),
+        select(IssueEvent.id).where(IssueEvent.issue_id == issue_id),
+        select(issue_labels.c.label_id).where(issue_labels.c.issue_id == issue_id),
+    ):
+        assert _count(db_session, stmt) == 0
+    assert client.delete(f"/issues/{issue_id}").status_code == 404
+
+
+def test_bulk_delete_by_filter_in_batches(client):
+    doomed = [client.post("/issues", json={"title": f"Spam {n}"}).json()["id"] for n in range(5)]
+    for issue_id in doomed:
+        client.put(f"/issues/{issue_id}/labels", json={"labels": ["spam"]})
+    kept = client.post("/issues", json={"title": "Real"}).json()["id"]
+
+    dry_run = client.post("/issues/bulk-delete", json={"filter": {"label": "spam"}, "dry_run": True}).json()
+    assert dry_run == {"matched": 5, "deleted": 0, "batches": 0, "dry_run": True}
+    assert client.get("/issues").json()["total"] == 6
+
+    response = client.post("/issues/bulk-delete", json={"filter": {"label": "spam"}, "batch_size": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {"matched": 5, "deleted": 5, "batches": 3, "dry_run": False}
+    assert [item["id"] for item in client.get("/issues").json()["items"]] == [kept]
+
+
+def test_bulk_delete_requires_a_filter(client):
+    response = client.post("/issues/bulk-delete", json={"filter": {}})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("issue_filter", [{"status": None}, {"assignee_id": None}, {"labels": []}, {"label": ""}])
+def test_bulk_delete_rejects_a_filter_without_values(client, issue_filter):
+    client.post("/issues", json={"title": "Keep me"})
+
+    response = client.post("/issues/bulk-delete", json={"filter": issue_filter})
+
+    assert response.status_code == 422
+    assert client.get("/issues").json()["total"] == 1
+
+
+def test_bulk_delete_counts_only_the_issues_it_removed(client, monkeypatch):
+    ids = [client.post("/issues", json={"title": f"Gone {n}"}).json()["id"] for n in range(3)]
+    for issue_id in ids:
+        client.put(f"/issues/{issue_id}/labels", json={"labels": ["gone"]})
+
+    def racing_delete(db, issue_ids):
+        # Another request removes one of the selected issues before the batch DELETE runs.
+        delete_issues(db, issue_ids[:1])
+        return delete_issues(db, issue_ids)
+
+    monkeypatch.setattr(purge, "delete_issues", racing_delete)
+    before = ISSUES_DELETED._value.get()
+
+    response = client.post("/issues/bulk-delete", json={"filter": {"label": "gone"}})
+
+    assert response.json()["deleted"] == 2
+    assert ISSUES_DELETED._value.get() - before == 2
@@ -0,0 +1,40 @@
+def _label_names(client, issue_id):
+    return sorted(label["name"] for label in client.get(f"/issues/{issue_id}").json()["labels"])
+
+
+def test_bulk_labels_by_ids_and_filter(client):
+    first = client.post("/issues", json={"title": "One"}).json()
+    second = client.post("/issues", json={"title": "Two"}).json()
+    third = client.post("/issues", json={"title": "Three", "status": "IN_PROGRESS"}).json()
+    client.put(f"/issues/{first['id']}/labels", json={"labels": ["bug"]})
+
+    response = client.post(
+        "/issues/bulk-labels",
+        json={"issue_ids": [first["id"], second["id"]], "add": ["bug", "release-1"]},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"added": 3, "removed": 0, "issues_changed": 2}
+    assert _label_names(client, first["id"]) == ["bug", "release-1"]
+    assert _label_names(client, second["id"]) == ["bug", "release-1"]
+    assert _label_names(client, third["id"]) == []
+
+    response = client.post(
+        "/issues/bulk-labels",
+        json={"filter": {"status": "OPEN", "label": "release-1"}, "remove": ["bug"], "add": ["triaged"]},
+    )
+    assert response.json() == {"added": 2, "removed": 2, "issues_changed": 2}
+    assert _label_names(client, first["id"]) == ["release-1", "triaged"]
+
+    events = client.get("/events", params={"event_type": "labels.bulk_updated"}).json()["items"]
+    assert len(events) == 4
+
+
+def test_bulk_labels_validation(client):
+    issue = client.post("/issues", json={"title": "One"}).json()
+
+    missing = client.post("/issues/bulk-labels", json={"issue_ids": [issue["id"], 999999], "add": ["bug"]})
+    assert missing.status_code == 400
+    assert missing.json()["error"]["details"]["errors"][0]["issue_ids"] == [999999]
+
+    ambiguous = client.post("/issues/bulk-labels", json={"issue_ids": [issue["id"]], "filter": {}, "add": ["bug"]})
+    assert ambiguous.status_code == 422
@@ -0,0 +1,54 @@
+from app.crud.users import create_user
+
+
+def test_bulk_reassign_by_filter(client, db_session):
+    leaving = create_user(db_session, "Leaving", "leaving@example.com")
+    taking_over = create_user(db_session, "Taking Over", "taking.over@example.com")
+    db_session.commit()
+
+    mine = [client.post("/issues", json={"title": f"Mine {idx}", "assignee_id": leaving.id}).json() for idx in range(3)]
+    other = client.post("/issues", json={"title": "Other", "assignee_id": taking_over.id}).json()
+
+    body = {"filter": {"assignee_id": leaving.id}, "assignee_id": taking_over.id, "status": "IN_PROGRESS"}
+    preview = client.post("/issues/bulk-update", json={**body, "dry_run": True})
+    assert preview.json() == {"matched": 3, "updated": 0, "dry_run": True, "errors": []}
+    assert client.get("/issues", params={"assignee_id": leaving.id}).json()["total"] == 3
+
+    response = client.post("/issues/bulk-update", json=body)
+    assert response.status_code == 200
+    assert response.json()["updated"] == 3
+
+    for issue in mine:
+        after = client.get(f"/issues/{issue['id']}").json()
+        assert after["assignee_id"] == taking_over.id
+        assert after["status"] == "IN_PROGRESS"
+        assert after["version"] == issue["version"] + 1
+    assert client.get(f"/issues/{other['id']}").json()["version"] == other["version"]
+
+
+def test_bulk_update_enforces_rules_as_a_set(client, db_session):
+    assignee = create_user(db_session, "Rae", "rae@example.com")
+    db_session.commit()
+
+    unassigned = client.post("/issues", json={"title": "Unassigned", "status": "IN_PROGRESS"}).json()
+    assigned = client.post(
+        "/issues", json={"title": "Assigned", "status": "IN_PROGRESS", "assignee_id": assignee.id}
+    ).json()
+    still_open = client.post("/issues", json={"title": "Open", "assignee_id": assignee.id}).json()
+
+    preview = client.post("/issues/bulk-update", json={"filter": {}, "status": "CLOSED", "dry_run": True}).json()
+    assert preview["matched"] == 3
+    reasons = {error["reason"]: error for error in preview["errors"]}
+    assert reasons["Assignee required for resolved/closed"]["issue_ids"] == [unassigned["id"]]
+    assert reasons["Cannot close directly from open"]["issue_ids"] == [still_open["id"]]
+
+    rejected = client.post("/issues/bulk-update", json={"filter": {}, "status": "CLOSED"})
+    assert rejected.status_code == 400
+    assert client.get(f"/issues/{assigned['id']}").json()["status"] == "IN_PROGRESS"
+
+    body = {"filter": {"status": "IN_PROGRESS", "assignee_id": assignee.id}, "status": "RESOLVED"}
+    resolved = client.post("/issues/bulk-update", json=body)
+    assert resolved.json()["updated"] == 1
+    after = client.get(f"/issues/{assigned['id']}").json()
+    assert after["status"] == "RESOLVED"
+    assert after["resolved_at"] is not None
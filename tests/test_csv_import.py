@@ -1,4 +1,14 @@
+import threading
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+
+from app.config import get_settings
 from app.crud.users import create_user
+from app.main import app
+from app.models import Issue, IssueDailyStats, Label
+from app.services import csv_import
 
 
 def test_csv_import_invalid_row(client, db_session):
@@ -36,3 +46,143 @@ def test_csv_import_valid_file(client, db_session):
     payload = response.json()
     assert payload["created"] == 2
     assert payload["failed"] == 0
+
+
+def test_csv_import_parallel_validation_keeps_row_numbers(client, db_session, monkeypatch):
+    create_user(db_session, "Ava", "ava@example.com")
+    db_session.commit()
+    settings = get_settings()
+    monkeypatch.setattr(settings, "csv_import_workers", 2)
+    monkeypatch.setattr(settings, "csv_import_parallel_min_size", 0)
+    monkeypatch.setattr(settings, "csv_import_chunk_size", 40)
+
+    rows = [f"Issue {idx},Desc,OPEN,ava@example.com,bug;triage" for idx in range(30)]
+    rows[4] = 'Multi line,"first\nsecond, ""quoted""",OPEN,ava@example.com,bug'
+    rows[11] = ",No title,OPEN,,"
+    rows[17] = "Bad status,Desc,DONE,,"
+    rows[25] = "Unknown,Desc,OPEN,nobody@example.com,"
+    csv_data = "title,description,status,assignee_email,labels\n" + "\n".join(rows) + "\n"
+
+    response = client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")})
+    payload = response.json()
+    assert payload["total_rows"] == 30
+    assert payload["errors"] == [
+        {"row_number": 13, "reason": "Title is required"},
+        {"row_number": 19, "reason": "Invalid status"},
+        {"row_number": 27, "reason": "Assignee email not found"},
+    ]
+
+    rows[11], rows[17], rows[25] = rows[10], rows[16], rows[24]
+    csv_data = "title,description,status,assignee_email,labels\n" + "\n".join(rows) + "\n"
+    response = client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")})
+    assert response.json()["created"] == 30
+    multi_line = client.get("/issues", params={"label": "bug", "limit": 100}).json()["items"]
+    assert any(item["description"] == 'first\nsecond, "quoted"' for item in multi_line)
+
+
+def test_csv_import_stops_at_max_errors_and_groups_reasons(client):
+    rows = [",No title,OPEN,," if idx % 3 else "Bad,Desc,DONE,," for idx in range(50)]
+    csv_data = "title,description,status,assignee_email,labels\n" + "\n".join(rows) + "\n"
+
+    response = client.post(
+        "/issues/import", params={"max_errors": 10}, files={"file": ("issues.csv", csv_data, "text/csv")}
+    )
+    payload = response.json()
+    assert payload["truncated"] is True
+    assert payload["failed"] == 10
+    assert payload["total_rows"] == 10
+    assert [error["row_number"] for error in payload["errors"]] == list(range(2, 12))
+    assert payload["error_summary"] == [
+        {"reason": "Title is required", "count": 6, "sample_rows": [3, 4, 6, 7, 9]},
+        {"reason": "Invalid status", "count": 4, "sample_rows": [2, 5, 8, 11]},
+    ]
+
+
+def test_csv_import_not_truncated_when_last_row_hits_max_errors(client):
+    csv_data = "title,description,status,assignee_email,labels\nFine,,OPEN,,\n,No title,OPEN,,\n,No title,OPEN,,\n"
+
+    response = client.post(
+        "/issues/import", params={"max_errors": 2}, files={"file": ("issues.csv", csv_data, "text/csv")}
+    )
+    payload = response.json()
+    assert payload["failed"] == 2
+    assert payload["total_rows"] == 3
+    assert payload["truncated"] is False
+
+
+def test_csv_import_validate_only_writes_nothing(client, db_session):
+    create_user(db_session, "Liam", "liam@example.com")
+    db_session.commit()
+    csv_data = "title,description,status,assignee_email,labels\nFine,Desc,OPEN,liam@example.com,brand-new-label\n"
+
+    response = client.post(
+        "/issues/import", params={"validate_only": True}, files={"file": ("issues.csv", csv_data, "text/csv")}
+    )
+    payload = response.json()
+    assert payload == {
+        "total_rows": 1,
+        "created": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "archived": 0,
+        "failed": 0,
+        "errors": [],
+        "error_summary": [],
+        "truncated": False,
+        "validate_only": True,
+    }
+    assert client.get("/issues").json()["total"] == 0
+    assert client.get("/issues", params={"label": "brand-new-label"}).json()["total"] == 0
+
+
+def test_large_import_commits_in_batches_without_blocking_requests(db_session, monkeypatch):
+    # Real sessions per request, so the import and the other requests run in separate transactions.
+    engine = db_session.get_bind().engine
+    monkeypatch.setattr(get_settings(), "csv_import_batch_size", 100)
+    first_batch_done, resume = threading.Event(), threading.Event()
+    insert_rows = csv_import._insert_rows
+    batches = []
+
+    def paused_insert_rows(*args):
+        batches.append(len(args[1]))
+        if len(batches) == 2:
+            first_batch_done.set()
+            resume.wait(10)
+        return insert_rows(*args)
+
+    monkeypatch.setattr(csv_import, "_insert_rows", paused_insert_rows)
+    titles = [f"Batch {idx}" for idx in range(500)]
+    rows = "".join(f"{title},,OPEN,,batch-import\n" for title in titles)
+    csv_data = "title,description,status,assignee_email,labels\n" + rows
+    result = {}
+    try:
+        with TestClient(app) as client:
+            existing = client.post("/issues", json={"title": "Existing"}).json()
+            importer = threading.Thread(
+                target=lambda: result.update(
+                    client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")}).json()
+                )
+            )
+            importer.start()
+            assert first_batch_done.wait(10)
+
+            started = time.perf_counter()
+            assert client.get(f"/issues/{existing['id']}").status_code == 200
+            # The first batch is committed: its rows are visible and not locked by the running import.
+            imported = client.get("/issues", params={"label": "batch-import", "limit": 1}).json()
+            assert imported["total"] == 100
+            first = imported["items"][0]
+            change = {"status": "IN_PROGRESS", "version": first["version"]}
+            assert client.patch(f"/issues/{first['id']}", json=change).status_code == 200
+            assert time.perf_counter() - started < 1.0
+
+            resume.set()
+            importer.join(10)
+        assert result["created"] == 500
+        assert batches == [100] * 5
+    finally:
+        resume.set()
+        with engine.begin() as connection:
+            connection.execute(delete(Issue).where(Issue.title.in_(["Existing", *titles])))
+            connection.execute(delete(Label).where(Label.name == "batch-import"))
+            connection.execute(delete(IssueDailyStats))
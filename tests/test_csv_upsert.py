@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, update
+
+from app.crud.users import create_user
+from app.models import ArchivedIssue, Issue
+from app.services.archival import archive_closed_issues
+
+
+HEADER = "external_id,title,description,status,assignee_email,labels\n"
+
+
+def _import(client, csv_data, **params):
+    response = client.post(
+        "/issues/import", params={"upsert": True, **params}, files={"file": ("issues.csv", csv_data, "text/csv")}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def _by_external_id(client):
+    items = client.get("/issues", params={"limit": 100}).json()["items"]
+    return {item["external_id"]: client.get(f"/issues/{item['id']}").json() for item in items}
+
+
+def test_upsert_skips_unchanged_rows_and_updates_changed_ones(client, db_session):
+    create_user(db_session, "Zoe", "zoe@example.com")
+    db_session.commit()
+    first = HEADER + (
+        "UP-1,First,Desc,OPEN,zoe@example.com,bug;api\n"
+        "UP-2,Second,Desc,IN_PROGRESS,,ui\n"
+        "UP-3,Third,Desc,OPEN,,\n"
+    )
+    summary = _import(client, first)
+    assert (summary["created"], summary["updated"], summary["unchanged"]) == (3, 0, 0)
+    before = _by_external_id(client)
+
+    # Label order and surrounding whitespace do not count as changes.
+    second = HEADER + (
+        "UP-1,First,Desc,OPEN,zoe@example.com, api ; bug\n"
+        "UP-2,Second,Desc,RESOLVED,zoe@example.com,ui;done\n"
+        "UP-3,Third,Desc,OPEN,,\n"
+        "UP-4,Fourth,,OPEN,,\n"
+    )
+    summary = _import(client, second)
+    assert (summary["created"], summary["updated"], summary["unchanged"]) == (1, 1, 2)
+
+    after = _by_external_id(client)
+    assert after["UP-1"]["version"] == before["UP-1"]["version"]
+    assert after["UP-1"]["updated_at"] == before["UP-1"]["updated_at"]
+    changed = after["UP-2"]
+    assert changed["id"] == before["UP-2"]["id"]
+    assert changed["version"] == before["UP-2"]["version"] + 1
+    assert changed["status"] == "RESOLVED"
+    assert changed["resolved_at"] is not None
+    assert sorted(label["name"] for label in changed["labels"]) == ["done", "ui"]
+    assert set(after) == {"UP-1", "UP-2", "UP-3", "UP-4"}
+
+    timeline = client.get(f"/issues/{changed['id']}/timeline").json()
+    assert [event["event_type"] for event in timeline] == ["issue.created", "issue.updated"]
+    unchanged_timeline = client.get(f"/issues/{after['UP-1']['id']}/timeline").json()
+    assert [event["event_type"] for event in unchanged_timeline] == ["issue.created"]
+
+
+def test_upsert_reopening_clears_resolved_at(client):
+    _import(client, HEADER + "UP-5,Fifth,,RESOLVED,,\n")
+    resolved_at = _by_external_id(client)["UP-5"]["resolved_at"]
+    assert resolved_at is not None
+
+    # Staying done keeps the original timestamp.
+    _import(client, HEADER + "UP-5,Fifth,,CLOSED,,\n")
+    assert _by_external_id(client)["UP-5"]["resolved_at"] == resolved_at
+
+    summary = _import(client, HEADER + "UP-5,Fifth,,OPEN,,\n")
+    assert summary["updated"] == 1
+    reopened = _by_external_id(client)["UP-5"]
+    assert reopened["status"] == "OPEN"
+    assert reopened["resolved_at"] is None
+
+
+def test_upsert_rejects_missing_and_duplicate_external_ids(client):
+    csv_data = HEADER + "UP-9,A,,OPEN,,\n,B,,OPEN,,\nUP-9,C,,OPEN,,\n"
+    summary = _import(client, csv_data)
+    assert summary["created"] == 0
+    assert summary["errors"] == [
+        {"row_number": 3, "reason": "External id is required for upsert"},
+        {"row_number": 4, "reason": "Duplicate external id"},
+    ]
+
+
+def test_plain_import_rejects_known_external_id(client):
+    _import(client, HEADER + "UP-7,Seven,,OPEN,,\n")
+    csv_data = HEADER + "UP-7,Again,,OPEN,,\n"
+    response = client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")})
+    assert response.json()["errors"] == [{"row_number": 2, "reason": "External id already exists"}]
+
+
+def test_import_does_not_recreate_archived_issues(client, db_session):
+    _import(client, HEADER + "UP-8,Eight,,CLOSED,,\n")
+    long_ago = datetime.now(timezone.utc) - timedelta(days=400)
+    db_session.execute(update(Issue).where(Issue.external_id == "UP-8").values(updated_at=long_ago))
+    archive_closed_issues(db_session, older_than_days=90, batch_size=10)
+
+    summary = _import(client, HEADER + "UP-8,Eight renamed,,OPEN,,\nUP-10,Ten,,OPEN,,\n")
+    assert (summary["created"], summary["updated"], summary["unchanged"], summary["archived"]) == (1, 0, 0, 1)
+    assert db_session.scalar(select(func.count()).where(Issue.external_id == "UP-8")) == 0
+    assert db_session.get(ArchivedIssue, db_session.scalar(select(ArchivedIssue.id))).title == "Eight"
+
+    csv_data = HEADER + "UP-8,Again,,OPEN,,\n"
+    response = client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")})
+    assert response.json()["errors"] == [{"row_number": 2, "reason": "External id already exists"}]
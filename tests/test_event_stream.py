@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from sqlalchemy import Text, cast, delete, func, insert, select
+
+from app.enums import IssueStatus
+from app.models import Issue, IssueEvent
+from app.services.event_stream import (
+    SUBSCRIBER_QUEUE_SIZE,
+    Subscription,
+    broadcaster,
+    format_sse,
+    load_latest_cursor,
+    sse_stream,
+)
+from app.services.timeline import EVENTS_CHANNEL
+
+
+def test_format_sse_uses_event_cursor_for_resume():
+    event = {
+        "id": 42,
+        "issue_id": 7,
+        "event_type": "issue.updated",
+        "payload": {"title": "x"},
+        "created_at": "now",
+        "cursor": "900-42",
+    }
+    frame = format_sse(event)
+    lines = frame.split("\n")
+    assert lines[0] == "id: 900-42"
+    assert lines[1] == "event: issue.updated"
+    assert json.loads(lines[2].removeprefix("data: ")) == event
+    assert frame.endswith("\n\n")
+
+
+def test_subscription_flags_overflow_instead_of_blocking():
+    async def scenario() -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop())
+        events = [{"id": idx, "event_type": "issue.created"} for idx in range(SUBSCRIBER_QUEUE_SIZE + 5)]
+        await asyncio.to_thread(subscription.push, events)
+        await asyncio.sleep(0)
+        return subscription
+
+    subscription = asyncio.run(scenario())
+    assert subscription.overflowed
+    assert subscription.queue.qsize() == SUBSCRIBER_QUEUE_SIZE
+
+
+def test_stream_rejects_invalid_last_event_id(client):
+    response = client.get("/events/stream", headers={"Last-Event-ID": "abc"})
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_LAST_EVENT_ID"
+
+
+def test_stream_delivers_events_in_commit_safe_order(db_session):
+    engine = db_session.get_bind().engine
+    with engine.begin() as connection:
+        issue = insert(Issue).values(title="Streamed", status=IssueStatus.open).returning(Issue.id)
+        issue_id = connection.scalar(issue)
+    event = insert(IssueEvent).values(issue_id=issue_id, event_type="streamed").returning(IssueEvent.id)
+    notify = select(func.pg_notify(EVENTS_CHANNEL, cast(func.pg_current_xact_id(), Text)))
+
+    async def disconnected() -> bool:
+        return False
+
+    async def scenario() -> tuple[list[int], list[int]]:
+        start = await asyncio.to_thread(load_latest_cursor)
+        stream = sse_stream(disconnected, start, "streamed")
+        first_frame = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.5)
+        with engine.connect() as first, engine.connect() as second:
+            # The first transaction takes the lower id but commits after the second.
+            with first.begin():
+                first_id = first.scalar(event)
+                first.execute(notify)
+                with second.begin():
+                    second_id = second.scalar(event)
+                    second.execute(notify)
+                await asyncio.sleep(1.5)
+                assert not first_frame.done()
+        frames = [await asyncio.wait_for(first_frame, 5), await asyncio.wait_for(anext(stream), 5)]
+        await stream.aclose()
+        return [first_id, second_id], [int(frame.split("\n")[0].rsplit("-", 1)[1]) for frame in frames]
+
+    try:
+        inserted, streamed = asyncio.run(scenario())
+        assert streamed == inserted
+    finally:
+        broadcaster.stop()
+        with engine.begin() as connection:
+            connection.execute(delete(Issue).where(Issue.id == issue_id))
@@ -0,0 +1,69 @@
+from contextlib import contextmanager
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from app.enums import IssueStatus
+from app.models import Issue, IssueEvent
+from app.services.timeline import FEED_START, list_events_after, parse_cursor
+
+
+def test_event_feed_pages_by_cursor(client):
+    first = client.post("/issues", json={"title": "Feed one"}).json()
+    client.put(f"/issues/{first['id']}/labels", json={"labels": ["bug"]})
+    client.post("/issues", json={"title": "Feed two"})
+
+    start = client.get("/events", params={"limit": 1}).json()
+    assert len(start["items"]) == 1
+    cursor = start["items"][0]["cursor"]
+    assert start["next_after"] == cursor
+
+    rest = client.get("/events", params={"after": cursor}).json()
+    positions = [parse_cursor(event["cursor"]) for event in rest["items"]]
+    assert positions == sorted(positions)
+    assert all(position > parse_cursor(cursor) for position in positions)
+    assert [event["event_type"] for event in rest["items"]] == ["labels.replaced", "issue.created"]
+
+    created = client.get("/events", params={"event_type": "issue.created"}).json()
+    assert [event["event_type"] for event in created["items"]] == ["issue.created", "issue.created"]
+
+    caught_up = client.get("/events", params={"after": rest["next_after"]}).json()
+    assert caught_up["items"] == []
+    assert caught_up["next_after"] == rest["next_after"]
+
+
+def test_event_feed_rejects_invalid_cursor(client):
+    response = client.get("/events", params={"after": "12"})
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_CURSOR"
+
+
+@contextmanager
+def _committed_issue(engine):
+    with engine.begin() as connection:
+        issue_id = connection.scalar(insert(Issue).values(title="Overlap", status=IssueStatus.open).returning(Issue.id))
+    try:
+        yield issue_id
+    finally:
+        with engine.begin() as connection:
+            connection.execute(delete(Issue).where(Issue.id == issue_id))
+
+
+def test_event_feed_holds_back_events_behind_an_open_transaction(db_session):
+    engine = db_session.get_bind().engine
+    with _committed_issue(engine) as issue_id, engine.connect() as first, engine.connect() as second:
+        event = insert(IssueEvent).values(issue_id=issue_id, event_type="overlap").returning(IssueEvent.id)
+        # The first transaction takes the lower id; the second takes a higher one and commits first.
+        with first.begin() as first_transaction:
+            first_id = first.scalar(event)
+            with second.begin():
+                second_id = second.scalar(event)
+            assert first_id < second_id
+
+            with Session(engine) as reader:
+                assert [item.id for item in list_events_after(reader, FEED_START, 1000, "overlap")] == []
+            first_transaction.commit()
+
+        with Session(engine) as reader:
+            items = list_events_after(reader, FEED_START, 1000, "overlap")
+            assert [item.id for item in items] == [first_id, second_id]
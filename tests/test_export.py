@@ -0,0 +1,38 @@
+import json
+
+from app.crud.users import create_user
+
+
+def test_export_csv_round_trips_through_import(client, db_session):
+    create_user(db_session, "Ivy", "ivy@example.com")
+    db_session.commit()
+
+    csv_data = (
+        "title,description,status,assignee_email,labels\n"
+        "Export one,Desc,IN_PROGRESS,ivy@example.com,bug;urgent\n"
+        "Export two,,,,\n"
+    )
+    client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")})
+
+    exported = client.get("/issues/export", params={"format": "csv"})
+    assert exported.status_code == 200
+    assert exported.headers["content-type"].startswith("text/csv")
+    lines = exported.text.splitlines()
+    assert lines[0] == "title,description,status,assignee_email,labels"
+    assert sorted(lines[1:]) == ["Export one,Desc,IN_PROGRESS,ivy@example.com,bug;urgent", "Export two,,OPEN,,"]
+
+    reimport = client.post("/issues/import", files={"file": ("issues.csv", exported.text, "text/csv")})
+    assert reimport.json()["created"] == 2
+
+
+def test_export_ndjson_applies_filters(client):
+    client.post("/issues", json={"title": "Open one"})
+    in_progress = client.post("/issues", json={"title": "Progress one", "status": "IN_PROGRESS"}).json()
+
+    exported = client.get("/issues/export", params={"format": "ndjson", "status": "IN_PROGRESS"})
+    assert exported.status_code == 200
+    rows = [json.loads(line) for line in exported.text.splitlines()]
+    assert [row["id"] for row in rows] == [in_progress["id"]]
+
+    invalid = client.get("/issues/export", params={"format": "xml"})
+    assert invalid.status_code == 400
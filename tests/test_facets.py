@@ -0,0 +1,27 @@
+from app.crud.users import create_user
+
+
+def test_facets_count_every_dimension_for_a_filter(client, db_session):
+    dev = create_user(db_session, "Facet Dev", "facet.dev@example.com")
+    db_session.commit()
+
+    first = client.post("/issues", json={"title": "F1", "assignee_id": dev.id}).json()
+    second = client.post("/issues", json={"title": "F2", "assignee_id": dev.id, "status": "IN_PROGRESS"}).json()
+    client.post("/issues", json={"title": "F3"})
+    client.put(f"/issues/{first['id']}/labels", json={"labels": ["bug", "urgent"]})
+    client.put(f"/issues/{second['id']}/labels", json={"labels": ["bug"]})
+
+    facets = client.get("/issues/facets").json()
+    assert facets["total"] == 3
+    assert facets["status"] == [{"value": "OPEN", "count": 2}, {"value": "IN_PROGRESS", "count": 1}]
+    assert facets["assignee_id"] == [{"value": dev.id, "count": 2}, {"value": None, "count": 1}]
+    assert facets["label"] == [
+        {"value": "bug", "count": 2},
+        {"value": None, "count": 1},
+        {"value": "urgent", "count": 1},
+    ]
+
+    filtered = client.get("/issues/facets", params={"label": "bug"}).json()
+    assert filtered["total"] == 2
+    assert filtered["status"] == [{"value": "IN_PROGRESS", "count": 1}, {"value": "OPEN", "count": 1}]
+    assert {item["value"]: item["count"] for item in filtered["label"]} == {"bug": 2, "urgent": 1}
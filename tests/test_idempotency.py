@@ -0,0 +1,38 @@
+from app.crud.users import create_user
+
+
+def test_retried_create_returns_stored_response(client):
+    headers = {"Idempotency-Key": "create-1"}
+    first = client.post("/issues", json={"title": "Retry me"}, headers=headers)
+    assert first.status_code == 201
+
+    retry = client.post("/issues", json={"title": "Retry me"}, headers=headers)
+    assert retry.status_code == 201
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    assert client.get("/issues").json()["total"] == 1
+
+    reused = client.post("/issues", json={"title": "Something else"}, headers=headers)
+    assert reused.status_code == 422
+    assert reused.json()["error"]["code"] == "IDEMPOTENCY_KEY_REUSED"
+
+
+def test_retried_comment_and_import_are_not_duplicated(client, db_session):
+    author = create_user(db_session, "Ola", "ola@example.com")
+    db_session.commit()
+
+    issue = client.post("/issues", json={"title": "Commented"}).json()
+    headers = {"Idempotency-Key": "comment-1"}
+    body = {"body": "Hi", "author_id": author.id}
+    created = client.post(f"/issues/{issue['id']}/comments", json=body, headers=headers)
+    replayed = client.post(f"/issues/{issue['id']}/comments", json=body, headers=headers)
+    assert created.status_code == replayed.status_code == 201
+    assert created.json()["id"] == replayed.json()["id"]
+    assert len(client.get(f"/issues/{issue['id']}").json()["comments"]) == 1
+
+    csv_data = "title,description,status,assignee_email,labels\nImported,,,,\n"
+    files = {"file": ("issues.csv", csv_data, "text/csv")}
+    headers = {"Idempotency-Key": "import-1"}
+    assert client.post("/issues/import", files=files, headers=headers).json()["created"] == 1
+    assert client.post("/issues/import", files=files, headers=headers).json()["created"] == 1
+    assert client.get("/issues").json()["total"] == 2
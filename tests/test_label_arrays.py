@@ -0,0 +1,38 @@
+from sqlalchemy import select
+
+from app.models import Issue
+
+
+def _labelled(client, label: str) -> set[int]:
+    return {item["id"] for item in client.get("/issues", params={"label": label}).json()["items"]}
+
+
+def test_label_arrays_follow_every_label_write(client, db_session):
+    first = client.post("/issues", json={"title": "First"}).json()["id"]
+    second = client.post("/issues", json={"title": "Second"}).json()["id"]
+
+    client.put(f"/issues/{first}/labels", json={"labels": ["urgent", "bug"]})
+    arrays = db_session.execute(select(Issue.label_ids, Issue.label_names).where(Issue.id == first)).one()
+    assert arrays.label_names == ["bug", "urgent"]
+    rendered = client.get(f"/issues/{first}").json()["labels"]
+    assert [(label["id"], label["name"]) for label in rendered] == list(zip(arrays.label_ids, arrays.label_names))
+
+    client.post("/issues/bulk-labels", json={"issue_ids": [first, second], "add": ["triage"], "remove": ["bug"]})
+    assert _labelled(client, "triage") == {first, second}
+    assert _labelled(client, "bug") == set()
+    assert [label["name"] for label in client.get(f"/issues/{first}").json()["labels"]] == ["triage", "urgent"]
+
+    csv_data = "title,description,status,assignee_email,labels\nImported,,OPEN,,triage;ui\n"
+    client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")})
+    assert len(_labelled(client, "triage")) == 3
+
+
+def test_list_renders_labels_without_extra_query(client):
+    issue = client.post("/issues", json={"title": "Counted"}).json()["id"]
+    client.put(f"/issues/{issue}/labels", json={"labels": ["bug"]})
+
+    response = client.get("/issues", params={"label": "bug"})
+
+    assert response.json()["items"][0]["labels"][0]["name"] == "bug"
+    # One query for the page and one for the total.
+    assert 'desc="2 queries"' in response.headers["server-timing"]
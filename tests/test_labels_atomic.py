@@ -1,3 +1,12 @@
+import threading
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.crud.labels import get_or_create_labels
+from app.models import Label
+
+
 def test_labels_replace_atomic(client):
     issue = client.post("/issues", json={"title": "Label update"}).json()
 
@@ -9,3 +18,25 @@ def test_labels_replace_atomic(client):
     assert replace.status_code == 200
     final_labels = [label["name"] for label in replace.json()["labels"]]
     assert final_labels == ["enhancement"]
+
+
+def test_concurrent_requests_create_the_same_label_once(db_session):
+    engine = db_session.get_bind().engine
+    result = {}
+    try:
+        with Session(engine) as first, Session(engine) as second:
+            created = get_or_create_labels(first, ["race", "bug"])
+
+            # The second transaction waits on the first one's uncommitted "race" row.
+            racer = threading.Thread(target=lambda: result.update(labels=get_or_create_labels(second, ["race"])))
+            racer.start()
+            racer.join(0.2)
+            assert racer.is_alive()
+            first.commit()
+            racer.join(5)
+            second.commit()
+
+            assert [label.id for label in result["labels"]] == [created[0].id]
+    finally:
+        with engine.begin() as connection:
+            connection.execute(delete(Label).where(Label.name.in_(["race", "bug"])))
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+import time
+
+from app.config import get_settings
+from app.observability.loop_lag import LoopLagMonitor
+
+
+async def _blocking_request(scope: dict) -> None:
+    # Stands in for an async endpoint that calls blocking code; the monitor finds ``scope`` on the stack.
+    time.sleep(0.3)
+
+
+def test_stall_is_reported_with_blocking_route(monkeypatch, caplog):
+    monkeypatch.setattr(get_settings(), "loop_lag_warn_ms", 100)
+    monkeypatch.setattr(get_settings(), "loop_lag_interval_ms", 10)
+    monitor = LoopLagMonitor()
+
+    async def scenario() -> None:
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await _blocking_request({"type": "http", "path": "/issues/import"})
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    with caplog.at_level(logging.WARNING, logger="app.loop_lag"):
+        asyncio.run(scenario())
+
+    stalls = [record.getMessage() for record in caplog.records if "event loop blocked" in record.getMessage()]
+    assert len(stalls) == 1
+    assert "by /issues/import" in stalls[0]
+    assert "_blocking_request" in stalls[0]
+    blocked_ms = float(stalls[0].split("blocked for ")[1].split("ms")[0])
+    assert blocked_ms >= 250
@@ -0,0 +1,26 @@
+def _sample(body: str, prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_metrics_exposes_route_histograms_and_domain_counters(client):
+    before = client.get("/metrics").text
+    created_before = _sample(before, "issues_created_total ")
+    conflicts_before = _sample(before, "issue_version_conflicts_total ")
+
+    issue = client.post("/issues", json={"title": "Measured"}).json()
+    client.patch(f"/issues/{issue['id']}", json={"title": "Stale", "version": issue["version"] + 1})
+    client.get(f"/issues/{issue['id']}")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert _sample(body, "issues_created_total ") == created_before + 1
+    assert _sample(body, "issue_version_conflicts_total ") == conflicts_before + 1
+    assert 'http_request_duration_seconds_count{method="GET",route="/issues/{issue_id}",status="200"}' in body
+    assert 'route="/issues/{issue_id}",status="409"' in body
+    assert "http_requests_in_flight" in body
+    assert "db_pool_wait_seconds_count" in body
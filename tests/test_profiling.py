@@ -0,0 +1,52 @@
+import pytest
+
+from app.config import get_settings
+from app.observability.profiling import profile_store
+
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture()
+def profiling(monkeypatch):
+    monkeypatch.setattr(get_settings(), "admin_token", "secret")
+    monkeypatch.setattr(get_settings(), "profile_interval_ms", 1)
+    profile_store.clear()
+    yield profile_store
+    profile_store.clear()
+
+
+def test_profile_header_requires_admin_token(client, profiling):
+    response = client.get("/issues", headers={"X-Profile": "1", "X-Admin-Token": "wrong"})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert profiling.list() == []
+
+
+def test_profiled_request_is_stored_with_db_time(client, profiling):
+    for idx in range(20):
+        client.post("/issues", json={"title": f"Profiled {idx}"})
+
+    response = client.get("/issues", params={"limit": 20}, headers={"X-Profile": "1", **ADMIN})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    summaries = client.get("/admin/profiles", headers=ADMIN).json()
+    summary = next(item for item in summaries if str(item["id"]) == profile_id)
+    assert summary["route"] == "/issues"
+    assert summary["status"] == 200
+    assert summary["queries"] >= 2
+    assert summary["db_ms"] > 0
+
+    folded = client.get(f"/admin/profiles/{profile_id}", headers=ADMIN)
+    assert folded.status_code == 200
+    for line in folded.text.splitlines():
+        stack, _, count = line.rpartition(" ")
+        assert stack and int(count) > 0
+
+
+def test_sample_rate_profiles_without_header(client, profiling, monkeypatch):
+    monkeypatch.setattr(get_settings(), "profile_sample_rate", 1.0)
+    response = client.get("/issues")
+    assert "x-profile-id" in response.headers
+    assert client.get("/admin/profiles/999999", headers=ADMIN).status_code == 404
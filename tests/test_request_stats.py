@@ -0,0 +1,37 @@
+import json
+import logging
+
+from app.config import get_settings
+
+
+def _server_timing(response) -> dict[str, str]:
+    entries = {}
+    for part in response.headers["server-timing"].split(", "):
+        name, _, rest = part.partition(";")
+        entries[name] = rest
+    return entries
+
+
+def test_server_timing_reports_query_count(client, caplog):
+    issue = client.post("/issues", json={"title": "Timed"}).json()
+
+    with caplog.at_level(logging.INFO, logger="app.requests"):
+        response = client.get(f"/issues/{issue['id']}")
+    timing = _server_timing(response)
+    assert timing["db"].startswith("dur=")
+    assert 'desc="2 queries"' in timing["db"]
+    assert "app" in timing
+
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["route"] == "/issues/{issue_id}"
+    assert record["queries"] == 2
+    assert record["status"] == 200
+
+
+def test_query_threshold_logs_warning(client, caplog, monkeypatch):
+    monkeypatch.setattr(get_settings(), "query_count_warn_threshold", 1)
+    with caplog.at_level(logging.INFO, logger="app.requests"):
+        client.post("/issues", json={"title": "Chatty"})
+    warning = caplog.records[-1]
+    assert warning.levelno == logging.WARNING
+    assert "query count over threshold" in warning.getMessage()
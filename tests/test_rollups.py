@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+
+from app.crud.users import create_user
+from app.services.rollups import rebuild_rollups
+
+
+def _today(client) -> tuple[dict, dict]:
+    today = datetime.now(timezone.utc).date().isoformat()
+    params = {"date_from": today, "date_to": today}
+    throughput = client.get("/reports/throughput", params=params).json()["items"]
+    backlog = client.get("/reports/backlog", params=params).json()["items"]
+    return throughput[0], backlog[0]["counts"]
+
+
+def test_rollups_track_write_paths_and_match_rebuild(client, db_session):
+    dev = create_user(db_session, "Roller", "roller@example.com")
+    db_session.commit()
+    first = client.post("/issues", json={"title": "First", "assignee_id": dev.id}).json()
+    second = client.post("/issues", json={"title": "Second", "assignee_id": dev.id}).json()
+    client.patch(f"/issues/{first['id']}", json={"status": "IN_PROGRESS", "version": first["version"]})
+    client.post("/issues/bulk-status", json={"issue_ids": [first["id"]], "new_status": "RESOLVED"})
+    client.post("/issues/bulk-update", json={"filter": {"status": "OPEN"}, "status": "IN_PROGRESS"})
+    csv_data = "title,description,status,assignee_email,labels\nImported,,CLOSED,roller@example.com,\n"
+    client.post("/issues/import", files={"file": ("issues.csv", csv_data, "text/csv")})
+
+    throughput, backlog = _today(client)
+    assert (throughput["created"], throughput["resolved"]) == (3, 2)
+    assert backlog == {"OPEN": 0, "IN_PROGRESS": 1, "RESOLVED": 1, "CLOSED": 1}
+
+    # Rebuilding from the event history gives the same numbers as the incremental upkeep.
+    rebuild_rollups(db_session)
+    assert _today(client) == (throughput, backlog)
+
+    client.delete(f"/issues/{second['id']}")
+    assert _today(client)[1]["IN_PROGRESS"] == 0
+
+
+def test_report_range_is_bounded(client):
+    too_long = client.get("/reports/throughput", params={"date_from": "2024-01-01", "date_to": "2025-12-31"})
+    assert too_long.status_code == 400
+    assert too_long.json()["error"]["code"] == "DATE_RANGE_TOO_LONG"
+    reversed_range = client.get("/reports/backlog", params={"date_from": "2025-02-01", "date_to": "2025-01-01"})
+    assert reversed_range.status_code == 400
+    assert len(client.get("/reports/throughput").json()["items"]) == 30
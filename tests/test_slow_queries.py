@@ -0,0 +1,45 @@
+import pytest
+
+from app.config import get_settings
+from app.observability.slow_queries import slow_query_log
+
+
+@pytest.fixture()
+def slow_log(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0.001)
+    monkeypatch.setattr(settings, "slow_query_explain_sample_rate", 1.0)
+    slow_query_log.wait_for_plans()
+    slow_query_log.clear()
+    yield slow_query_log
+    slow_query_log.clear()
+
+
+def test_admin_endpoint_requires_token(client, slow_log):
+    assert client.get("/admin/slow-queries").status_code == 403
+    response = client.get("/admin/slow-queries", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 403
+    assert response.json()["error"]["code"] == "ADMIN_TOKEN_REQUIRED"
+
+
+def test_slow_report_query_is_recorded_with_plan(client, slow_log):
+    assert client.get("/reports/latency").status_code == 200
+    slow_log.wait_for_plans(timeout=10)
+
+    response = client.get("/admin/slow-queries", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["recorded"] >= 1
+    report = next(item for item in body["items"] if "resolved_at" in item["statement"])
+    assert report["routes"] == ["/reports/latency"]
+    assert report["calls"] == 1
+    assert "actual time" in report["plan"]
+
+
+def test_writes_are_recorded_but_not_explained(client, slow_log):
+    client.post("/issues", json={"title": "Slow insert"})
+    slow_log.wait_for_plans(timeout=10)
+    inserts = [entry for entry in slow_log.entries() if entry.statement.startswith("INSERT INTO issues")]
+    assert inserts
+    assert all(entry.plan is None for entry in inserts)
@@ -0,0 +1,71 @@
+import pytest
+from fastapi import Request
+from sqlalchemy import text
+
+from app.config import get_settings
+from app.db import get_db, request_timeouts, set_timeouts
+from app.main import app
+
+
+@pytest.fixture()
+def timed_client(client, db_session):
+    # The shared fixture bypasses get_db; apply the same per-request timeouts to the test session.
+    def _override_get_db(request: Request):
+        set_timeouts(db_session, *request_timeouts(request))
+        yield db_session
+
+    app.dependency_overrides[get_db] = _override_get_db
+    return client
+
+
+@pytest.fixture()
+def locked_issues(db_session):
+    # Another transaction holding the table makes any query on it wait until a timeout fires.
+    with db_session.get_bind().engine.connect() as connection:
+        with connection.begin():
+            connection.exec_driver_sql("LOCK TABLE issues IN ACCESS EXCLUSIVE MODE")
+            yield
+
+
+def test_lock_timeout_returns_503(timed_client, locked_issues, monkeypatch):
+    monkeypatch.setattr(get_settings(), "lock_timeout_ms", 50)
+
+    response = timed_client.get("/issues")
+
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == "LOCK_TIMEOUT"
+    assert response.headers["retry-after"] == "1"
+
+
+def test_statement_timeout_returns_504(timed_client, locked_issues, monkeypatch):
+    monkeypatch.setattr(get_settings(), "reports_statement_timeout_ms", 50)
+    monkeypatch.setattr(get_settings(), "lock_timeout_ms", 0)
+
+    response = timed_client.get("/reports/top-assignees")
+
+    assert response.status_code == 504
+    assert response.json()["error"]["code"] == "QUERY_TIMEOUT"
+
+
+def test_import_gets_its_own_budget(timed_client, db_session):
+    response = timed_client.post("/issues/import", files={"file": ("issues.csv", "title\nImported\n", "text/csv")})
+    assert response.status_code == 200
+
+    assert db_session.scalar(text("SHOW statement_timeout")) == "10min"
+    assert db_session.scalar(text("SHOW lock_timeout")) == "10s"
+
+
+def test_archive_gets_the_bulk_budget(timed_client, db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "admin_token", "secret")
+    response = timed_client.post("/admin/archive", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+
+    assert db_session.scalar(text("SHOW statement_timeout")) == "2min"
+    assert db_session.scalar(text("SHOW lock_timeout")) == "10s"
+
+
+def test_limit_is_capped(client):
+    assert client.get("/issues", params={"limit": 101}).status_code == 422
+    assert client.get("/issues", params={"limit": 0}).status_code == 422
+    assert client.get("/reports/top-assignees", params={"limit": 1000}).status_code == 422
+    assert client.get("/issues", params={"limit": 100}).status_code == 200
@@ -0,0 +1,59 @@
+from sqlalchemy import event
+
+from app.crud import users as user_crud
+
+
+class _Statements:
+    def __init__(self, engine):
+        self.engine = engine
+        self.user_selects = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM users" in statement:
+            self.user_selects += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self)
+
+
+def test_user_checks_hit_the_database_once(client, db_session):
+    user = user_crud.create_user(db_session, "Ivy", "ivy@example.com")
+    db_session.commit()
+
+    with _Statements(db_session.get_bind().engine) as statements:
+        for idx in range(3):
+            response = client.post("/issues", json={"title": f"Cached {idx}", "assignee_id": user.id})
+            assert response.status_code == 201
+            issue_id = response.json()["id"]
+            comment = client.post(f"/issues/{issue_id}/comments", json={"body": "hi", "author_id": user.id})
+            assert comment.status_code == 201
+    assert statements.user_selects == 1
+
+    assert client.post("/issues", json={"title": "Nobody", "assignee_id": user.id + 1000}).status_code == 404
+
+
+def test_batch_lookups_mix_cached_and_missing_users(db_session):
+    ada = user_crud.create_user(db_session, "Ada", "ada@example.com")
+    bo = user_crud.create_user(db_session, "Bo", "bo@example.com")
+
+    by_id = user_crud.get_users_by_ids(db_session, [ada.id, ada.id, bo.id, 999_999])
+    assert set(by_id) == {ada.id, bo.id}
+    assert by_id[bo.id].email == "bo@example.com"
+
+    by_email = user_crud.get_users_by_emails(db_session, ["ada@example.com", "missing@example.com"])
+    assert list(by_email) == ["ada@example.com"]
+    assert by_email["ada@example.com"].id == ada.id
+
+
+def test_create_user_invalidates_cached_entries(db_session):
+    user = user_crud.create_user(db_session, "Cy", "cy@example.com")
+    assert user_crud.get_users_by_emails(db_session, ["cy@example.com"])["cy@example.com"].id == user.id
+
+    user.email = "cy.old@example.com"
+    db_session.flush()
+    replacement = user_crud.create_user(db_session, "Cy", "cy@example.com")
+    assert user_crud.get_users_by_emails(db_session, ["cy@example.com"])["cy@example.com"].id == replacement.id